@@ -0,0 +1,303 @@
+"""
+Many games' observations in one block of shared memory.
+
+`run_arena` plays games the way `batch.run_batched_pool` does, but the decisions never cross a pipe. An `Arena` is a
+`multiprocessing.shared_memory` block with a fixed-size record for every slot: a small header, the `batch.observe`
+encoding of the board in that slot, and its options as codes into `OPTION_VALUES`. Each worker process owns a slice of
+the slots and keeps a game running in each of them. On every step the workers write their records, the learner (the
+process which called `run_arena`) reads them where they lie and writes a choice into each, and the workers apply the
+choices. The two sides take turns at a `multiprocessing.Barrier`, so nothing is pickled until the finished games'
+`Outcome`s come back at the end.
+
+The agent is a `batch.BatchAgent`. The observations it's given are `memoryview`s into the block rather than lists;
+they index and iterate like lists, go straight into `numpy.array`, and are only valid during the call. With NumPy
+installed, `arena.observation_array()` is the whole table as one array, again without a copy.
+"""
+
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+
+from batch import ACTION_TYPES, ACTION_TYPE_INDEX, CARD_NAMES, MAX_PLAYERS, OBSERVATION_SIZE, Game, observe, option_set
+from simulate import Limits
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Every option a decision can offer: any card, by name, or a number (a player, or a direction for Rotate Hands).
+OPTION_VALUES = CARD_NAMES + tuple(range(-1, MAX_PLAYERS))
+OPTION_INDEX = {value: i for i, value in enumerate(OPTION_VALUES)}
+MAX_OPTIONS = len(OPTION_VALUES)
+NO_OPTION = -1
+# The fields of a slot's header. `choice` is the learner's answer, unless `multi` is set, in which case the answer is
+# every index marked in the slot's picks.
+HEADER = ('status', 'action_type', 'n_options', 'choice', 'multi')
+HEADER_INDEX = {name: i for i, name in enumerate(HEADER)}
+IDLE, WAITING = 0, 1
+ITEM_SIZE = array('i').itemsize
+
+
+class Arena:
+    def __init__(self, slots, name=None):
+        """
+        A shared block with room for `slots` boards. Made without a name, it creates a new block, which the maker must
+        `unlink` when it's done; made with the name of an existing one, it attaches to it.
+
+        The block is a run of C ints, laid out as four tables with one row per slot: the headers (`HEADER`), the
+        observations (`OBSERVATION_SIZE`), the options (`MAX_OPTIONS` codes into `OPTION_VALUES`, padded with
+        `NO_OPTION`), and the picks for decisions which take several options (`MAX_OPTIONS` flags).
+
+        :param slots: int
+        :param name: str or NoneType
+        """
+        self.slots = slots
+        self.widths = (len(HEADER), OBSERVATION_SIZE, MAX_OPTIONS, MAX_OPTIONS)
+        size = slots * sum(self.widths) * ITEM_SIZE
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.words = self.memory.buf[:size].cast('i')
+        self.offsets = []
+        offset = 0
+        for width in self.widths:
+            self.offsets.append(offset)
+            offset += slots * width
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def __getstate__(self):
+        # Sent to a worker by name, so that it attaches to the same block.
+        return self.slots, self.name
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def row(self, table, slot):
+        """
+        One slot's row of one of the tables, as a view into the block.
+
+        :param table: int 0 for the headers, 1 for the observations, 2 for the options and 3 for the picks.
+        :param slot: int
+        :return: memoryview
+        """
+        width = self.widths[table]
+        start = self.offsets[table] + slot * width
+        return self.words[start:start + width]
+
+    def get(self, slot, field):
+        return self.words[self.offsets[0] + slot * len(HEADER) + HEADER_INDEX[field]]
+
+    def set(self, slot, field, value):
+        self.words[self.offsets[0] + slot * len(HEADER) + HEADER_INDEX[field]] = value
+
+    def observation(self, slot):
+        """
+        :param slot: int
+        :return: memoryview
+        """
+        return self.row(1, slot)
+
+    def observation_array(self):
+        """
+        Every slot's observation as a `(slots, OBSERVATION_SIZE)` NumPy array sharing the block's memory. Rows of idle
+        slots hold whatever was there last.
+
+        :return: numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError('observation_array needs NumPy.')
+        return numpy.frombuffer(self.memory.buf, dtype=numpy.intc, count=self.slots * OBSERVATION_SIZE,
+                                offset=self.offsets[1] * ITEM_SIZE).reshape(self.slots, OBSERVATION_SIZE)
+
+    def post(self, slot, board):
+        """
+        Writes the decision a board is waiting on into a slot.
+
+        :param slot: int
+        :param board: Board
+        :return: NoneType
+        """
+        codes = [OPTION_INDEX[option] for option in option_set(board)]
+        self.row(1, slot)[:] = array('i', observe(board))
+        self.row(2, slot)[:] = array('i', codes + [NO_OPTION] * (MAX_OPTIONS - len(codes)))
+        self.set(slot, 'action_type', ACTION_TYPE_INDEX.get(board.action_type, -1))
+        self.set(slot, 'n_options', len(codes))
+        self.set(slot, 'status', WAITING)
+
+    def options(self, slot):
+        """
+        :param slot: int
+        :return: list[str or int] The slot's options, as `batch.option_set` gives them.
+        """
+        return [OPTION_VALUES[code] for code in self.row(2, slot)[:self.get(slot, 'n_options')]]
+
+    def action_type(self, slot):
+        return ACTION_TYPES[self.get(slot, 'action_type')]
+
+    def choose(self, slot, choice):
+        """
+        Writes the learner's answer for a slot.
+
+        :param slot: int
+        :param choice: int or list[int]
+        :return: NoneType
+        """
+        if isinstance(choice, (list, tuple)):
+            picks = [0] * MAX_OPTIONS
+            for i in choice:
+                picks[i] = 1
+            self.row(3, slot)[:] = array('i', picks)
+            self.set(slot, 'multi', 1)
+        else:
+            self.set(slot, 'choice', choice)
+            self.set(slot, 'multi', 0)
+
+    def choice(self, slot):
+        """
+        :param slot: int
+        :return: int or list[int]
+        """
+        if self.get(slot, 'multi'):
+            return [i for i, picked in enumerate(self.row(3, slot)) if picked]
+        return self.get(slot, 'choice')
+
+    def waiting(self, slots=None):
+        """
+        :param slots: iterable[int] or NoneType Defaults to every slot.
+        :return: list[int] The slots with a decision pending.
+        """
+        slots = range(self.slots) if slots is None else slots
+        return [slot for slot in slots if self.get(slot, 'status') == WAITING]
+
+    def close(self):
+        """
+        Lets go of the block. Every view handed out must have been dropped by now.
+
+        :return: NoneType
+        """
+        self.words.release()
+        try:
+            self.memory.close()
+        except BufferError:
+            # A view is still alive somewhere, in the traceback of an agent which raised, say. The mapping goes when
+            # the last of them does.
+            pass
+
+    def unlink(self):
+        self.memory.unlink()
+
+
+def _work(arena, slots, jobs, num_players, limits, barrier, results):
+    """
+    The worker side of `run_arena`: keeps a game going in each of `slots` until `jobs` runs out.
+
+    :param arena: Arena
+    :param slots: range
+    :param jobs: list[tuple[int, int]] (index, seed) pairs, played in order.
+    :param num_players: int
+    :param limits: simulate.Limits
+    :param barrier: multiprocessing.Barrier
+    :param results: multiprocessing.Queue Gets the list of (index, Outcome) pairs once every game is over.
+    :return: NoneType
+    """
+    pending = list(jobs)[::-1]
+    games = {}
+    outcomes = []
+
+    def fill(slot):
+        while True:
+            if slot not in games:
+                if not pending:
+                    arena.set(slot, 'status', IDLE)
+                    return
+                index, seed = pending.pop()
+                games[slot] = index, Game(num_players, seed, limits)
+            index, game = games[slot]
+            try:
+                arena.post(slot, game.board)
+                return
+            except Exception as e:
+                outcomes.append((index, game.outcome('crash', reason=f'{type(e).__name__}: {e}')))
+                del games[slot]
+
+    try:
+        while True:
+            for slot in slots:
+                fill(slot)
+            barrier.wait()
+            if not arena.waiting():
+                break
+            barrier.wait()
+            for slot in slots:
+                if slot in games:
+                    index, game = games[slot]
+                    outcome = game.step(arena.choice(slot))
+                    if outcome is not None:
+                        outcomes.append((index, outcome))
+                        del games[slot]
+        results.put(outcomes)
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        arena.close()
+
+
+def run_arena(agent, seeds, num_players, k=64, limits=None, processes=1):
+    """
+    Plays one game per seed on `processes` worker processes with `k` games in flight on each, deciding for all of them
+    at once in this process through shared memory. The seeds are dealt out to the workers in turn. For an agent whose
+    choices depend only on the board in front of it, every game comes out as it would from `batch.run_batched`.
+
+    :param agent: batch.BatchAgent
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param k: int Games in flight per worker.
+    :param limits: simulate.Limits or NoneType
+    :param processes: int
+    :return: list[simulate.Outcome] In the order of `seeds`.
+    """
+    seeds = list(seeds)
+    limits = limits if limits is not None else Limits()
+    jobs = list(enumerate(seeds))
+    arena = Arena(k * processes)
+    context = multiprocessing.get_context()
+    barrier = context.Barrier(processes + 1)
+    results = context.Queue()
+    workers = [context.Process(target=_work, args=(arena, range(p * k, (p + 1) * k), jobs[p::processes], num_players,
+                                                   limits, barrier, results), daemon=True)
+               for p in range(processes)]
+    try:
+        for worker in workers:
+            worker.start()
+        while True:
+            barrier.wait()
+            waiting = arena.waiting()
+            if not waiting:
+                break
+            try:
+                observations = [arena.observation(slot) for slot in waiting]
+                choices = agent.decide(observations, [arena.options(slot) for slot in waiting],
+                                       [arena.action_type(slot) for slot in waiting])
+                del observations
+                for slot, choice in zip(waiting, choices):
+                    arena.choose(slot, choice)
+            except BaseException:
+                barrier.abort()
+                raise
+            barrier.wait()
+        outcomes = [None] * len(seeds)
+        for _ in workers:
+            for index, outcome in results.get():
+                outcomes[index] = outcome
+        for worker in workers:
+            worker.join()
+        return outcomes
+    finally:
+        arena.close()
+        arena.unlink()
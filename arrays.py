@@ -0,0 +1,373 @@
+"""
+The game state as a handful of flat arrays.
+
+An `ArrayState` holds everything about a game in `array.array`s indexed by card id (see `objects.CARD_DEFS`): which
+kind of zone each card is in, whose zone it is, and where in that zone it sits, along with the board's counters, the
+per-player counters and the flags that the rules and actions keep on their cards. Copying one is a copy of a few short
+buffers, it goes to and from `bytes` in a single step, and a stack of them from many boards can be read straight into
+NumPy (`numpy.frombuffer(state.zones, dtype=numpy.int8)`) to evaluate them all at once.
+
+`ArrayBoard` is a `Board` which keeps the zone and owner of every card in two such arrays as the game goes, written by
+the board's 'move' events, so they can be read at any time without walking the zones. It plays exactly like a `Board`
+(and can be used anywhere one is, `engine.py` included), and can be cloned through its state::
+
+    state = ArrayState.capture(board)
+    copy = state.restore()
+
+A restored board is in the same position as the one it was captured from and plays on from there by the same rules,
+but it doesn't play the same game. The hands, keeps and rules are Python sets, and the order a set lists its cards in
+depends on everything that was ever added to it and taken out, which the arrays don't record. A restored set is
+filled in slot order, which needn't give back the order the original listed its cards in, and the two drift further
+apart as the game goes on. Whatever the engine does in set order, such as picking a card at random from a hand,
+listing the options or discarding a hand, can then come out differently. A clone is right for evaluating a position,
+not for replaying the game that follows it.
+"""
+
+import random
+import struct
+from array import array
+
+from objects import Board, CARD_DEFS, Decision, Hand, Limit
+
+# The kinds of zone, by `zone.location`. NOWHERE is a card in flight, such as one which is being played.
+DECK, TRASH, HAND, ASIDE, KEEP, RULES, GOALS, NOWHERE = range(8)
+ZONE_CODES = {'deck': DECK, 'trash': TRASH, 'hand': HAND, 'aside': ASIDE, 'keep': KEEP, 'rules': RULES,
+              'goals': GOALS}
+DECISIONS = tuple(Decision)
+DECISION_INDEX = {decision: i for i, decision in enumerate(DECISIONS)}
+
+# Stands in for None in the integer arrays, and for a flag a card hasn't been given yet.
+NONE = -2 ** 63
+ABSENT = NONE + 1
+
+COUNTERS = ('num_players', 'exceptions', 'turn_num', 'player_state', 'cards_played', 'cards_drawn',
+            'temp_cards_played', 'numeral', 'free_turn', 'action_type', 'limit_state', 'max_goals', 'winner',
+            'winning_goal', 'mysteryplay', 'exchange_player', 'exchange_card')
+COUNTER_INDEX = {name: i for i, name in enumerate(COUNTERS)}
+# The attributes that cards change during a game. Each card has one entry for each of these in `ArrayState.flags`.
+FLAGS = ('stale', 'used', 'last', 'last_num', 'last_used', 'player', 'waiting', 'special')
+BOOL_FLAGS = {'stale', 'used', 'waiting', 'special'}
+SPECIAL = FLAGS.index('special')
+# The arrays that make up an `ArrayState`, in the order they're written out by `ArrayState.tobytes`, with their types.
+FIELDS = (('zones', 'b'), ('owners', 'b'), ('slots', 'h'), ('counters', 'q'), ('players', 'q'),
+          ('draw_bonuses', 'q'), ('play_bonuses', 'q'), ('temphands', 'q'), ('flags', 'q'), ('rng', 'I'))
+HEADER = struct.Struct(f'<{len(FIELDS)}I')
+
+
+def encode(value):
+    """
+    :param value: int, bool, Card or NoneType
+    :return: int
+    """
+    if value is None:
+        return NONE
+    return getattr(value, 'id', value) + 0
+
+
+def card_flags(kind):
+    """
+    The flags that a kind of card can have, which for most cards is none of them.
+
+    :param kind: type
+    :return: tuple[tuple[int, str]] The index of each flag in `FLAGS`, and its name.
+    """
+    return tuple((i, name) for i, name in enumerate(FLAGS) if i != SPECIAL and hasattr(kind, name))
+
+
+# The cards which can have flags, by id, with the flags each can have.
+FLAGGED = tuple((definition.id, card_flags(definition.kind)) for definition in CARD_DEFS if card_flags(definition.kind))
+
+
+def decode(value):
+    """
+    :param value: int
+    :return: int or NoneType
+    """
+    return None if value == NONE else value
+
+
+class ArrayState:
+    __slots__ = tuple(name for name, _ in FIELDS)
+
+    def __init__(self, **fields):
+        """
+        A whole game as flat arrays. Build one with `ArrayState.capture` or `ArrayState.frombytes` rather than directly.
+
+        :zones: The kind of zone each card is in, as one of the zone codes (DECK, TRASH, ...).
+        :owners: The player whose hand or keep each card is in, or how far up the stack of temp hands for a card set
+                 aside. -1 for everything else.
+        :slots: Where each card comes in its zone, counting from 0, or -1 for a card in flight.
+        :counters: The board's counters, in `COUNTERS` order. Cards are given by id.
+        :players: Each player's bonus plays.
+        :draw_bonuses: `board.draw_bonuses`.
+        :play_bonuses: `board.play_bonuses`.
+        :temphands: A decision (as an index into `DECISIONS`) and a count of cards played for every temp hand, from
+                    the bottom of the stack up.
+        :flags: `len(FLAGS)` entries for each card, in card id order.
+        :rng: The state of the board's Mersenne Twister, or nothing for a board which uses the random module.
+
+        :param fields: array.array
+        """
+        for name, _ in FIELDS:
+            setattr(self, name, fields[name])
+
+    @classmethod
+    def capture(cls, board):
+        """
+        Reads the state of a board.
+
+        :param board: Board
+        :return: ArrayState
+        """
+        n = len(CARD_DEFS)
+        zones = array('b', [NOWHERE]) * n
+        owners = array('b', [-1]) * n
+        slots = array('h', [-1]) * n
+        places = [(board.deck, DECK, -1), (board.trash, TRASH, -1), (board.rules, RULES, -1), (board.goals, GOALS, -1)]
+        places += [(hand, HAND, hand.player_num) for hand in board.hands]
+        places += [(keep, KEEP, keep.player_num) for keep in board.keeps]
+        places += [(hand, ASIDE, depth) for depth, hand in enumerate(board.temphands)]
+        for zone, code, owner in places:
+            for slot, card in enumerate(zone.cards):
+                card_id = card.id
+                zones[card_id] = code
+                owners[card_id] = owner
+                slots[card_id] = slot
+        exchange = board.exchange_space or (None, None)
+        values = {'num_players': board.num_players, 'exceptions': board.exceptions, 'turn_num': board.turn_num,
+                  'player_state': board.player_state, 'cards_played': board.cards_played,
+                  'cards_drawn': board.cards_drawn, 'temp_cards_played': board.temp_cards_played,
+                  'numeral': board.numeral, 'free_turn': board.free_turn,
+                  'action_type': DECISION_INDEX[board.action_type], 'limit_state': board.limit_state,
+                  'max_goals': board.goals.max_size, 'winner': board.winner, 'winning_goal': board.winning_goal,
+                  'mysteryplay': board.mysteryplay, 'exchange_player': exchange[0], 'exchange_card': exchange[1]}
+        width = len(FLAGS)
+        flags = array('q', [ABSENT]) * (n * width)
+        flags[SPECIAL::width] = array('q', [0]) * n
+        for card in board.special_actions:
+            flags[card.id * width + SPECIAL] = 1
+        table = board.card_table
+        for card_id, names in FLAGGED:
+            card = table[card_id]
+            base = card_id * width
+            for i, name in names:
+                value = getattr(card, name, ABSENT)
+                if value is not ABSENT:
+                    flags[base + i] = encode(value)
+        temphands = array('q')
+        for hand in board.temphands:
+            temphands.append(NONE if hand.decision is None else DECISION_INDEX[hand.decision])
+            temphands.append(hand.cards_played)
+        rng = array('I', board.rng.getstate()[1]) if isinstance(board.rng, random.Random) else array('I')
+        return cls(zones=zones, owners=owners, slots=slots,
+                   counters=array('q', [encode(values[name]) for name in COUNTERS]),
+                   players=array('q', board.bonus_plays), draw_bonuses=array('q', board.draw_bonuses),
+                   play_bonuses=array('q', board.play_bonuses), temphands=temphands, flags=flags, rng=rng)
+
+    def counter(self, name):
+        """
+        :param name: str One of `COUNTERS`.
+        :return: int or NoneType
+        """
+        return decode(self.counters[COUNTER_INDEX[name]])
+
+    def restore(self, cls=None):
+        """
+        Builds a board in this state.
+
+        :param cls: type or NoneType The kind of board to build, `ArrayBoard` by default.
+        :return: Board
+        """
+        cls = cls if cls is not None else ArrayBoard
+        counter = self.counter
+        board = cls(counter('num_players'), exceptions=bool(counter('exceptions')), seed=0)
+        if self.rng:
+            board.rng.setstate((3, tuple(self.rng), None))
+        else:
+            board.rng = random
+        table = board.card_table
+        for depth in range(len(self.temphands) // 2):
+            hand = Hand.temphand(0, board)
+            decision = decode(self.temphands[2 * depth])
+            hand.decision = None if decision is None else DECISIONS[decision]
+            hand.cards_played = self.temphands[2 * depth + 1]
+            board.temphands.append(hand)
+        # The zones are filled straight from the arrays, in slot order, without a move being published for any card;
+        # the trackers count everything again once it's all in place. The rules go in last and one at a time, as they
+        # have to subscribe to the board's events.
+        zones, owners, slots = self.zones, self.owners, self.slots
+        for zone in [board.deck, board.trash, board.goals] + board.hands + board.keeps:
+            zone.cards = type(zone.cards)()
+        locations = [None] * len(table)
+        places = {}
+        rules = []
+        for card_id in sorted(range(len(table)), key=lambda i: (zones[i], owners[i], slots[i])):
+            code = zones[card_id]
+            if code == RULES:
+                rules.append(table[card_id])
+            elif code != NOWHERE:
+                place = code, owners[card_id]
+                if place not in places:
+                    places[place] = self.zone(board, *place)
+                zone = places[place]
+                if isinstance(zone.cards, list):
+                    zone.cards.append(table[card_id])
+                else:
+                    zone.cards.add(table[card_id])
+                locations[card_id] = zone
+        board.locations = locations
+        for rule in rules:
+            board.rules.put(rule)
+        board.goal_tracker.recount()
+        if isinstance(board, ArrayBoard):
+            board.zone_codes = array('b', zones)
+            board.owners = array('b', (-1 if code == ASIDE else owner for code, owner in zip(zones, owners)))
+        for name in ('turn_num', 'player_state', 'cards_played', 'cards_drawn', 'temp_cards_played', 'numeral',
+                     'limit_state', 'winner'):
+            setattr(board, name, counter(name))
+        board.free_turn = bool(counter('free_turn'))
+        board.action_type = DECISIONS[counter('action_type')]
+        board.goals.max_size = counter('max_goals')
+        board.winning_goal = self.card(board, counter('winning_goal'))
+        board.mysteryplay = self.card(board, counter('mysteryplay'))
+        if counter('exchange_player') is None:
+            board.exchange_space = None
+        else:
+            board.exchange_space = counter('exchange_player'), self.card(board, counter('exchange_card'))
+        board.bonus_plays = list(self.players)
+        board.draw_bonuses = list(self.draw_bonuses)
+        board.play_bonuses = list(self.play_bonuses)
+        width = len(FLAGS)
+        flags = self.flags
+        board.special_actions = {table[card_id] for card_id, special in enumerate(flags[SPECIAL::width]) if special}
+        for card_id, names in FLAGGED:
+            card = table[card_id]
+            base = card_id * width
+            for i, name in names:
+                value = flags[base + i]
+                if value == ABSENT:
+                    if hasattr(card, name):
+                        delattr(card, name)
+                else:
+                    value = decode(value)
+                    setattr(card, name, bool(value) if name in BOOL_FLAGS and value is not None else value)
+        for rule in board.rules:
+            if isinstance(rule, Limit):
+                board.limit_tracker.add(rule)
+        return board
+
+    @staticmethod
+    def zone(board, code, owner):
+        """
+        The zone of `board` that a zone code and owner stand for.
+
+        :param board: Board
+        :param code: int
+        :param owner: int
+        :return: Deck, Hand or CardSpace
+        """
+        if code == HAND:
+            return board.hands[owner]
+        if code == KEEP:
+            return board.keeps[owner]
+        if code == ASIDE:
+            return board.temphands[owner]
+        return {DECK: board.deck, TRASH: board.trash, RULES: board.rules, GOALS: board.goals}[code]
+
+    @staticmethod
+    def card(board, card_id):
+        return None if card_id is None else board.card_table[card_id]
+
+    def copy(self):
+        """
+        :return: ArrayState
+        """
+        return ArrayState(**{name: array(typecode, getattr(self, name)) for name, typecode in FIELDS})
+
+    def tobytes(self):
+        """
+        The state as a single buffer: a header giving the length of every array, then the arrays themselves in
+        `FIELDS` order. The arrays are written in the machine's own byte order.
+
+        :return: bytes
+        """
+        arrays = [getattr(self, name) for name, _ in FIELDS]
+        return HEADER.pack(*(len(values) for values in arrays)) + b''.join(values.tobytes() for values in arrays)
+
+    @classmethod
+    def frombytes(cls, data):
+        """
+        Reads a state written by `ArrayState.tobytes`.
+
+        :param data: bytes or memoryview
+        :return: ArrayState
+        """
+        lengths = HEADER.unpack_from(data)
+        offset = HEADER.size
+        fields = {}
+        for (name, typecode), length in zip(FIELDS, lengths):
+            values = array(typecode)
+            end = offset + length * values.itemsize
+            values.frombytes(data[offset:end])
+            fields[name] = values
+            offset = end
+        return cls(**fields)
+
+    def __eq__(self, other):
+        return isinstance(other, ArrayState) and all(getattr(self, name) == getattr(other, name) for name, _ in FIELDS)
+
+    def __repr__(self):
+        return f'ArrayState({self.counter("num_players")} players, turn {self.counter("turn_num")})'
+
+
+class ArrayBoard(Board):
+    def __init__(self, num_players: int, exceptions: bool = True, seed: int = None):
+        """
+        A `Board` which also keeps the zone code and owner of every card, by card id, in `zone_codes` and `owners`.
+        Every move writes one entry of each.
+
+        :param num_players: int
+        :param exceptions: bool
+        :param seed: int
+        """
+        super(ArrayBoard, self).__init__(num_players, exceptions=exceptions, seed=seed)
+        self.zone_codes = array('b', [NOWHERE]) * len(CARD_DEFS)
+        self.owners = array('b', [-1]) * len(CARD_DEFS)
+        # The deck is laid out before anything can hear about it, so the arrays start from a full read of the table.
+        for card_id, zone in enumerate(self.locations):
+            if zone is not None:
+                self.zone_codes[card_id] = ZONE_CODES[zone.location]
+                self.owners[card_id] = max(-1, getattr(zone, 'player_num', -1))
+        self.subscribe('move', self.moved)
+
+    def moved(self, card, source, destination):
+        """
+        :param card: Card
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
+        :return: NoneType
+        """
+        card_id = card.id
+        if destination is None:
+            self.zone_codes[card_id] = NOWHERE
+            self.owners[card_id] = -1
+        else:
+            self.zone_codes[card_id] = ZONE_CODES[destination.location]
+            player_num = getattr(destination, 'player_num', -1)
+            self.owners[card_id] = player_num if player_num >= 0 else -1
+
+    @property
+    def state(self):
+        """
+        :return: ArrayState
+        """
+        return ArrayState.capture(self)
+
+    def clone(self):
+        """
+        A new board in the same position as this one, copied through its `state`. It won't necessarily play on as this
+        board would: see the module's notes on restored boards.
+
+        :return: ArrayBoard
+        """
+        return self.state.restore(type(self))
@@ -0,0 +1,220 @@
+"""
+Batched decisions for playing many games at once.
+
+A `BatchAgent` is asked for decisions in bulk: it gets a list of observations and the matching list of option sets,
+one for every board that is waiting on it, and returns one choice for each. `run_batched` keeps `k` games in flight on a
+single worker, gathers every pending decision into one call to the agent, applies the choices, and starts a new game as
+soon as one finishes. An agent which evaluates a model once per call (a NumPy policy, say) pays for that evaluation
+once per batch rather than once per `Board.action()`.
+
+Observations are fixed-length lists of ints (see `observe`), so a batch of them can go straight into `numpy.array`.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from multiprocessing import Pool
+
+from assets import keepers, goals, rules, actions
+from objects import Board, Decision, MULTI_SELECT
+from simulate import Limits, Outcome, Watchdog
+
+CARD_NAMES = tuple(sorted(keepers) + sorted(goals) + sorted(name for cat in rules.values() for name in cat) +
+                   sorted(actions))
+CARD_INDEX = {name: i for i, name in enumerate(CARD_NAMES)}
+ACTION_TYPES = tuple(decision.value for decision in Decision)
+ACTION_TYPE_INDEX = {name: i for i, name in enumerate(ACTION_TYPES)}
+MAX_PLAYERS = 6
+
+# Where a card is, as seen by the player who has to decide. Keeps of the other players follow OTHER_KEEP in seat order
+# counting onwards from the decider.
+HIDDEN, OWN_HAND, OWN_KEEP, RULES, GOALS, DISCARD, ASIDE, OTHER_KEEP = range(8)
+OBSERVATION_SIZE = len(CARD_NAMES) + 5 + 2 * MAX_PLAYERS
+
+
+def observe(board):
+    """
+    Encodes what the deciding player can see as a list of `OBSERVATION_SIZE` ints: the location code of every card in
+    `CARD_NAMES` order, then the `action_type` (as an index into `ACTION_TYPES`), the draw rule, the play rule, the
+    cards played so far this turn, the number of players, and the hand and keep sizes of every seat counting onwards
+    from the decider, padded with zeros to `MAX_PLAYERS` seats.
+
+    :param board: Board
+    :return: list[int]
+    """
+    me = board.active_player
+    n = board.num_players
+    locations = [HIDDEN] * len(CARD_NAMES)
+    for card in board.hands[me]:
+        locations[CARD_INDEX[card.name]] = OWN_HAND
+    for keep in board.keeps:
+        code = OWN_KEEP if keep.player_num == me else OTHER_KEEP + (keep.player_num - me) % n - 1
+        for card in keep:
+            locations[CARD_INDEX[card.name]] = code
+    for space, code in ((board.rules, RULES), (board.goals, GOALS), (board.trash, DISCARD)):
+        for card in space:
+            locations[CARD_INDEX[card.name]] = code
+    if board.action_type in ('play2', 'everybody1'):
+        for card in board.temphands[-1]:
+            locations[CARD_INDEX[card.name]] = ASIDE
+    hand_sizes = [len(board.hands[(me + i) % n]) for i in range(n)] + [0] * (MAX_PLAYERS - n)
+    keep_sizes = [len(board.keeps[(me + i) % n]) for i in range(n)] + [0] * (MAX_PLAYERS - n)
+    return (locations + [ACTION_TYPE_INDEX.get(board.action_type, -1), board.draw_state, board.play_state,
+                         board.cards_played, n] + hand_sizes + keep_sizes)
+
+
+def option_set(board):
+    """
+    The options open to the deciding player, with cards given by name. A choice is an index into this list (or, for
+    the decisions in `objects.MULTI_SELECT`, a list of indexes), exactly as for `board.action()`.
+
+    :param board: Board
+    :return: list[str or int]
+    """
+    options = board.options
+    if options is None:
+        return []
+    return [getattr(option, 'name', option) for option in options]
+
+
+class BatchAgent(ABC):
+    """
+    The interface for agents which decide for many boards at once. Subclasses implement `decide`.
+    """
+
+    @abstractmethod
+    def decide(self, observations, option_sets, action_types):
+        """
+        Chooses an option on every board in the batch.
+
+        :param observations: list[list[int]] One `observe` encoding per board.
+        :param option_sets: list[list[str or int]] One `option_set` per board.
+        :param action_types: list[str] The kind of decision each board is waiting on.
+        :return: list[int or list[int]] One choice per board.
+        """
+
+
+class RandomBatchAgent(BatchAgent):
+    def __init__(self, seed=None):
+        """
+        Chooses uniformly at random on every board, with its own random number generator.
+
+        :param seed: int or NoneType
+        """
+        self.rng = random.Random(seed)
+
+    def decide(self, observations, option_sets, action_types):
+        choices = []
+        for options, action_type in zip(option_sets, action_types):
+            if action_type in MULTI_SELECT and action_type != 'everybody1':
+                choices.append([i for i in range(len(options)) if self.rng.random() < 0.5])
+            elif options:
+                choices.append(self.rng.randrange(len(options)))
+            else:
+                choices.append(0)
+        return choices
+
+
+class Game:
+    def __init__(self, num_players, seed, limits):
+        """
+        A game in flight inside `run_batched`.
+
+        :param num_players: int
+        :param seed: int
+        :param limits: simulate.Limits
+        """
+        self.seed = seed
+        self.board = Board(num_players, exceptions=False, seed=seed)
+        self.watchdog = Watchdog(self.board, limits)
+
+    def outcome(self, result, **kwargs):
+        return Outcome(result, self.board.num_players, self.seed, turns=self.board.turn_num,
+                       actions=self.watchdog.actions, seconds=self.watchdog.seconds, **kwargs)
+
+    def step(self, choice):
+        """
+        Applies a choice. Gives the game's `Outcome` if that finished it.
+
+        :param choice: int or list[int]
+        :return: simulate.Outcome or NoneType
+        """
+        try:
+            result = self.board.action(choice)
+        except Exception as e:
+            return self.outcome('crash', reason=f'{type(e).__name__}: {e}')
+        if result.won:
+            self.watchdog.actions += 1
+            return self.outcome('win', winner=result.winner, goal=self.board.winning_goal.name)
+        reason = self.watchdog.check(result.ok)
+        if reason is not None:
+            return self.outcome('noresult', reason=reason)
+        return None
+
+
+def run_batched(agent, seeds, num_players, k=64, limits=None):
+    """
+    Plays one game per seed with up to `k` of them in flight at once, asking `agent` for all their decisions together.
+    Every board has its own random number generator seeded from its seed, so a game comes out the same whatever else
+    is in flight alongside it.
+
+    :param agent: BatchAgent
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param k: int
+    :param limits: simulate.Limits or NoneType
+    :return: list[simulate.Outcome] In the order of `seeds`.
+    """
+    limits = limits if limits is not None else Limits()
+    pending = list(enumerate(seeds))[::-1]
+    outcomes = [None] * len(pending)
+    live = []
+    while pending or live:
+        while pending and len(live) < k:
+            index, seed = pending.pop()
+            live.append((index, Game(num_players, seed, limits)))
+        decisions = []
+        for index, game in live:
+            try:
+                decisions.append((observe(game.board), option_set(game.board), game.board.action_type))
+            except Exception as e:
+                decisions.append(e)
+        ready = [(entry, decision) for entry, decision in zip(live, decisions) if not isinstance(decision, Exception)]
+        for (index, game), decision in zip(live, decisions):
+            if isinstance(decision, Exception):
+                outcomes[index] = game.outcome('crash', reason=f'{type(decision).__name__}: {decision}')
+        choices = agent.decide(*zip(*[decision for _, decision in ready])) if ready else []
+        live = []
+        for ((index, game), _), choice in zip(ready, choices):
+            outcome = game.step(choice)
+            if outcome is None:
+                live.append((index, game))
+            else:
+                outcomes[index] = outcome
+    return outcomes
+
+
+def _run_chunk(args):
+    agent, seeds, num_players, k, limits = args
+    return run_batched(agent, seeds, num_players, k, limits)
+
+
+def run_batched_pool(agent, seeds, num_players, k=64, limits=None, processes=1):
+    """
+    Splits the seeds evenly over a process pool and runs `run_batched` on each share. The agent is pickled into every
+    worker.
+
+    :param agent: BatchAgent
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param k: int Games in flight per worker.
+    :param limits: simulate.Limits or NoneType
+    :param processes: int
+    :return: list[simulate.Outcome] In the order of `seeds`.
+    """
+    seeds = list(seeds)
+    if processes == 1:
+        return run_batched(agent, seeds, num_players, k, limits)
+    size = -(-len(seeds) // processes)
+    jobs = [(agent, seeds[i:i + size], num_players, k, limits) for i in range(0, len(seeds), size)]
+    with Pool(processes) as pool:
+        return [outcome for chunk in pool.map(_run_chunk, jobs) for outcome in chunk]
@@ -0,0 +1,19 @@
+"""
+Repeatable benchmarks for the hot paths of the game engine.
+
+Every benchmark is seeded, so two runs on the same machine exercise exactly the same game states. The micro benchmarks
+time single calls into `objects.py` (building a `Board`, drawing, membership tests, `Board.options`, the goal and rule
+checks, and `Board.action` for each `action_type`), the macro benchmark plays whole games between random agents, and the memory
+benchmarks report the bytes held by each `Board`.
+
+Run it from the root of the repository with::
+
+    python -m benchmarks --out results.json
+    python -m benchmarks --compare results.json
+
+The second form reruns the suite and flags every benchmark which got slower than the stored baseline by more than the
+threshold.
+"""
+
+from benchmarks.harness import Benchmark, MemoryBenchmark, run_benchmarks, compare, load_results, save_results, registry
+from benchmarks import micro, macro, memory
@@ -0,0 +1,58 @@
+"""
+Command line interface for the benchmark suite. Run `python -m benchmarks --help` from the repository root.
+"""
+
+import argparse
+import os
+import sys
+
+# Cards hash on their names, so the order in which a set lists them, and with it what a seeded run does, depends on the
+# hash seed. The CLI always runs with this one.
+HASH_SEED = '0'
+
+
+def pin_hash_seed():
+    """
+    Starts the benchmarks over in a new interpreter with `PYTHONHASHSEED` set to `HASH_SEED`, unless it already is.
+
+    :return: NoneType
+    """
+    if os.environ.get('PYTHONHASHSEED') != HASH_SEED:
+        os.environ['PYTHONHASHSEED'] = HASH_SEED
+        os.execv(sys.executable, [sys.executable, '-m', 'benchmarks'] + sys.argv[1:])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks for the Fluxx engine.')
+    parser.add_argument('--out', help='Write the results to this JSON file.')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare the results against a stored JSON baseline.')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative slowdown that counts as a regression (default 0.10).')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help='Rounds per benchmark; the median and best rounds are reported.')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiplies the number of states per round.')
+    parser.add_argument('-k', '--select', action='append', help='Only run benchmarks whose name contains this.')
+    args = parser.parse_args(argv)
+
+    from benchmarks import run_benchmarks, save_results, load_results, compare
+
+    results = run_benchmarks(seed=args.seed, repeat=args.repeat, select=args.select, scale=args.scale,
+                             stream=sys.stdout)
+    if args.out:
+        save_results(results, args.out)
+    if args.compare:
+        rows = compare(load_results(args.compare), results, args.threshold)
+        print()
+        for name, verdict, ratio in rows:
+            if verdict == 'missing' and args.select:
+                continue
+            ratio = '' if ratio is None else f'{ratio:.3f}x'
+            print(f'{name:<40} {verdict:<12} {ratio}')
+        if any(verdict == 'regression' for _, verdict, _ in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    pin_hash_seed()
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+The timing, storage and comparison machinery shared by the micro and macro benchmarks.
+"""
+
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+registry = {}
+
+
+class Benchmark:
+    def __init__(self, name, prepare, number=200, inner=1, group='micro'):
+        """
+        A single named benchmark. `prepare` is called with a seed and must return a callable which performs the
+        operation being measured. Preparation is never timed, so a benchmark which mutates the game can build a fresh
+        state for every call.
+
+        :param name: str
+        :param prepare: function(int) -> function
+        :param number: int How many prepared states are timed in each round.
+        :param inner: int How many times the operation is repeated on each prepared state. Only use values above 1 for
+                      operations which don't change the game.
+        :param group: str Either 'micro' or 'macro'.
+        """
+        self.name = name
+        self.prepare = prepare
+        self.number = number
+        self.inner = inner
+        self.group = group
+
+    def run(self, seed, repeat):
+        """
+        Times the benchmark. Each round reseeds the random module, so every round sees the same sequence of states.
+        If the operation returns a dict of counts, the counts are summed and stored alongside the timings.
+
+        :param seed: int
+        :param repeat: int The number of rounds.
+        :return: dict
+        """
+        rounds = []
+        extra = Counter()
+        timer = time.perf_counter_ns
+        collecting = gc.isenabled()
+        try:
+            gc.disable()
+            for _ in range(repeat):
+                rounds.append(self._round(seed, timer, extra))
+        except Exception as e:
+            return {'group': self.group, 'error': f'{type(e).__name__}: {e}'}
+        finally:
+            if collecting:
+                gc.enable()
+        result = {'group': self.group, 'ns_per_op': statistics.median(rounds), 'min_ns_per_op': min(rounds),
+                  'max_ns_per_op': max(rounds), 'number': self.number, 'inner': self.inner, 'repeat': repeat}
+        if extra:
+            result['counts'] = dict(extra)
+        return result
+
+    def _round(self, seed, timer, extra):
+        """
+        Times one round, with the garbage collector switched off, and returns the mean time per operation.
+
+        :param seed: int
+        :param timer: function
+        :param extra: Counter Collects the counts returned by the operation.
+        :return: float
+        """
+        gc.collect()
+        random.seed(seed)
+        extra.clear()
+        elapsed = 0
+        for i in range(self.number):
+            op = self.prepare(seed + i)
+            start = timer()
+            for _ in range(self.inner):
+                out = op()
+            elapsed += timer() - start
+            if isinstance(out, dict):
+                extra.update(out)
+        return elapsed / (self.number * self.inner)
+
+
+class MemoryBenchmark(Benchmark):
+    def __init__(self, name, prepare, number=50, group='memory'):
+        """
+        A benchmark of memory rather than time. `prepare` is called with a seed and must return a callable which builds
+        the object being measured. Every object built in a round is kept alive until the end of the round, and the
+        round reports how many bytes the Python allocator is holding for each of them.
+
+        :param name: str
+        :param prepare: function(int) -> function
+        :param number: int How many objects are built in each round.
+        :param group: str
+        """
+        super(MemoryBenchmark, self).__init__(name, prepare, number=number, group=group)
+
+    def run(self, seed, repeat):
+        """
+        Measures the benchmark with `tracemalloc`. One object is built and thrown away first, so that anything cached
+        on first use isn't charged to the objects.
+
+        :param seed: int
+        :param repeat: int The number of rounds.
+        :return: dict
+        """
+        tracing = tracemalloc.is_tracing()
+        try:
+            self.prepare(seed)()
+            if not tracing:
+                tracemalloc.start()
+            rounds = [self._measure(seed) for _ in range(repeat)]
+        except Exception as e:
+            return {'group': self.group, 'error': f'{type(e).__name__}: {e}'}
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+        return {'group': self.group, 'bytes_per_op': statistics.median(rounds), 'min_bytes_per_op': min(rounds),
+                'max_bytes_per_op': max(rounds), 'number': self.number, 'repeat': repeat}
+
+    def _measure(self, seed):
+        """
+        Builds one round of objects and gives the mean number of bytes held by each.
+
+        :param seed: int
+        :return: float
+        """
+        random.seed(seed)
+        builders = [self.prepare(seed + i) for i in range(self.number)]
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [build() for build in builders]
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0] - before
+        del kept
+        return held / self.number
+
+
+def benchmark(name, number=200, inner=1, group='micro'):
+    """
+    Decorator which registers a prepare function as a `Benchmark`.
+
+    :param name: str
+    :param number: int
+    :param inner: int
+    :param group: str
+    :return: function
+    """
+
+    def register(prepare):
+        registry[name] = Benchmark(name, prepare, number=number, inner=inner, group=group)
+        return prepare
+
+    return register
+
+
+def memory_benchmark(name, number=50, group='memory'):
+    """
+    Decorator which registers a prepare function as a `MemoryBenchmark`.
+
+    :param name: str
+    :param number: int
+    :param group: str
+    :return: function
+    """
+
+    def register(prepare):
+        registry[name] = MemoryBenchmark(name, prepare, number=number, group=group)
+        return prepare
+
+    return register
+
+
+def run_benchmarks(seed=0, repeat=5, select=None, scale=1.0, stream=None):
+    """
+    Runs every registered benchmark whose name contains one of the strings in `select`.
+
+    :param seed: int
+    :param repeat: int
+    :param select: list[str] or NoneType
+    :param scale: float Multiplies the number of states timed by each benchmark. Useful for quick smoke runs.
+    :param stream: file or NoneType Progress is written here if given.
+    :return: dict
+    """
+    results = {}
+    for name, bench in registry.items():
+        if select and not any(s in name for s in select):
+            continue
+        original = bench.number
+        bench.number = max(1, int(original * scale))
+        try:
+            results[name] = bench.run(seed, repeat)
+        finally:
+            bench.number = original
+        if stream is not None:
+            print(format_line(name, results[name]), file=stream)
+    return {'meta': {'python': sys.version.split()[0], 'implementation': platform.python_implementation(),
+                     'platform': platform.platform(), 'seed': seed, 'repeat': repeat, 'scale': scale,
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'benchmarks': results}
+
+
+def format_line(name, result):
+    """
+    A one-line human readable summary of a single result.
+
+    :param name: str
+    :param result: dict
+    :return: str
+    """
+    if 'error' in result:
+        return f'{name:<40} ERROR {result["error"]}'
+    if 'bytes_per_op' in result:
+        return f'{name:<40} {result["bytes_per_op"]:>12.0f} bytes/op  (min {result["min_bytes_per_op"]:.0f})'
+    return f'{name:<40} {result["ns_per_op"] / 1000:>12.2f} us/op  (min {result["min_ns_per_op"] / 1000:.2f})'
+
+
+def save_results(results, path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Compares two result sets. A benchmark is a regression if its best round (the time taken, or for a memory benchmark
+    the bytes held) grew by more than `threshold` (as a fraction of the baseline), and an improvement if it shrank by
+    more than that. Benchmarks which newly fail are always regressions.
+
+    :param baseline: dict
+    :param current: dict
+    :param threshold: float
+    :return: list[tuple[str, str, float or NoneType]] Tuples of (name, verdict, ratio of current to baseline).
+    """
+    rows = []
+    old_results = baseline['benchmarks']
+    for name, new in current['benchmarks'].items():
+        old = old_results.get(name)
+        if old is None:
+            rows.append((name, 'new', None))
+        elif 'error' in new:
+            rows.append((name, 'error' if 'error' in old else 'regression', None))
+        elif 'error' in old:
+            rows.append((name, 'fixed', None))
+        else:
+            key = 'min_bytes_per_op' if 'min_bytes_per_op' in new else 'min_ns_per_op'
+            ratio = new[key] / old[key]
+            if ratio > 1 + threshold:
+                verdict = 'regression'
+            elif ratio < 1 - threshold:
+                verdict = 'improvement'
+            else:
+                verdict = 'same'
+            rows.append((name, verdict, ratio))
+    for name in old_results:
+        if name not in current['benchmarks']:
+            rows.append((name, 'missing', None))
+    return rows
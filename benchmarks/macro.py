@@ -0,0 +1,39 @@
+"""
+Macro benchmarks. Plays whole seeded games between random agents and times them end to end.
+
+Games are played through `simulate.play_game`, so a crash is recorded and counted rather than aborting the benchmark,
+should a change to the engine bring one back. Games which go on for longer than `MAX_ACTIONS` decisions are stopped and
+counted as capped.
+"""
+
+import random
+
+from benchmarks.harness import benchmark
+from simulate import Limits, play_game
+
+MAX_ACTIONS = 1000
+LIMITS = Limits(max_turns=None, max_actions=MAX_ACTIONS, max_seconds=None)
+COUNT_KEYS = {'win': 'wins', 'noresult': 'capped', 'crash': 'crashes'}
+
+
+def play_random_game(num_players):
+    """
+    Plays one game with every seat controlled by `simulate.random_agent`.
+
+    :param num_players: int
+    :return: dict Counts of the outcome and the number of actions taken.
+    """
+    outcome = play_game(num_players, limits=LIMITS)
+    return {'games': 1, COUNT_KEYS[outcome.result]: 1, 'actions': outcome.actions}
+
+
+def prepare_game(num_players):
+    def prepare(seed):
+        random.seed(seed)
+        return lambda: play_random_game(num_players)
+
+    return prepare
+
+
+for _players in (2, 4, 6):
+    benchmark(f'game[{_players} players]', number=50, group='macro')(prepare_game(_players))
@@ -0,0 +1,19 @@
+"""
+Memory benchmarks. Reports how many bytes a freshly dealt `Board` holds, with all of its cards, zones and trackers, for
+each table size. Many boards can share a process (`batch.run_batched` keeps dozens in flight), so this is the number
+that decides how many fit.
+"""
+
+from benchmarks.harness import memory_benchmark
+from objects import Board
+
+
+def prepare_board(num_players):
+    def prepare(seed):
+        return lambda: Board(num_players, seed=seed)
+
+    return prepare
+
+
+for _players in (2, 4, 6):
+    memory_benchmark(f'board memory[{_players} players]')(prepare_board(_players))
@@ -0,0 +1,297 @@
+"""
+Micro benchmarks. Each one times a single call into the engine on a freshly prepared, seeded game state.
+
+The `Board.action` benchmarks put the board into a known position for every `action_type` (by moving specific cards
+around) so that the measured call follows the interesting branch rather than whatever a random deal happens to allow.
+"""
+
+import random
+
+from benchmarks.harness import benchmark
+from notation import emit, parse
+from objects import Board, Decision
+
+PLAYERS = 4
+
+
+def new_board(seed, num_players=PLAYERS):
+    """
+    Builds a seeded `Board`.
+
+    :param seed: int
+    :param num_players: int
+    :return: Board
+    """
+    random.seed(seed)
+    return Board(num_players)
+
+
+def pull(board, name):
+    """
+    Finds the card called `name` wherever it is on the board, removes it from there and returns it.
+
+    :param board: Board
+    :param name: str
+    :return: Card
+    """
+    card = board.registry[name]
+    zone = board.zone_of(card)
+    if zone is not None:
+        zone.evict(card)
+    return card
+
+
+def give(board, names, space):
+    """
+    Moves the named cards into a hand, keep, goal space, rule space or the discard, bypassing any game logic.
+
+    :param board: Board
+    :param names: list[str]
+    :param space: Hand, CardSpace or Deck
+    :return: NoneType
+    """
+    for name in names:
+        board.move(pull(board, name), space)
+
+
+def option_index(board, name):
+    """
+    The index of the option whose card is called `name`.
+
+    :param board: Board
+    :param name: str
+    :return: int
+    """
+    return [getattr(o, 'name', o) for o in board.options].index(name)
+
+
+@benchmark('Board.__init__', number=100)
+def bench_board_init(seed):
+    random.seed(seed)
+    return lambda: Board(PLAYERS)
+
+
+@benchmark('Deck.draw', number=100, inner=20)
+def bench_deck_draw(seed):
+    board = new_board(seed)
+    return board.deck.draw
+
+
+@benchmark('Hand.__contains__', number=200, inner=20)
+def bench_hand_contains(seed):
+    board = new_board(seed)
+    hand = board.hands[0]
+    present = next(iter(hand))
+    absent = board.deck[0]
+    return lambda: (present in hand, absent in hand)
+
+
+@benchmark('Board.options', number=200, inner=10)
+def bench_options(seed):
+    board = new_board(seed)
+    return lambda: board.options
+
+
+@benchmark('Board.info', number=200, inner=10)
+def bench_info(seed):
+    board = new_board(seed)
+    return lambda: (board.info['player'], board.info['remaining'])
+
+
+@benchmark('Board.card_set', number=200, inner=10)
+def bench_card_set(seed):
+    board = new_board(seed)
+    return lambda: board.card_set
+
+
+@benchmark('Board.check_goal', number=200, inner=10)
+def bench_check_goal(seed):
+    board = new_board(seed)
+    board.goals.max_size = 2
+    give(board, ['Rocket to the Moon', '5 Keepers'], board.goals)
+    give(board, ['Rocket', 'Sun'], board.keeps[1])
+    give(board, ['Time', 'Bread', 'Milk'], board.keeps[2])
+    return board.check_goal
+
+
+@benchmark('Board.check_rules', number=200, inner=10)
+def bench_check_rules(seed):
+    board = new_board(seed)
+    for name in ['Draw 3', 'Play 2', 'Keeper Limit 4', 'Party Bonus', 'Poor Bonus']:
+        pull(board, name).play()
+    give(board, ['Party', 'Sun'], board.keeps[1])
+    return board.check_rules
+
+
+def ruled_board(seed):
+    """
+    A board with a few rules in play and Keepers on the table, for the notation benchmarks.
+
+    :param seed: int
+    :return: Board
+    """
+    board = new_board(seed)
+    for name in ['Draw 3', 'Play 2', 'Keeper Limit 4', 'Party Bonus']:
+        pull(board, name).play()
+    give(board, ['Party', 'Sun'], board.keeps[1])
+    return board
+
+
+@benchmark('notation.emit', number=200, inner=10)
+def bench_emit(seed):
+    board = ruled_board(seed)
+    return lambda: emit(board)
+
+
+@benchmark('notation.parse', number=100)
+def bench_parse(seed):
+    text = emit(ruled_board(seed))
+    return lambda: parse(text, seed=seed)
+
+
+def prepare_action(action_type):
+    """
+    Builds a prepare function which puts a new board into the given `action_type` and returns a callable making one
+    decision in it.
+
+    :param action_type: str
+    :return: function(int) -> function
+    """
+    setup = ACTION_SETUPS[action_type]
+
+    def prepare(seed):
+        board = new_board(seed)
+        option = setup(board)
+        # The setups move cards around behind the rules' backs, and an action on a board whose rules haven't caught up
+        # is turned down.
+        board.settle_rules()
+        return lambda: board.action(option)
+
+    return prepare
+
+
+def setup_normal(board):
+    give(board, ['Money'], board.hands[0])
+    return option_index(board, 'Money')
+
+
+def setup_handlimit(board):
+    board.hands[1].draw(3)
+    board.action_type = 'handlimit'
+    board.limit_state = 1
+    return 0
+
+
+def setup_keeperlimit(board):
+    give(board, ['Money', 'Sun', 'Moon'], board.keeps[1])
+    board.action_type = 'keeperlimit'
+    board.limit_state = 1
+    return 0
+
+
+def setup_goalmill(board):
+    give(board, ['Toast'], board.hands[0])
+    board.action_type = 'goalmill'
+    return [0]
+
+
+def setup_recycling(board):
+    give(board, ['Recycling'], board.hands[1])
+    give(board, ['Money'], board.keeps[0])
+    board.action_type = 'recycling'
+    return 0
+
+
+def setup_play2(board):
+    temphand = board.push_temphand(0, Decision.PLAY2)
+    give(board, ['Money', 'Sun'], temphand)
+    return 0
+
+
+def setup_everybody1(board):
+    give(board, ['Everybody Gets 1'], board.hands[1])
+    temphand = board.push_temphand(0, Decision.EVERYBODY1)
+    give(board, ['Money', 'Sun', 'Moon', 'Time'], temphand)
+    return 0
+
+
+def setup_zap(board):
+    give(board, ['Money'], board.keeps[1])
+    board.action_type = 'zap'
+    return 0
+
+
+def setup_goalremove(board):
+    board.goals.max_size = 2
+    give(board, ['Toast', 'Lullaby'], board.goals)
+    board.action_type = 'goalremove'
+    return 0
+
+
+def setup_rotate(board):
+    board.action_type = 'rotate'
+    return 0
+
+
+def setup_doitagain(board):
+    give(board, ['Jackpot!'], board.trash)
+    board.action_type = 'doitagain'
+    return 0
+
+
+def setup_steal(board):
+    give(board, ['Money'], board.keeps[1])
+    board.action_type = 'steal'
+    return 0
+
+
+def setup_simplify(board):
+    # Discards one of the three rules, which is under half of them.
+    for name in ['Draw 3', 'Play 2', 'Party Bonus']:
+        pull(board, name).play()
+    board.action_type = 'simplify'
+    return [option_index(board, 'Party Bonus')]
+
+
+def setup_trash(board):
+    give(board, ['Money'], board.keeps[1])
+    board.action_type = 'trash'
+    return 0
+
+
+def setup_exchange1(board):
+    give(board, ['Money'], board.keeps[1])
+    give(board, ['Sun'], board.keeps[0])
+    board.action_type = 'exchange1'
+    return 0
+
+
+def setup_exchange2(board):
+    give(board, ['Sun'], board.keeps[0])
+    board.exchange_space = 1, pull(board, 'Money')
+    board.action_type = 'exchange2'
+    return 0
+
+
+def setup_trade(board):
+    board.action_type = 'trade'
+    return 0
+
+
+def setup_usetake(board):
+    for card in list(board.hands[1]):
+        board.hands[1].discard(card)
+    give(board, ['Money'], board.hands[1])
+    board.action_type = 'usetake'
+    return 0
+
+
+ACTION_SETUPS = {'normal': setup_normal, 'handlimit': setup_handlimit, 'keeperlimit': setup_keeperlimit,
+                 'goalmill': setup_goalmill, 'recycling': setup_recycling, 'play2': setup_play2,
+                 'everybody1': setup_everybody1, 'zap': setup_zap, 'goalremove': setup_goalremove,
+                 'rotate': setup_rotate, 'doitagain': setup_doitagain, 'steal': setup_steal,
+                 'simplify': setup_simplify, 'trash': setup_trash, 'exchange1': setup_exchange1,
+                 'exchange2': setup_exchange2, 'trade': setup_trade, 'usetake': setup_usetake}
+
+for _action_type in ACTION_SETUPS:
+    benchmark(f'Board.action[{_action_type}]', number=100)(prepare_action(_action_type))
@@ -0,0 +1,382 @@
+"""
+Differential testing of two implementations of the engine.
+
+A rework of `objects.py` for speed should play exactly the same games as the code it replaces. `run_differential`
+plays the same seeded random games on a reference `Board` and a candidate in lockstep: both boards are dealt from the
+same seed, every choice is made on the reference board and given by name to both, and after every `action()` the two are
+compared (see `FIELDS`). The first game that comes apart is shrunk to a short sequence of choices which still makes the
+two disagree, and reported as a `Divergence`.
+
+Engines are given as `module:Class` (`objects:Board`, `arrays:ArrayBoard`) or as `git:REVISION`, which loads the
+`objects.py` committed at that revision, alongside the current `assets.py`. By default the working tree is checked
+against the last commit, so a change to `objects.py` can be tested before it's committed::
+
+    python differential.py --seeds 2000 --players 4 --processes 8
+    python differential.py --reference git:HEAD~3 --candidate arrays:ArrayBoard --seeds 500
+
+Any class can be checked which is built as `Board(num_players, exceptions=False, seed=seed)` and shows the attributes
+compared.
+"""
+
+import argparse
+import json
+import linecache
+import os
+import random
+import subprocess
+import sys
+import types
+from importlib import import_module
+from multiprocessing import Pool
+
+from objects import MULTI_SELECT
+
+
+def names(cards):
+    return [card.name for card in cards]
+
+
+def card_name(card):
+    return None if card is None else card.name
+
+
+def option_names(board):
+    """
+    :param board: Board
+    :return: list[str or int] The options, with cards given by name.
+    """
+    return [getattr(option, 'name', option) for option in board.options or []]
+
+
+# What's compared after every action. Zones which are sets are compared as sorted lists of names, and the options as a
+# multiset, since the order in which a set lists its cards isn't part of the game. The temp hands are compared from the
+# bottom of the stack up, each with the decision it's waiting on and how many cards have been played from it.
+FIELDS = {
+    'hands': lambda board: [sorted(names(hand)) for hand in board.hands],
+    'keeps': lambda board: [sorted(names(keep)) for keep in board.keeps],
+    'rules': lambda board: sorted(names(board.rules)),
+    'goals': lambda board: names(board.goals),
+    'deck': lambda board: names(board.deck),
+    'trash': lambda board: names(board.trash),
+    'action_type': lambda board: str(board.action_type),
+    'turn_num': lambda board: board.turn_num,
+    'player_state': lambda board: board.player_state,
+    'active_player': lambda board: board.active_player,
+    'cards_played': lambda board: board.cards_played,
+    'cards_drawn': lambda board: board.cards_drawn,
+    'draw_state': lambda board: board.draw_state,
+    'play_state': lambda board: board.play_state,
+    'numeral': lambda board: board.numeral,
+    'temphands': lambda board: [(str(hand.decision), hand.cards_played, sorted(names(hand)))
+                                for hand in board.temphands],
+    'special_actions': lambda board: sorted(names(board.special_actions)),
+    'mysteryplay': lambda board: card_name(board.mysteryplay),
+    'exchange_space': lambda board: board.exchange_space and (board.exchange_space[0],
+                                                              card_name(board.exchange_space[1])),
+    'options': lambda board: sorted(option_names(board), key=str),
+    'winner': lambda board: board.winner,
+}
+
+_engines = {}
+
+
+def load_engine(spec):
+    """
+    Imports a board class from a `module:Class` string, or loads `objects.Board` as it was at a git revision from
+    `git:REVISION`. Engines are loaded once per process.
+
+    :param spec: str
+    :return: type
+    """
+    if spec not in _engines:
+        kind, _, rest = spec.partition(':')
+        if kind == 'git':
+            _engines[spec] = load_revision(rest).Board
+        else:
+            _engines[spec] = getattr(import_module(kind), rest)
+    return _engines[spec]
+
+
+def load_revision(revision):
+    """
+    Loads `objects.py` from a git revision as a module of its own, which imports the current `assets.py`.
+
+    :param revision: str
+    :return: module
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    source = subprocess.run(['git', 'show', f'{revision}:objects.py'], cwd=root, capture_output=True, text=True,
+                            check=True).stdout
+    filename = f'{revision}:objects.py'
+    # Tracebacks from the old code can then show its lines.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    module = types.ModuleType('objects_' + ''.join(ch if ch.isalnum() else '_' for ch in revision))
+    module.__file__ = filename
+    sys.modules[module.__name__] = module
+    exec(compile(source, filename, 'exec'), module.__dict__)
+    return module
+
+
+def snapshot(board):
+    """
+    :param board: Board
+    :return: dict[str, object] Every one of `FIELDS`. A field which raises is given as what it raised, so that two
+             engines which fail in the same way still agree.
+    """
+    values = {}
+    for name, field in FIELDS.items():
+        try:
+            values[name] = field(board)
+        except Exception as e:
+            values[name] = 'raised', type(e).__name__
+    return values
+
+
+def differences(reference, candidate):
+    """
+    :param reference: dict A `snapshot`.
+    :param candidate: dict A `snapshot`.
+    :return: dict[str, tuple] The fields which differ, with the reference's and the candidate's values.
+    """
+    return {name: (reference[name], candidate[name]) for name in FIELDS if reference[name] != candidate[name]}
+
+
+def random_chooser(seed):
+    """
+    A chooser which picks at random with its own random number generator, like `simulate.random_agent`.
+
+    :param seed: int
+    :return: function
+    """
+    rng = random.Random(seed)
+
+    def choose(board, step):
+        options = option_names(board)
+        if board.action_type in MULTI_SELECT and board.action_type != 'everybody1':
+            return [option for option in options if rng.random() < 0.5]
+        if not options:
+            return None
+        return rng.choice(options)
+
+    return choose
+
+
+def replay_chooser(choices):
+    """
+    A chooser which makes `choices` in order and then stops.
+
+    :param choices: list
+    :return: function
+    """
+    return lambda board, step: choices[step] if step < len(choices) else StopIteration
+
+
+def resolve(board, choice):
+    """
+    Turns a choice by name into the argument for `board.action()`. None stands for a decision with no options.
+
+    :param board: Board
+    :param choice: str, int, list or NoneType
+    :return: int or list[int]
+    """
+    options = option_names(board)
+    if isinstance(choice, list):
+        return [options.index(option) for option in choice]
+    if choice is None:
+        return 0
+    return options.index(choice)
+
+
+def act(board, choice):
+    """
+    :param board: Board
+    :param choice: str, int, list or NoneType
+    :return: tuple The result's status and winner, or the name of what was raised. A choice which isn't open on the
+             board raises a ValueError.
+    """
+    try:
+        result = board.action(resolve(board, choice))
+    except Exception as e:
+        return 'raised', type(e).__name__
+    return result.status, result.winner
+
+
+def lockstep(reference, candidate, seed, num_players, chooser, max_actions=1000):
+    """
+    Plays one game on both engines at once.
+
+    :param reference: type
+    :param candidate: type
+    :param seed: int
+    :param num_players: int
+    :param chooser: function Called with the reference board and the step number, it gives the next choice by name, or
+                    StopIteration to stop.
+    :param max_actions: int
+    :return: tuple The choices made, and the step the boards came apart at along with their `differences`, or None
+             for both if they never did.
+    """
+    boards = [engine(num_players, exceptions=False, seed=seed) for engine in (reference, candidate)]
+    choices = []
+    found = differences(*[snapshot(board) for board in boards])
+    if found:
+        return choices, -1, found
+    for step in range(max_actions):
+        try:
+            choice = chooser(boards[0], step)
+        except Exception:
+            # The reference can't list its options. Whatever the engines raise over that is compared below.
+            choice = None
+        if choice is StopIteration:
+            break
+        choices.append(choice)
+        outcomes = [act(board, choice) for board in boards]
+        if outcomes[0] != outcomes[1]:
+            return choices, step, {'result': tuple(outcomes)}
+        if outcomes[0][0] == 'raised':
+            # Both engines failed in the same way, which includes a replayed choice that's no longer open.
+            break
+        found = differences(*[snapshot(board) for board in boards])
+        if found:
+            return choices, step, found
+        if outcomes[0][0] == 'win':
+            break
+    return choices, None, None
+
+
+def shrink(reference, candidate, seed, num_players, choices):
+    """
+    Cuts down a sequence of choices which makes the engines disagree, by delta debugging: runs of choices, halving in
+    length down to single ones, are dropped wherever the engines still disagree without them.
+
+    :param reference: type
+    :param candidate: type
+    :param seed: int
+    :param num_players: int
+    :param choices: list
+    :return: list
+    """
+    def diverges(trial):
+        return lockstep(reference, candidate, seed, num_players, replay_chooser(trial), len(trial))[1] is not None
+
+    chunk = max(1, len(choices) // 2)
+    while chunk:
+        i = 0
+        while i < len(choices):
+            trial = choices[:i] + choices[i + chunk:]
+            if diverges(trial):
+                choices = trial
+            else:
+                i += chunk
+        chunk //= 2
+    return choices
+
+
+class Divergence:
+    def __init__(self, seed, num_players, step, fields, choices, played):
+        """
+        A game the two engines played differently.
+
+        :param seed: int
+        :param num_players: int
+        :param step: int The action after which the boards differed, in the shrunk sequence, or -1 if they were dealt
+                     differently.
+        :param fields: dict[str, tuple] What differed, with the reference's and the candidate's values.
+        :param choices: list The shrunk choices, by name, which reproduce it from a board dealt from `seed`.
+        :param played: int How many actions the original game took to come apart.
+        """
+        self.seed = seed
+        self.num_players = num_players
+        self.step = step
+        self.fields = fields
+        self.choices = choices
+        self.played = played
+
+    @property
+    def info(self):
+        """
+        The divergence as a plain dictionary, ready for JSON.
+
+        :return: dict
+        """
+        return dict(vars(self))
+
+    def __repr__(self):
+        return (f'Divergence(seed {self.seed}, {self.num_players} players: {", ".join(self.fields)} after '
+                f'{len(self.choices)} of {self.played} choices)')
+
+
+def check_seed(args):
+    """
+    Plays one seed in lockstep and shrinks what it finds.
+
+    :param args: tuple (reference spec, candidate spec, seed, num_players, max_actions, shrink)
+    :return: Divergence or NoneType
+    """
+    reference_spec, candidate_spec, seed, num_players, max_actions, shrinking = args
+    reference, candidate = load_engine(reference_spec), load_engine(candidate_spec)
+    choices, step, fields = lockstep(reference, candidate, seed, num_players, random_chooser(seed), max_actions)
+    if step is None:
+        return None
+    played = len(choices)
+    if shrinking and step >= 0:
+        choices = shrink(reference, candidate, seed, num_players, choices)
+        choices, step, fields = lockstep(reference, candidate, seed, num_players, replay_chooser(choices),
+                                         len(choices))
+    return Divergence(seed, num_players, step, fields, choices, played)
+
+
+def run_differential(seeds, num_players, reference='git:HEAD', candidate='objects:Board', max_actions=1000,
+                     shrinking=True, processes=1):
+    """
+    Plays one game for every seed on both engines and gives back every game they disagreed on. With more than one
+    process the seeds are spread over a process pool, and every worker loads the engines for itself.
+
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param reference: str An engine spec, as for `load_engine`.
+    :param candidate: str
+    :param max_actions: int The most actions played in any one game.
+    :param shrinking: bool Whether to shrink the divergences found.
+    :param processes: int
+    :return: list[Divergence] In the order of `seeds`.
+    """
+    jobs = [(reference, candidate, seed, num_players, max_actions, shrinking) for seed in seeds]
+    if processes == 1:
+        found = [check_seed(job) for job in jobs]
+    else:
+        with Pool(processes) as pool:
+            found = pool.map(check_seed, jobs, chunksize=max(1, len(jobs) // (processes * 4)))
+    return [divergence for divergence in found if divergence is not None]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play the same games on two Fluxx engines and report where they '
+                                                 'disagree.')
+    parser.add_argument('--reference', default='git:HEAD', metavar='MODULE:CLASS or git:REVISION')
+    parser.add_argument('--candidate', default='objects:Board', metavar='MODULE:CLASS or git:REVISION')
+    parser.add_argument('--seeds', type=int, default=1000, help='How many games to play.')
+    parser.add_argument('--start', type=int, default=0, help='The first seed.')
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--max-actions', type=int, default=1000)
+    parser.add_argument('--no-shrink', action='store_true')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--out', help='Write every divergence to this file as JSON lines.')
+    args = parser.parse_args(argv)
+
+    found = run_differential(range(args.start, args.start + args.seeds), args.players, args.reference, args.candidate,
+                             args.max_actions, not args.no_shrink, args.processes)
+    for divergence in found:
+        print(divergence)
+        for name, (expected, actual) in divergence.fields.items():
+            print(f'    {name}: {expected!r} != {actual!r}')
+        print(f'    choices: {divergence.choices!r}')
+    if args.out:
+        with open(args.out, 'w') as out:
+            for divergence in found:
+                out.write(json.dumps(divergence.info, default=str) + '\n')
+    print(f'{len(found)} of {args.seeds} games diverged.')
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
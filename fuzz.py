@@ -0,0 +1,333 @@
+"""
+A fuzzer for `Board.action`.
+
+A board made with `exceptions=False` should never raise: an illegal option is answered with an illegal `Board.Result`
+and a win with a winning one. A board in the default raising mode should raise nothing but `Board.IllegalMove` and
+`Board.Win` for an option picked from `board.options`, since that mode trusts its caller to pick from them. And a game
+should end: random play wins sooner or later. After every action, every card should be in exactly one zone, and an
+option that was turned down should have moved none of them. `run_fuzz` plays many seeded games in both modes with random
+options, most of them legal (random subsets, duplicates included, for the decisions in `objects.MULTI_SELECT`) and, in
+the quiet mode, some of them anything but (indexes out of range, lists where an int belongs, None, strings). Every
+exception that gets out of a board, every broken card count and every game which isn't won within `max_actions` is
+recorded as a `Failure`, along with the seed, the mode and the options which led up to it. Failures are grouped by
+`signature`, and for each group only the shortest game is kept, so a night's run comes down to one reproducible case per
+bug::
+
+    python fuzz.py --games 1000000 --processes 16 --out failures.jsonl
+
+`replay(seed, num_players, trace, exceptions)` plays a failure's options again, and raises just as the fuzzed game did.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import traceback
+from multiprocessing import Pool
+
+from collections import Counter
+
+from objects import Board, CARD_DEFS, MULTI_SELECT
+
+# The options that aren't indexes into `board.options`. The numbers are added to the number of options.
+JUNK = (None, 'a', 1.5, True, [None], [[0]])
+# How many frames from the bottom of the engine's stack make up a crash's signature.
+SIGNATURE_FRAMES = 4
+# The most actions a fuzzed game gets to be won in, and how many of them may pass without a turn ending before the game
+# counts as stuck rather than long.
+MAX_ACTIONS = 5000
+STALL_ACTIONS = 200
+HERE = os.path.abspath(__file__)
+
+
+def legal_option(board, rng):
+    """
+    :param board: Board
+    :param rng: random.Random
+    :return: int or list[int]
+    """
+    options = board.options
+    n = len(options) if options is not None else 0
+    if board.action_type in MULTI_SELECT and (board.action_type != 'everybody1' or rng.random() < 0.5):
+        return [rng.randrange(n) for _ in range(rng.randrange(n + 1))] if n else []
+    return rng.randrange(n) if n else 0
+
+
+def illegal_option(board, rng):
+    """
+    :param board: Board
+    :param rng: random.Random
+    :return: object
+    """
+    options = board.options
+    n = len(options) if options is not None else 0
+    kind = rng.randrange(4)
+    if kind == 0:
+        return n + rng.randrange(3)
+    if kind == 1:
+        return -n - 1 - rng.randrange(3)
+    if kind == 2:
+        return [rng.randrange(-n - 2, n + 2) for _ in range(rng.randrange(1, 4))]
+    return rng.choice(JUNK)
+
+
+def signature(error):
+    """
+    Where an exception came from: its type and the innermost frames of the engine's stack it went through, by file,
+    function and source line. Line numbers are left out, so the signature survives edits elsewhere in the file.
+
+    :param error: Exception
+    :return: tuple
+    """
+    frames = [frame for frame in traceback.extract_tb(error.__traceback__) if os.path.abspath(frame.filename) != HERE]
+    return (type(error).__name__,) + tuple((os.path.basename(frame.filename), frame.name, frame.line)
+                                           for frame in frames[-SIGNATURE_FRAMES:])
+
+
+def stall_signature(board, reason):
+    """
+    The signature of a game which got stuck: no turn passed in its last `STALL_ACTIONS` actions. The pending decision,
+    and the reason the last option was refused if it was, say where.
+
+    :param board: Board
+    :param reason: str or NoneType
+    :return: tuple
+    """
+    return 'Stuck', str(board.action_type), reason
+
+
+def misplaced(board):
+    """
+    Counts every card in the deck, the discard pile, the rules, the goals, the hands, the keeps, the temp hands and the
+    exchange space. Each one should be in exactly one of them.
+
+    :param board: Board
+    :return: tuple or NoneType What's wrong with the count, if anything: 'lost' or 'doubled', and the cards' names.
+    """
+    zones = [board.deck, board.trash, board.rules, board.goals] + list(board.hands) + list(board.keeps)
+    counts = Counter(card.id for zone in zones + list(board.temphands) for card in zone)
+    if board.exchange_space is not None:
+        counts[board.exchange_space[1].id] += 1
+    lost = [definition.name for definition in CARD_DEFS if counts[definition.id] == 0]
+    doubled = [definition.name for definition in CARD_DEFS if counts[definition.id] > 1]
+    if lost:
+        return 'lost', lost
+    if doubled:
+        return 'doubled', doubled
+    return None
+
+
+class Failure:
+    def __init__(self, signature, error, seed, num_players, exceptions, trace, stack, count=1):
+        """
+        A game which went wrong: an exception which got out of the board, cards which went missing, or a game which
+        didn't end.
+
+        :param signature: tuple See `signature` and `stall_signature`. Misplaced cards are grouped by the decision
+                          that was being made.
+        :param error: str The exception's type and message, what was wrong with the cards, or what kept the game going.
+        :param seed: int
+        :param num_players: int
+        :param exceptions: bool Whether the board raised for illegal moves and wins.
+        :param trace: list The options given to `board.action()`, in order. The last one raised, if any did.
+        :param stack: str The formatted traceback, or None for a game which didn't end.
+        :param count: int How many games failed with this signature.
+        """
+        self.signature = signature
+        self.error = error
+        self.seed = seed
+        self.num_players = num_players
+        self.exceptions = exceptions
+        self.trace = trace
+        self.stack = stack
+        self.count = count
+
+    @property
+    def info(self):
+        """
+        The failure as a plain dictionary, ready for JSON.
+
+        :return: dict
+        """
+        return dict(vars(self))
+
+    def __repr__(self):
+        mode = 'raising' if self.exceptions else 'quiet'
+        return f'Failure({self.error}, {self.count} games, {mode} seed {self.seed}: {len(self.trace)} actions)'
+
+
+def step(board, option):
+    """
+    Gives a board one option. A raising board's `Board.IllegalMove` and `Board.Win` are turned into the result a quiet
+    board would have returned; anything else is left to propagate.
+
+    :param board: Board
+    :param option: object
+    :return: Board.Result
+    """
+    if not board.exceptions:
+        return board.action(option)
+    try:
+        return board.action(option)
+    except Board.IllegalMove as e:
+        return Board.Result('illegal', reason=str(e))
+    except Board.Win:
+        return Board.Result('win')
+
+
+def fuzz_game(seed, num_players, exceptions=False, max_actions=MAX_ACTIONS, illegal=0.1):
+    """
+    Plays one game with random options until it's won, crashes or runs out of actions.
+
+    :param seed: int Seeds both the board and the choice of options.
+    :param num_players: int
+    :param exceptions: bool Fuzzes the default raising mode if set. Only legal options are given in that mode.
+    :param max_actions: int
+    :param illegal: float The chance of each option being one that isn't legal.
+    :return: Failure or NoneType
+    """
+    rng = random.Random(seed)
+    trace = []
+    if exceptions:
+        illegal = 0
+    try:
+        board = Board(num_players, exceptions=exceptions, seed=seed)
+        turn, since, reason = board.turn_num, 0, None
+        for _ in range(max_actions):
+            option = illegal_option(board, rng) if rng.random() < illegal else legal_option(board, rng)
+            trace.append(option)
+            decision, locations = str(board.action_type), list(board.locations)
+            result = step(board, option)
+            if result.won:
+                return None
+            wrong = misplaced(board)
+            if wrong is None and result.illegal and any(a is not b for a, b in zip(board.locations, locations)):
+                wrong = 'moved', [card.name for card in board.card_table
+                                  if board.locations[card.id] is not locations[card.id]]
+            if wrong is not None:
+                kind, names = wrong
+                return Failure(('Misplaced', decision, kind), f'Cards {kind}: {", ".join(names)}', seed, num_players,
+                               exceptions, trace, None)
+            reason = result.reason
+            if board.turn_num != turn:
+                turn, since = board.turn_num, 0
+            else:
+                since += 1
+    except Exception as e:
+        return Failure(signature(e), f'{type(e).__name__}: {e}', seed, num_players, exceptions, trace,
+                       traceback.format_exc())
+    if since >= STALL_ACTIONS:
+        return Failure(stall_signature(board, reason), f'Stuck on turn {turn} at {board.action_type}', seed,
+                       num_players, exceptions, trace, None)
+    return Failure(('Unfinished',), f'Nobody won in {max_actions} actions', seed, num_players, exceptions, trace, None)
+
+
+def replay(seed, num_players, trace, exceptions=False):
+    """
+    Plays a failure's options again on a fresh board. Raises whatever the failure raised.
+
+    :param seed: int
+    :param num_players: int
+    :param trace: list
+    :param exceptions: bool
+    :return: Board The board after the last option, if nothing was raised.
+    """
+    board = Board(num_players, exceptions=exceptions, seed=seed)
+    for option in trace:
+        step(board, option)
+    return board
+
+
+def merge(failures, found):
+    """
+    Adds failures to a dictionary of them by signature, keeping the shortest game of each and counting them all.
+
+    :param failures: dict[tuple, Failure]
+    :param found: iterable[Failure]
+    :return: NoneType
+    """
+    for failure in found:
+        known = failures.get(failure.signature)
+        if known is None:
+            failures[failure.signature] = failure
+            continue
+        count = known.count + failure.count
+        if (len(failure.trace), failure.seed) < (len(known.trace), known.seed):
+            failures[failure.signature] = failure
+        failures[failure.signature].count = count
+
+
+def _fuzz_chunk(args):
+    seeds, num_players, modes, max_actions, illegal = args
+    failures = {}
+    for seed in seeds:
+        players = num_players if num_players is not None else 2 + seed % 5
+        for exceptions in modes:
+            failure = fuzz_game(seed, players, exceptions, max_actions, illegal)
+            if failure is not None:
+                merge(failures, [failure])
+    return list(failures.values())
+
+
+def run_fuzz(seeds, num_players=None, modes=(False, True), max_actions=MAX_ACTIONS, illegal=0.1, processes=1,
+             chunk=200):
+    """
+    Fuzzes one game for every seed in each mode. The seeds go to a process pool in chunks, and every chunk's failures
+    are merged by signature before they're sent back, so however many games fail only one `Failure` per bug crosses
+    between processes.
+
+    :param seeds: iterable[int]
+    :param num_players: int or NoneType Defaults to 2 to 6 players, depending on the seed.
+    :param modes: iterable[bool] The values of `exceptions` to fuzz: quiet, raising or both.
+    :param max_actions: int
+    :param illegal: float
+    :param processes: int
+    :param chunk: int Seeds per task.
+    :return: list[Failure] One per signature, the most common first.
+    """
+    seeds = list(seeds)
+    modes = tuple(modes)
+    jobs = [(seeds[i:i + chunk], num_players, modes, max_actions, illegal) for i in range(0, len(seeds), chunk)]
+    failures = {}
+    if processes == 1:
+        for job in jobs:
+            merge(failures, _fuzz_chunk(job))
+    else:
+        with Pool(processes) as pool:
+            for found in pool.imap_unordered(_fuzz_chunk, jobs):
+                merge(failures, found)
+    return sorted(failures.values(), key=lambda failure: (-failure.count, failure.seed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fuzz Board.action with random options and group the failures.')
+    parser.add_argument('--games', type=int, default=10000, help='Seeds to fuzz. Each is played once in each mode.')
+    parser.add_argument('--start', type=int, default=0, help='The first seed.')
+    parser.add_argument('--players', type=int, help='Defaults to 2 to 6, varying with the seed.')
+    parser.add_argument('--mode', choices=('quiet', 'raising', 'both'), default='both')
+    parser.add_argument('--max-actions', type=int, default=MAX_ACTIONS)
+    parser.add_argument('--illegal', type=float, default=0.1, help='The share of options which are illegal.')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--out', help='Write every failure to this file as JSON lines.')
+    args = parser.parse_args(argv)
+
+    modes = {'quiet': (False,), 'raising': (True,), 'both': (False, True)}[args.mode]
+    failures = run_fuzz(range(args.start, args.start + args.games), args.players, modes, args.max_actions,
+                        args.illegal, args.processes)
+    for failure in failures:
+        print(failure)
+        if failure.stack is not None:
+            print('   ', ' <- '.join(f'{name} ({filename})' for filename, name, _ in reversed(failure.signature[1:])))
+        elif len(failure.signature) > 1:
+            print('   ', f'{failure.signature[1]}: {failure.signature[2]}')
+    if args.out:
+        with open(args.out, 'w') as out:
+            for failure in failures:
+                out.write(json.dumps(failure.info, default=repr) + '\n')
+    print(f'{len(failures)} distinct failures in {args.games} seeds.')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
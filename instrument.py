@@ -0,0 +1,209 @@
+"""
+Optional instrumentation for the engine's hot paths.
+
+When enabled, this counts calls to, and accumulates the time spent in, each `action_type` decision handled by
+`Board.action`, the handler each decision is dispatched to, each `Action.a_*` card effect, each subclass's `Rule.rule`
+method, and `Board.check_goal` and `Board.check_rules`. It works by swapping timed wrappers into the classes and handler
+tables in `objects.py`, and putting the original functions back when disabled, so it costs nothing at all while it's
+switched off.
+
+Typical use::
+
+    import instrument
+
+    with instrument.recording() as recorder:
+        run_some_games()
+    print(recorder.report())
+
+Times are inclusive: the time for an `action[...]` entry includes the card effects and rule checks that ran inside it.
+A `Board.action` call is filed under the `action_type` the board was in when the call was made, which is the decision
+the player was answering. The matching `handler[...]` entry covers just that decision's handler, without the rule and
+goal checks around it.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+import objects
+from objects import Board, Action, Rule
+
+
+class Recorder:
+    def __init__(self):
+        """
+        Holds the call counts and cumulative times gathered while instrumentation is enabled.
+        """
+        self.calls = Counter()
+        self.seconds = Counter()
+
+    def reset(self):
+        """
+        Forgets everything recorded so far.
+
+        :return: NoneType
+        """
+        self.calls.clear()
+        self.seconds.clear()
+
+    def timed(self, key, func):
+        """
+        Wraps `func` so that every call is counted and timed under `key`.
+
+        :param key: str
+        :param func: function
+        :return: function
+        """
+        calls = self.calls
+        seconds = self.seconds
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds[key] += perf_counter() - start
+                calls[key] += 1
+
+        wrapper.__wrapped__ = func
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    def timed_action(self, func):
+        """
+        Wraps `Board.action` so that each call is filed under the board's current `action_type`.
+
+        :param func: function
+        :return: function
+        """
+        calls = self.calls
+        seconds = self.seconds
+
+        def action(board, option):
+            key = f'action[{board.action_type}]'
+            start = perf_counter()
+            try:
+                return func(board, option)
+            finally:
+                seconds[key] += perf_counter() - start
+                calls[key] += 1
+
+        action.__wrapped__ = func
+        action.__doc__ = func.__doc__
+        return action
+
+    @property
+    def stats(self):
+        """
+        The recorded data, keyed by hook name.
+
+        :return: dict[str, dict] Each value has the keys `calls`, `seconds` and `mean` (seconds per call).
+        """
+        return {key: {'calls': n, 'seconds': self.seconds[key], 'mean': self.seconds[key] / n}
+                for key, n in self.calls.items()}
+
+    def report(self, sort='seconds'):
+        """
+        A plain text table of the recorded data, most expensive first.
+
+        :param sort: str One of 'seconds', 'calls' or 'mean'.
+        :return: str
+        """
+        stats = self.stats
+        rows = sorted(stats.items(), key=lambda item: item[1][sort], reverse=True)
+        lines = [f'{"hook":<32} {"calls":>10} {"total ms":>12} {"mean us":>10}']
+        for key, row in rows:
+            lines.append(f'{key:<32} {row["calls"]:>10} {row["seconds"] * 1e3:>12.3f} {row["mean"] * 1e6:>10.2f}')
+        return '\n'.join(lines)
+
+
+_recorder = None
+_originals = []
+
+
+def hooks():
+    """
+    Lists every place that gets instrumented.
+
+    :return: list[tuple[type or dict, str, str]] Tuples of (class or handler table, attribute name or table key, key
+             the timings are filed under).
+    """
+    points = [(Board, 'check_goal', 'check_goal'), (Board, 'check_rules', 'check_rules')]
+    for decision in Board.action_handlers:
+        points.append((Board.action_handlers, decision, f'handler[{decision}]'))
+    for name in Action.effects:
+        points.append((Action.effects, name, f'effect[{name}]'))
+    for cls in vars(objects).values():
+        if isinstance(cls, type) and issubclass(cls, Rule) and 'rule' in vars(cls):
+            points.append((cls, 'rule', f'rule[{cls.__name__}]'))
+    return points
+
+
+def install(target, name, func):
+    """
+    Puts `func` in place of a hook.
+
+    :param target: type or dict
+    :param name: str
+    :param func: function
+    :return: NoneType
+    """
+    if isinstance(target, dict):
+        target[name] = func
+    else:
+        setattr(target, name, func)
+
+
+def enable(recorder=None):
+    """
+    Installs the timed wrappers. Calling it while already enabled just returns the active `Recorder`.
+
+    :param recorder: Recorder or NoneType If given, data is recorded into it instead of a new `Recorder`.
+    :return: Recorder
+    """
+    global _recorder
+    if _recorder is not None:
+        return _recorder
+    _recorder = recorder if recorder is not None else Recorder()
+    for target, name, key in hooks():
+        original = target[name] if isinstance(target, dict) else vars(target)[name]
+        _originals.append((target, name, original))
+        install(target, name, _recorder.timed(key, original))
+    original = vars(Board)['action']
+    _originals.append((Board, 'action', original))
+    Board.action = _recorder.timed_action(original)
+    return _recorder
+
+
+def disable():
+    """
+    Puts the original, untimed functions back. The data recorded so far stays available in the `Recorder`.
+
+    :return: Recorder or NoneType
+    """
+    global _recorder
+    while _originals:
+        target, name, original = _originals.pop()
+        install(target, name, original)
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def enabled():
+    return _recorder is not None
+
+
+@contextmanager
+def recording(recorder=None):
+    """
+    Context manager which enables instrumentation for the duration of a `with` block.
+
+    :param recorder: Recorder or NoneType
+    :return: Recorder
+    """
+    recorder = enable(recorder)
+    try:
+        yield recorder
+    finally:
+        disable()
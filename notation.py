@@ -0,0 +1,261 @@
+"""
+A one-line text notation for positions, in the spirit of chess's FEN.
+
+`emit` writes down where a game stands and `parse` sets up a board in that position, without playing up to it. A
+position is nine fields separated by `|`:
+
+    hands | keeps | rules | goals | deck | trash | aside | decision | counters
+
+:hands: Every player's hand, separated by `/`. The number of players is the number of hands.
+:keeps: Every player's keep, separated by `/`.
+:rules: The rules in play. They're put into play in the order they're listed, just as if they'd been played.
+:goals: The goals in play, in order.
+:deck: The draw pile from the top down, or `*` for every card not listed anywhere else, shuffled.
+:trash: The discard pile, in order.
+:aside: The stack of temp hands (see `Board.push_temphand`) from the bottom up, separated by `/`. Each is written as
+        `decision:played:cards`, with `-` for a temp hand which isn't waiting on a decision.
+:decision: The `action_type` the board is waiting on, as its value (`normal`, `play2`, `goalmill`, ...).
+:counters: Space-separated `key=value` pairs for the counters which aren't at their defaults.
+
+The counters are `turn` (`turn_num`, 0 by default), `player` (`player_state`, the turn number modulo the number of
+players by default), `played`, `drawn` and `tempplayed` (`cards_played`, `cards_drawn` and `temp_cards_played`, with
+`drawn` defaulting to the draw rule in play), `free` (1 for a free turn), `limit` (`limit_state`), `bonus` (every
+player's bonus plays, separated by `/`), `used` (the cards whose `used` flag is set), `mystery` (`mysteryplay`),
+`exchange` (`exchange_space`, as `player:card`), `winner` and `goal` (`winning_goal`).
+
+Cards are separated by `;` and written by id (see `objects.CARD_DEFS`), which is what `emit` gives unless asked for
+names, or by name. Whitespace around any of them is ignored. The last five fields may be left off, so an endgame can be
+written as just the hands, keeps, rules and goals::
+
+    board = parse('Milk;Cookies/Brain|Sun/Moon;Eye|Draw 3|Rocket Science')
+
+With an explicit deck, cards which aren't listed at all are out of play, as a card is for a moment while it's being
+played. The order of the draw pile is part of the notation but the state of the random number generator isn't, so a
+parsed board draws the same cards but shuffles and picks at random as its own seed says. Zones which are kept as sets
+(the hands, keeps, rules and temp hands) are written in order of card id, so a position has only one notation.
+"""
+
+import re
+
+from objects import Board, CARD_DEFS, CARD_IDS, Decision, Limit
+
+FIELD, PLAYER, CARD = '|', '/', ';'
+SHUFFLED = '*'
+NO_DECISION = '-'
+FIELDS = ('hands', 'keeps', 'rules', 'goals', 'deck', 'trash', 'aside', 'decision', 'counters')
+COUNTERS = ('turn', 'player', 'played', 'drawn', 'tempplayed', 'free', 'limit', 'bonus', 'used', 'mystery', 'exchange',
+            'winner', 'goal')
+
+# What a card can be written as: its id or its name.
+CARD_TOKENS = {**{str(definition.id): definition.id for definition in CARD_DEFS}, **CARD_IDS}
+
+assert not any(mark in definition.name for definition in CARD_DEFS for mark in (FIELD, PLAYER, CARD, ':', '=')), \
+    'A card name clashes with the notation.'
+
+
+def card_token(card, names=False):
+    """
+    :param card: Card
+    :param names: bool
+    :return: str
+    """
+    return card.name if names else str(card.id)
+
+
+def cards_text(cards, names=False):
+    """
+    :param cards: iterable[Card]
+    :param names: bool
+    :return: str
+    """
+    return CARD.join(card_token(card, names) for card in cards)
+
+
+def set_text(cards, names=False):
+    """
+    For zones which are kept as sets: the cards in order of id, whatever order the set lists them in.
+
+    :param cards: iterable[Card]
+    :param names: bool
+    :return: str
+    """
+    return cards_text(sorted(cards, key=lambda card: card.id), names)
+
+
+def emit(board, names=False):
+    """
+    Writes down the position a board is in.
+
+    :param board: Board
+    :param names: bool Whether to write cards by name rather than by id.
+    :return: str
+    """
+    fields = [PLAYER.join(set_text(hand, names) for hand in board.hands),
+              PLAYER.join(set_text(keep, names) for keep in board.keeps),
+              set_text(board.rules, names), cards_text(board.goals, names), cards_text(board.deck, names),
+              cards_text(board.trash, names),
+              PLAYER.join(f'{NO_DECISION if hand.decision is None else hand.decision}:{hand.cards_played}:'
+                          f'{set_text(hand, names)}' for hand in board.temphands),
+              str(board.action_type)]
+    counters = []
+    if board.turn_num:
+        counters.append(f'turn={board.turn_num}')
+    if board.player_state != board.turn_num % board.num_players:
+        counters.append(f'player={board.player_state}')
+    if board.cards_played:
+        counters.append(f'played={board.cards_played}')
+    if board.temp_cards_played:
+        counters.append(f'tempplayed={board.temp_cards_played}')
+    # The default for `drawn` is the draw rule as it stands once the rules are up to date, which it needn't be on a
+    # board in the middle of a game, so the count is always written out.
+    counters.append(f'drawn={board.cards_drawn}')
+    if board.free_turn:
+        counters.append('free=1')
+    if board.limit_state is not None:
+        counters.append(f'limit={board.limit_state}')
+    if any(board.bonus_plays):
+        counters.append(f'bonus={PLAYER.join(str(plays) for plays in board.bonus_plays)}')
+    used = [card for card in board.card_table if getattr(card, 'used', None)]
+    if used:
+        counters.append(f'used={cards_text(used, names)}')
+    if board.mysteryplay is not None:
+        counters.append(f'mystery={card_token(board.mysteryplay, names)}')
+    if board.exchange_space is not None:
+        player, card = board.exchange_space
+        counters.append(f'exchange={player}:{card_token(card, names)}')
+    if board.winner is not None:
+        counters.append(f'winner={board.winner}')
+    if board.winning_goal is not None:
+        counters.append(f'goal={card_token(board.winning_goal, names)}')
+    fields.append(' '.join(counters))
+    return FIELD.join(fields)
+
+
+def parse_card(token):
+    """
+    :param token: str A card id or name.
+    :return: int The card's id.
+    """
+    try:
+        return CARD_TOKENS[token.strip()]
+    except KeyError:
+        raise ValueError(f'There is no card {token.strip()!r}.') from None
+
+
+def parse_cards(text):
+    """
+    :param text: str
+    :return: list[int] Card ids.
+    """
+    text = text.strip()
+    return [parse_card(token) for token in text.split(CARD)] if text else []
+
+
+def parse_counters(text):
+    """
+    :param text: str
+    :return: dict[str, str]
+    """
+    counters = {}
+    # Card names have spaces in them, so a counter runs until the next `key=`.
+    for pair in re.split(r'\s+(?=[a-z]+=)', text.strip()) if text.strip() else []:
+        key, sep, value = pair.partition('=')
+        if not sep or key not in COUNTERS:
+            raise ValueError(f'Unknown counter {pair!r}.')
+        counters[key] = value.strip()
+    return counters
+
+
+def parse(text, exceptions=True, seed=None, cls=Board):
+    """
+    Sets up a board in the position `text` describes. The rules in it are brought up to date just as they would be
+    after an action, so what the board shows (its draw and play rules, its bonuses, its Inflation numeral and how many
+    goals it takes) follows from the cards in play.
+
+    :param text: str A position, as written by `emit`.
+    :param exceptions: bool
+    :param seed: int or NoneType
+    :param cls: type The kind of board to build.
+    :return: Board
+    """
+    fields = text.split(FIELD)
+    if not 4 <= len(fields) <= len(FIELDS):
+        raise ValueError(f'A position has between 4 and {len(FIELDS)} fields, not {len(fields)}.')
+    shuffled = len(fields) < 5 or fields[4].strip() == SHUFFLED
+    fields += [''] * (len(FIELDS) - len(fields))
+    fields = dict(zip(FIELDS, fields))
+    hands = [parse_cards(hand) for hand in fields['hands'].split(PLAYER)]
+    keeps = [parse_cards(keep) for keep in fields['keeps'].split(PLAYER)]
+    num_players = len(hands)
+    if len(keeps) != num_players:
+        raise ValueError(f'There are {num_players} hands but {len(keeps)} keeps.')
+    aside = []
+    for hand in fields['aside'].split(PLAYER) if fields['aside'].strip() else []:
+        decision, played, cards = hand.split(':', 2)
+        decision = decision.strip()
+        aside.append((None if decision == NO_DECISION else Decision(decision), int(played), parse_cards(cards)))
+    rules = parse_cards(fields['rules'])
+    goals = parse_cards(fields['goals'])
+    trash = parse_cards(fields['trash'])
+    deck = [] if shuffled else parse_cards(fields['deck'])
+    listed = [card_id for cards in hands + keeps + [rules, goals, deck, trash] + [cards for _, _, cards in aside]
+              for card_id in cards]
+    if len(set(listed)) != len(listed):
+        twice = sorted({CARD_DEFS[card_id].name for card_id in listed if listed.count(card_id) > 1})
+        raise ValueError(f'Listed more than once: {", ".join(twice)}.')
+    if shuffled:
+        unlisted = set(range(len(CARD_DEFS))) - set(listed)
+        deck = [card_id for card_id in range(len(CARD_DEFS)) if card_id in unlisted]
+    decision = Decision(fields['decision'].strip() or Decision.NORMAL)
+    counters = parse_counters(fields['counters'])
+
+    board = cls(num_players, exceptions=exceptions, seed=seed)
+    table = board.card_table
+    # A new board has only dealt into the deck and the hands. Those are emptied and everything is laid out zone by zone,
+    # which never has to search the deck for a card.
+    for zone in [board.deck] + board.hands:
+        zone.take_all()
+    if shuffled:
+        board.rng.shuffle(deck)
+    board.deck.receive([table[card_id] for card_id in deck])
+    board.trash.receive([table[card_id] for card_id in trash])
+    for player, (hand, keep) in enumerate(zip(hands, keeps)):
+        board.hands[player].receive([table[card_id] for card_id in hand])
+        board.keeps[player].receive([table[card_id] for card_id in keep])
+    board.goals.receive([table[card_id] for card_id in goals])
+    for decision_aside, played, cards in aside:
+        hand = board.push_temphand(0, decision_aside)
+        hand.cards_played = played
+        hand.receive([table[card_id] for card_id in cards])
+    # The rules go in last, each set up as it would be when played, so that they start from the table as it stands.
+    for card_id in rules:
+        rule = table[card_id]
+        rule.enact()
+        board.rules.put(rule)
+
+    board.action_type = decision
+    board.turn_num = int(counters.get('turn', 0))
+    board.player_state = int(counters.get('player', board.turn_num % num_players))
+    board.cards_played = int(counters.get('played', 0))
+    board.temp_cards_played = int(counters.get('tempplayed', 0))
+    board.free_turn = bool(int(counters.get('free', 0)))
+    board.limit_state = int(counters['limit']) if 'limit' in counters else None
+    if 'bonus' in counters:
+        board.bonus_plays = [int(plays) for plays in counters['bonus'].split(PLAYER)]
+    for card_id in parse_cards(counters.get('used', '')):
+        table[card_id].used = True
+    if 'mystery' in counters:
+        board.mysteryplay = table[parse_card(counters['mystery'])]
+    if 'exchange' in counters:
+        player, card = counters['exchange'].split(':', 1)
+        board.exchange_space = int(player), table[parse_card(card)]
+    if 'winner' in counters:
+        board.winner = int(counters['winner'])
+    if 'goal' in counters:
+        board.winning_goal = table[parse_card(counters['goal'])]
+    # The limits only decide whose discard the board is waiting on, which the decision and counters already say.
+    for rule in list(board.rules):
+        if not isinstance(rule, Limit):
+            rule.rule()
+    board.cards_drawn = int(counters.get('drawn', board.draw_state))
+    return board
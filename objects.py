@@ -8,13 +8,74 @@ The main purpose is for a Board object to act as a finite state machine which ca
 """
 
 from abc import abstractmethod
-from collections.abc import MutableSequence, MutableSet
-from itertools import cycle, chain
+from collections.abc import Mapping, MutableSequence, MutableSet
+from enum import Enum
+from itertools import chain
 from math import ceil
-from random import shuffle, choice
+import random
+from zlib import crc32
 
 from assets import *
 
+# The goals that name a Keeper outright, which is all the `GoalTracker` has to count per Keeper.
+GOAL_KEEPERS = {keeper: tuple(goal for goal, reqs in goals.items() if keeper in reqs) for keeper in keepers}
+GOAL_KEEPER_COUNTS = {goal: sum(not req.startswith('_') for req in reqs) for goal, reqs in goals.items()}
+EXOTIC_REQS = {goal: tuple(req for req in reqs if req.startswith('_')) for goal, reqs in goals.items()
+               if any(req.startswith('_') for req in reqs)}
+
+
+class Decision(str, Enum):
+    """
+    The kinds of decision the game can be waiting on, as found in `board.action_type`. Members are strings, so they
+    compare and hash equal to their values and `board.action_type == 'normal'` still works.
+    """
+    NORMAL = 'normal'
+    HANDLIMIT = 'handlimit'
+    KEEPERLIMIT = 'keeperlimit'
+    GOALMILL = 'goalmill'
+    RECYCLING = 'recycling'
+    PLAY2 = 'play2'
+    EVERYBODY1 = 'everybody1'
+    ZAP = 'zap'
+    GOALREMOVE = 'goalremove'
+    ROTATE = 'rotate'
+    DOITAGAIN = 'doitagain'
+    STEAL = 'steal'
+    SIMPLIFY = 'simplify'
+    TRASH = 'trash'
+    EXCHANGE1 = 'exchange1'
+    EXCHANGE2 = 'exchange2'
+    TRADE = 'trade'
+    USETAKE = 'usetake'
+
+    __hash__ = str.__hash__
+
+    def __str__(self):
+        return self.value
+
+
+# Decisions which may take a list of option indexes, and decisions which can be made with no options at all.
+MULTI_SELECT = {Decision.GOALMILL, Decision.SIMPLIFY, Decision.EVERYBODY1}
+EMPTY_OK = {Decision.GOALMILL, Decision.SIMPLIFY, Decision.TRASH, Decision.EXCHANGE1}
+# The most passes `Board.settle_rules` makes over the rules at the end of an action. A pass can be a whole turn, when
+# the rules play it by themselves (First Play Random with nothing else to play, say).
+SETTLE_PASSES = 256
+
+
+def handles(table, decision):
+    """
+    Decorator which registers a function in a handler table under a `Decision`.
+
+    :param table: dict
+    :param decision: Decision
+    :return: function
+    """
+    def register(func):
+        table[decision] = func
+        return func
+
+    return register
+
 
 class Board:
     """
@@ -22,13 +83,30 @@ class Board:
     to a Board object.
 
     :type num_players: int The number of players playing the game.
+    :type exceptions: bool If False, `Board.action` never raises for a win or an illegal move. Instead it returns a
+        `Board.Result` describing what happened, which is cheaper and safer when driving many games from a loop.
+    :type seed: int If given, the board shuffles and picks at random with its own `random.Random(seed)`, so that its
+        game doesn't depend on anything else using the random module. Otherwise it uses the random module directly.
     """
 
-    def __init__(self, num_players: int):
+    action_handlers = {}
+    option_handlers = {}
 
+    def __init__(self, num_players: int, exceptions: bool = True, seed: int = None):
+        self.rng = random.Random(seed) if seed is not None else random
+        self.subscribers = {}
+        self.version = 0
+        self.card_table = [definition.kind(self, definition) for definition in CARD_DEFS]
+        self.locations = [None] * len(self.card_table)
+        self.limit_tracker = LimitTracker(self)
         self.deck = Deck(self)
+        for card in self.deck.values:
+            self.locations[card.id] = self.deck
+        self.registry = Registry(self.card_table, CARD_IDS)
+        self.tags = Registry(self.card_table, CARD_TAG_IDS)
         self.hands = [Hand(player_num, self) for player_num in range(num_players)]
         self.keeps = [Keep(player_num, self) for player_num in range(num_players)]
+        self.goal_tracker = GoalTracker(self, num_players)
         self.hands[0].draw(1)
         self.trash = Deck.discard_creator(self)
         self.num_players = num_players
@@ -45,12 +123,19 @@ class Board:
         self.play_bonuses = []
         self.bonus_plays = [0 for _ in range(num_players)]
         self.special_actions = set()
-        self.action_type = 'normal'
+        self.action_type = Decision.NORMAL
         self.limit_state = None
-        self.temphands = [Hand.temphand(0, self)]
+        self.temphands = []
+        self.temphand_pool = []
         self.free_turn = False
         self.exchange_space = None
         self.mysteryplay = None
+        self.exceptions = exceptions
+        self.winner = None
+        self.winning_goal = None
+        self.rejection = None
+        self.counted_play = False
+        self._info = BoardInfo(self)
 
     def inc_cards_played(self):
         """
@@ -60,8 +145,10 @@ class Board:
         :return: NoneType
         """
         self.cards_played += 1
-        freeturncard = [card for card in self.card_set if card.tag == 'a_anotherturn'][0]
-        if (self.cards_played >= self.play_state and self.action_type == 'normal') or len(self.curr_hand) == 0:
+        self.counted_play = True
+        freeturncard = self.tags['a_anotherturn']
+        # A card which leaves a decision pending keeps the turn going until it's made, even if the hand is empty.
+        if self.action_type == Decision.NORMAL and (self.cards_played >= self.play_state or len(self.curr_hand) == 0):
             if not self.free_turn:
                 self.inc_player_state()
                 self.curr_hand.draw(self.draw_state)
@@ -72,6 +159,7 @@ class Board:
             # In strict rules, the turn ends when you play your last card. Some players are lenient on
             # this and allow people to take a free action after their last play.
             self.cards_played = 0
+            self.counted_play = False
             self.cards_drawn = self.draw_state
             self.check_starts()
 
@@ -86,12 +174,78 @@ class Board:
 
     class IllegalPlay(IllegalMove):
         """
-        Thrown when the player tries to play a card in an illegal way. Undoes the card_played effect.
+        Thrown when the player tries to play a card in an illegal way. If the play was counted, `Board.illegal()`
+        takes the count back before this is raised.
         """
 
         def __init__(self, board, *args):
             super(Board.IllegalPlay, self).__init__(board, *args)
-            self.board.cards_played -= 1
+
+    class Result:
+        """
+        What came of a call to `Board.action`. Only boards made with `exceptions=False` ever return an illegal or winning
+        result; otherwise those are raised as `Board.IllegalMove` and `Board.Win`.
+
+        :status: One of 'ok', 'illegal' or 'win'.
+        :reason: Why the move was illegal, if it was.
+        :winner: The player who won, if someone did.
+        """
+
+        def __init__(self, status, reason=None, winner=None):
+            self.status = status
+            self.reason = reason
+            self.winner = winner
+
+        @property
+        def ok(self):
+            return self.status == 'ok'
+
+        @property
+        def illegal(self):
+            return self.status == 'illegal'
+
+        @property
+        def won(self):
+            return self.status == 'win'
+
+        def __repr__(self):
+            if self.status == 'illegal':
+                return f'Result(illegal: {self.reason})'
+            if self.status == 'win':
+                return f'Result(win: Player {self.winner})'
+            return 'Result(ok)'
+
+    def illegal(self, reason, play=False):
+        """
+        Refuses the move being made. If the move was a card play, the play is rolled back first. Raises
+        `Board.IllegalPlay` or `Board.IllegalMove`, unless the board was made with `exceptions=False`, in which case the
+        reason is recorded in `rejection` and an illegal `Board.Result` is returned. Callers must then stop what they
+        were doing.
+
+        :param reason: str
+        :param play: bool Whether the move being refused was a card play.
+        :return: Board.Result
+        """
+        if play:
+            self.rollback_play()
+        if self.exceptions:
+            if play:
+                raise Board.IllegalPlay(self, reason)
+            raise Board.IllegalMove(self, reason)
+        self.rejection = reason
+        return Board.Result('illegal', reason=reason)
+
+    def rollback_play(self):
+        """
+        Undoes the count of a card play which turned out to be illegal, if it was counted. A play is only counted once
+        it has gone through (see `act_normal`), so `counted_play` says whether there's anything to take back: it's set
+        by `inc_cards_played` and cleared at the start of every action and whenever the turn passes.
+
+        :return: NoneType
+        """
+        if self.counted_play:
+            self.cards_played -= 1
+            self.counted_play = False
 
     def inc_player_state(self):
         """
@@ -101,18 +255,29 @@ class Board:
         """
         self.turn_num += 1
         self.player_state = self.turn_num % self.num_players
+        self.publish('turn', self.player_state)
 
     def check_goal(self):
         """
-        Checks to see if the goal has been satisfied. If it has, then it throws a win.
+        Checks to see if the goal has been satisfied. If it has, then the winner is recorded and it throws a win. With
+        `exceptions=False` the winner is returned instead. A goal is only evaluated when `goal_tracker` has someone who
+        isn't missing any cards for it, so most checks never look at the table at all.
 
-        :return: NoneType
+        :return: int or NoneType
         """
         if self.goals:
+            players = range(self.num_players)
             for goal in self.goals:
+                if all(self.goal_tracker.missing(player, goal) for player in players):
+                    continue
                 winner = goal.evaluate
                 if winner is not None:
-                    raise Board.Win(f'Player {winner}')
+                    self.winner = winner
+                    self.winning_goal = goal
+                    if self.exceptions:
+                        raise Board.Win(f'Player {winner}')
+                    return winner
+        return None
 
     def check_rules(self):
         """
@@ -123,12 +288,44 @@ class Board:
         if self.rules:
             for rule in self.rules.ruleset:
                 rule()
+        if self.action_type == Decision.DOITAGAIN and not self.options:
+            # A draw can shuffle the discard pile back into the deck while the card to play again is being chosen, and
+            # then there's nothing left to choose from.
+            self.finish_decision()
         if self.draw_state > self.cards_drawn > 0:
             self.curr_hand.draw(self.draw_state - self.cards_drawn)
             self.cards_drawn += (self.draw_state - self.cards_drawn)
-        if self.cards_played >= self.play_state:
+        # The turn can only end while nothing else is pending. An empty hand ends it too: a turn only starts with one
+        # once the deck and the discard pile have run out, and with nothing to play it's over, just as it is when the
+        # last card is played.
+        if self.action_type == Decision.NORMAL and (self.cards_played >= self.play_state or len(self.curr_hand) == 0):
             self.inc_cards_played()
 
+    @property
+    def settled(self):
+        """
+        What running the rules can change about the options: the board's version, which goes up with every event, the
+        pending decision and who is making it.
+
+        :return: tuple
+        """
+        return self.version, self.action_type, self.active_player
+
+    def settle_rules(self):
+        """
+        Runs `check_rules` until a pass changes nothing, so that the options published after an action are the ones
+        the next action is checked against. The goals are checked after every pass that changed something, since the
+        rules can play cards by themselves. Gives up after `SETTLE_PASSES` passes, in which case the next action is
+        turned down and the rules get another pass.
+
+        :return: NoneType
+        """
+        for _ in range(SETTLE_PASSES):
+            before = self.settled
+            self.check_rules()
+            if self.rejection is not None or self.settled == before or self.check_goal() is not None:
+                return
+
     class Win(Exception):
         """
         Thrown when the game is won.
@@ -147,18 +344,222 @@ class Board:
         starts = [rule for rule in self.rules if isinstance(rule, Start)]
         for card in starts:
             card.start()
+            if self.rejection is not None:
+                break
 
     @property
     def card_set(self):
         """
-        Gives a list of all the cards in the game.
+        Gives a list of all the cards in the game, in card id order. To find a particular card, look it up by name in
+        `registry`, by tag in `tags` or by id in `card_table` instead.
 
         :return: list
         """
-        cards_in_hand = list(chain.from_iterable(self.hands))
-        cards_in_keeps = list(chain.from_iterable(self.hands))
-        cards_not_in_play = self.deck.values + self.trash.values
-        return cards_in_hand + cards_in_keeps + cards_not_in_play + list(self.rules.cards) + list(self.goals.cards)
+        return list(self.card_table)
+
+    def locate(self, card, zone):
+        """
+        Records that `card` is being put into `zone`, taking it out of wherever it was before. Every zone calls this as
+        a card goes in, so a card is only ever in one place and finding it never takes a search.
+
+        :param card: Card
+        :param zone: Deck, Hand or CardSpace
+        :return: NoneType
+        """
+        card_id = card.id
+        previous = self.locations[card_id]
+        if previous is not None:
+            self.locations[card_id] = None
+            previous.evict(card)
+        self.locations[card_id] = zone
+        return previous
+
+    def unlocate(self, card, zone):
+        """
+        Records that `card` has been taken out of `zone` without being put anywhere else yet.
+
+        :param card: Card
+        :param zone: Deck, Hand or CardSpace
+        :return: NoneType
+        """
+        if self.locations[card.id] is zone:
+            self.locations[card.id] = None
+            self.publish('move', card, zone, None)
+
+    def push_temphand(self, size, decision):
+        """
+        Sets `size` cards aside from the top of the deck for a decision about them (Draw 3 Play 2, Everybody Gets 1), and
+        makes that the decision the game is waiting on, unless the deck and the discard pile have run out and there's
+        nothing to set aside. The temp hands form a stack, so a card played from a temp hand can set aside a temp hand
+        of its own. A temp hand only takes what's left in the deck, without shuffling the discard pile back in:
+        otherwise, once every other card is out of play, Draw 2 and Use 'Em, Draw 3, Play 2 of Them and Let's Do That
+        Again! can keep drawing and playing each other back for ever. Hands are reused from `temphand_pool` once
+        they've been resolved, so only as many are ever made as are set aside at the same time.
+
+        :param size: int
+        :param decision: Decision
+        :return: Hand
+        """
+        hand = self.temphand_pool.pop() if self.temphand_pool else Hand.temphand(0, self)
+        hand.cards_played = 0
+        hand.decision = decision
+        hand.draw(size, reshuffle=False)
+        self.temphands.append(hand)
+        self.action_type = decision
+        if size and len(hand) == 0:
+            self.resolve_temphand(hand)
+        return hand
+
+    def resolve_temphand(self, hand):
+        """
+        Finishes with a temp hand. Any cards left in it are discarded, it goes back to the pool, and the game returns to
+        the decision about the temp hand below it, or to normal play if there isn't one (see `finish_decision`).
+
+        :param hand: Hand
+        :return: NoneType
+        """
+        for card in list(hand):
+            hand.discard(card)
+        for i in range(len(self.temphands) - 1, -1, -1):
+            if self.temphands[i] is hand:
+                del self.temphands[i]
+                break
+        self.temphand_pool.append(hand)
+        self.finish_decision()
+
+    def temphand_done(self, hand):
+        """
+        Whether everything there is to do with a temp hand has been done: it's empty, or as many of its cards have been
+        played (Draw 3 Play 2) or handed out (Everybody Gets 1) as the card said.
+
+        :param hand: Hand
+        :return: bool
+        """
+        if len(hand) == 0:
+            return True
+        if hand.decision == Decision.EVERYBODY1:
+            return hand.cards_played >= self.num_players * (1 + self.tags['a_everybody1'].numeral)
+        return hand.cards_played >= 2 + ('Inflation' in {rule.name for rule in self.rules})
+
+    def finish_decision(self):
+        """
+        Called once a decision has been made. The game goes back to the decision about the top temp hand, since a card
+        played from a temp hand can open a decision of its own, or to normal play if no cards are set aside. A temp
+        hand which was finished with while such a decision was still open is resolved now.
+
+        :return: NoneType
+        """
+        if self.temphands and self.temphand_done(self.temphands[-1]):
+            self.resolve_temphand(self.temphands[-1])
+            return
+        self.action_type = self.temphands[-1].decision if self.temphands else Decision.NORMAL
+
+    def subscribe(self, event, handler):
+        """
+        Calls `handler` every time `event` happens. The events are:
+
+        :move: A card went from one zone to another, as `handler(card, source, destination)`. Either zone can be None
+               while a card is in flight, such as a card drawn from the deck on its way to a hand.
+        :turn: A new turn started, as `handler(player)`.
+        :numeral: Inflation came or went, as `handler(numeral)`.
+
+        The trackers and the rules in play keep themselves up to date this way, and anything else (a logger, a UI, a
+        statistics collector) can listen in just the same.
+
+        :param event: str
+        :param handler: function
+        :return: NoneType
+        """
+        self.subscribers.setdefault(event, []).append(handler)
+
+    def unsubscribe(self, event, handler):
+        """
+        :param event: str
+        :param handler: function
+        :return: NoneType
+        """
+        self.subscribers[event].remove(handler)
+
+    def publish(self, event, *args):
+        """
+        Tells everything subscribed to `event` that it happened.
+
+        :param event: str
+        :return: NoneType
+        """
+        self.version += 1
+        handlers = self.subscribers.get(event)
+        if handlers:
+            for handler in handlers:
+                handler(*args)
+
+    def moved_all(self, cards, source, destination):
+        """
+        Records that `cards` have all gone from `source` to `destination` at once, for the moves of a whole zone's
+        contents. The location index is brought up to date for all of them first, and then the 'move' subscribers hear
+        about each card in turn, so the bookkeeping costs one pass over the cards rather than a `publish` apiece.
+
+        :param cards: list[Card]
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
+        :return: NoneType
+        """
+        self.version += 1
+        locations = self.locations
+        for card in cards:
+            locations[card.id] = destination
+        handlers = self.subscribers.get('move')
+        if handlers:
+            for card in cards:
+                for handler in handlers:
+                    handler(card, source, destination)
+
+    def zone_of(self, card):
+        """
+        Gives the zone that `card` is in, or None if it's in none of them (while it's being played, for instance).
+
+        :param card: Card
+        :return: Deck, Hand, CardSpace or NoneType
+        """
+        return self.locations[card.id]
+
+    def where(self, card):
+        """
+        Gives where `card` is as a pair of the kind of zone ('deck', 'trash', 'hand', 'aside', 'keep', 'rules' or
+        'goals') and the player who owns it, if anyone does.
+
+        :param card: Card
+        :return: tuple[str or NoneType, int or NoneType]
+        """
+        zone = self.locations[card.id]
+        if zone is None:
+            return None, None
+        return zone.location, getattr(zone, 'player_num', None)
+
+    def keep_of(self, card):
+        """
+        Gives the `Keep` that `card` is in.
+
+        :param card: Keeper
+        :return: Keep
+        """
+        zone = self.locations[card.id]
+        if not isinstance(zone, Keep):
+            raise LookupError(f"{card} isn't in anyone's keep.")
+        return zone
+
+    def move(self, card, zone):
+        """
+        Puts `card` into `zone` wherever it is now, without any of the game's rules for playing or discarding it.
+
+        :param card: Card
+        :param zone: Deck, Hand or CardSpace
+        :return: NoneType
+        """
+        if isinstance(zone, Deck):
+            zone.append(card)
+        else:
+            zone.put(card)
 
     @property
     def curr_hand(self):
@@ -191,74 +592,22 @@ class Board:
     def options(self):
         """
         Gives a list of the actions that the active player can take.
-        Depends greatly on the current `action_type`
+        Depends greatly on the current `action_type`, whose handler in `option_handlers` builds the list.
 
         :return: list
         """
-        if self.action_type == 'normal':
-            return list(self.curr_hand) + list(self.special_actions)
-        elif self.action_type == 'handlimit':
-            return list(self.curr_hand)
-        elif self.action_type == 'keeperlimit':
-            return list(self.curr_keep)
-        elif self.action_type == 'goalmill':
-            return [card for card in list(self.curr_hand) if isinstance(card, Goal)]
-        elif self.action_type == 'recycling':
-            return list(self.curr_keep)
-        elif self.action_type == 'play2':
-            return list(self.temphands[-1])
-        elif self.action_type == 'zap':
-            return list(chain.from_iterable(self.keeps)) + list(self.goals) + list(self.rules)
-        elif self.action_type == 'goalremove':
-            return list(self.goals)
-        elif self.action_type == 'rotate':
-            return [1, -1]
-        elif self.action_type == 'doitagain':
-            return [card for card in self.trash if (isinstance(card, Action) or isinstance(card, Rule))]
-        elif self.action_type == 'steal':
-            return list(chain.from_iterable(keep for keep in self.keeps if keep.player_num != self.active_player))
-        elif self.action_type == 'simplify':
-            return list(self.rules)
-        elif self.action_type == 'trash':
-            return list(chain.from_iterable(self.keeps))
-        elif self.action_type == 'exchange1':
-            return list(chain.from_iterable(keep for keep in self.keeps if keep.player_num != self.active_player))
-        elif self.action_type == 'exchange2':
-            return list(self.curr_keep)
-        elif self.action_type == 'trade':
-            return list(p for p in range(self.num_players) if p != self.active_player)
-        elif self.action_type == 'usetake':
-            return [player for player in list(range(self.num_players)) if player != self.active_player]
+        return self.option_handlers[self.action_type](self)
 
     @property
     def info(self):
         """
-        Gives a dictionary telling the player what they need to know.
-
-        :draws: How many draws are allowed.
-        :plays: How many plays are allowed.
-        :player: The active player.
-        :keeps: A list of the Keeps in the game.
-        :goals: The `GoalSpace` for the game.
-        :rules: The `RuleSpace` for the game.
-        :discard: The discard pile.
-        :hand: The active player's hand.
-        :options: A list of the things that the active player is allowed to do.
-        :actiontype: The current type of action that the active player must perform.
-        :mystery: A description of the most recent MysteryPlay, if there was one.
-        :remaining: The number of plays the active player has remaining.
-        :drawn: The number of cards that hte active player has drawn.
+        Gives a read-only mapping telling the player what they need to know. It can be used like a dictionary, but
+        each field is only worked out when it's first looked up, and is kept until the board changes. See `BoardInfo`
+        for the fields. Use `dict(board.info)` for a copy that won't follow the game.
 
-        :return: dict
+        :return: BoardInfo
         """
-        remaining = self.play_state - self.cards_played
-        if remaining < 0:
-            remaining = 0
-        return {'draws': self.draw_state, 'plays': self.play_state, 'player': self.active_player,
-                'keeps': self.keeps, 'goals': self.goals, 'rules': self.rules,
-                'discard': self.trash, 'hand': self.hands[self.active_player], 'options': self.options,
-                'actiontype': self.action_type, 'mystery': self.mysteryplay,
-                'remaining': remaining, 'drawn': self.cards_drawn}
+        return self._info
 
     @property
     def draw_state(self):
@@ -296,205 +645,522 @@ class Board:
         The method which advances the game.
 
         :param option: int The index of the option (from `board.options`) which the player would like to perform.
-        :return: NoneType
-        """
+        :return: Board.Result
+        """
+        self.version += 1
+        self.rejection = None
+        self.counted_play = False
+        if not self.exceptions and self.winner is not None:
+            return Board.Result('win', winner=self.winner)
+        before = self.settled
+        self.check_rules()
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+        if self.settled != before:
+            # Every action settles the rules before it returns, so this only happens to a board which was set up or
+            # changed some other way, or whose rules didn't settle in `SETTLE_PASSES`. The option was picked from
+            # options which no longer stand.
+            return self.illegal('The rules changed the options. Choose again.')
+        if not self.exceptions:
+            reason = self.check_option(option)
+            if reason is not None:
+                return self.illegal(reason)
         hand = self.curr_hand
         keep = self.curr_keep
-        self.check_rules()
-        if self.action_type == 'normal':
-            pick = self.options[option]
-            if pick in self.curr_hand:
-                pick.play()
-                self.inc_cards_played()
-            elif isinstance(pick, FreeAction):
-                pick.effect()
+        result = self.action_handlers[self.action_type](self, option, hand, keep)
+        if result is not None:
+            return result
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+        if self.check_goal() is not None:
+            return Board.Result('win', winner=self.winner)
+        self.settle_rules()
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+        if self.winner is not None:
+            return Board.Result('win', winner=self.winner)
+        return Board.Result('ok')
+
+    def check_option(self, option):
+        """
+        Checks that `option` indexes into `board.options`, or is a list of such indexes for the decisions which take
+        one. Decisions which can legally be made with nothing to choose from accept anything when there are no options.
+
+        :param option: int or list[int]
+        :return: str or NoneType The reason the option is unacceptable, if it is.
+        """
+        options = self.options
+        if options is None:
+            return None
+        picks = option if isinstance(option, list) and self.action_type in MULTI_SELECT else [option]
+        if not options and self.action_type in EMPTY_OK:
+            return None
+        for pick in picks:
+            if not isinstance(pick, int) or not -len(options) <= pick < len(options):
+                return "That isn't an available option."
+        return None
 
-        elif self.action_type == 'handlimit':
-            card = self.options[option]
-            hand.discard(card)
+    def picked(self, option):
+        """
+        The cards picked for a decision which takes a list of options, each once. They're all looked up before any of
+        them moves, so that taking one doesn't shift the indexes of the rest. A single index counts as a list of one,
+        and anything at all counts as none when there's nothing to choose from.
 
-        elif self.action_type == 'keeperlimit':
-            card = self.options[option]
-            keep.discard(card)
-
-        elif self.action_type == 'goalmill':
-            if isinstance(option, int):
-                option = [option]
-            for pick in option:
-                card = self.options[pick]
-                hand.discard(card)
-                hand.draw(1)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'recycling':
-            self.options[option].trash()
-            recyclingcard = [card for card in self.card_set if card.tag == 'fa_recycling'][0]
-            hand.draw(3 + recyclingcard.numeral)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'play2':
-            tarhand = self.temphands[-1]
-            card = self.options[option]
-            card.play()
-            if card in tarhand:
-                tarhand.discard(card)
-            tarhand.cards_played += 1
-            if tarhand.cards_played == 2 + ('Inflation' in {rule.name for rule in self.rules}):
-                self.action_type = 'normal'
-
-        elif self.action_type == 'everybody1':
-            everybodycard = [card for card in self.card_set if card.tag == 'a_everybody1'][0]
-            temphand = self.temphands[-1]
-            tarplayer = temphand.cards_played // (1 + everybodycard.numeral)
-            tarhand = self.hands[tarplayer]
-            if everybodycard.numeral:
-                for pick in option:
-                    card = self.options[pick]
-                    temphand.discard(card)
-                    tarhand.add(card)
-                    temphand.cards_played += 1
-            else:
-                card = self.options[option]
-                temphand.discard(card)
-                tarhand.add(card)
-                temphand.cards_played += 1
+        :param option: int or list[int]
+        :return: list[Card]
+        """
+        options = self.options
+        if not options:
+            return []
+        picks = option if isinstance(option, list) else [option]
+        return list(dict.fromkeys(options[pick] for pick in picks))
 
-            if len(temphand) == 0 or temphand.cards_played >= (self.num_players * (1 + everybodycard.numeral)):
-                self.action_type = 'normal'
+    # The handlers for each kind of decision. `Board.options` and `Board.action` look the current `action_type` up in
+    # these tables, so adding a new kind of decision only takes a `Decision` member and a handler registered with
+    # `handles` for each table. An action handler takes the option chosen along with the hand and keep of the player
+    # who chose it, and can return a `Board.Result` to finish the action early.
 
-        elif self.action_type == 'zap':
-            pick = self.options[option]
-            if isinstance(pick, Keeper):
-                tarkeep = [keep for keep in self.keeps if pick in keep][0]
-                tarkeep.cards.discard(pick)
-            if isinstance(pick, Goal):
-                self.goals.discard(pick)
-            if isinstance(pick, Rule):
-                self.rules.discard(pick)
-            self.curr_hand.add(pick)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'goalremove':
-            pick = self.options[option]
-            pick.trash()
-            self.action_type = 'normal'
+    @handles(option_handlers, Decision.NORMAL)
+    def options_normal(self):
+        return list(self.curr_hand) + list(self.special_actions)
 
-        elif self.action_type == 'rotate':
-            pick = self.options[option]
-            assert isinstance(pick, int)  # This is to shut up my IDE's typechecker
-            temp = [[]] * self.num_players
-            for hand in self.hands:
-                for card in hand:
-                    temp[hand.player_num].append(card)
-            for player in range(self.num_players):
-                tarplayer = (player + pick) % self.num_players
-                for card in temp[player]:
-                    tarhand = self.hands[tarplayer]
-                    tarhand.add(card)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'doitagain':
-            pick = self.options[option]
-            self.action_type = 'normal'
+    @handles(option_handlers, Decision.HANDLIMIT)
+    def options_handlimit(self):
+        return list(self.curr_hand)
+
+    @handles(option_handlers, Decision.KEEPERLIMIT)
+    def options_keeperlimit(self):
+        return list(self.curr_keep)
+
+    @handles(option_handlers, Decision.GOALMILL)
+    def options_goalmill(self):
+        return [card for card in list(self.curr_hand) if isinstance(card, Goal)]
+
+    @handles(option_handlers, Decision.RECYCLING)
+    def options_recycling(self):
+        return list(self.curr_keep)
+
+    @handles(option_handlers, Decision.PLAY2)
+    def options_play2(self):
+        return list(self.temphands[-1])
+
+    @handles(option_handlers, Decision.EVERYBODY1)
+    def options_everybody1(self):
+        return list(self.temphands[-1])
+
+    @handles(option_handlers, Decision.ZAP)
+    def options_zap(self):
+        return list(chain.from_iterable(self.keeps)) + list(self.goals) + list(self.rules)
+
+    @handles(option_handlers, Decision.GOALREMOVE)
+    def options_goalremove(self):
+        return list(self.goals)
+
+    @handles(option_handlers, Decision.ROTATE)
+    def options_rotate(self):
+        return [1, -1]
+
+    @handles(option_handlers, Decision.DOITAGAIN)
+    def options_doitagain(self):
+        # Played out of the discard pile, Let's Do That Again! would find itself there.
+        return [card for card in self.trash
+                if (isinstance(card, Action) or isinstance(card, Rule)) and card.tag != 'a_dothatagain']
+
+    @handles(option_handlers, Decision.STEAL)
+    def options_steal(self):
+        return list(chain.from_iterable(keep for keep in self.keeps if keep.player_num != self.active_player))
+
+    @handles(option_handlers, Decision.SIMPLIFY)
+    def options_simplify(self):
+        return list(self.rules)
+
+    @handles(option_handlers, Decision.TRASH)
+    def options_trash(self):
+        return list(chain.from_iterable(self.keeps))
+
+    @handles(option_handlers, Decision.EXCHANGE1)
+    def options_exchange1(self):
+        return list(chain.from_iterable(keep for keep in self.keeps if keep.player_num != self.active_player))
+
+    @handles(option_handlers, Decision.EXCHANGE2)
+    def options_exchange2(self):
+        return list(self.curr_keep)
+
+    @handles(option_handlers, Decision.TRADE)
+    def options_trade(self):
+        return list(p for p in range(self.num_players) if p != self.active_player)
+
+    @handles(option_handlers, Decision.USETAKE)
+    def options_usetake(self):
+        return [player for player in list(range(self.num_players)) if player != self.active_player]
+
+    @handles(action_handlers, Decision.NORMAL)
+    def act_normal(self, option, hand, keep):
+        pick = self.options[option]
+        if pick in self.curr_hand:
             pick.play()
-            self.trash.remove(pick)
-            self.trash.append(pick)
+            if self.rejection is None:
+                self.inc_cards_played()
+        elif isinstance(pick, FreeAction):
+            pick.effect()
+
+    @handles(action_handlers, Decision.HANDLIMIT)
+    def act_handlimit(self, option, hand, keep):
+        card = self.options[option]
+        hand.discard(card)
+
+    @handles(action_handlers, Decision.KEEPERLIMIT)
+    def act_keeperlimit(self, option, hand, keep):
+        card = self.options[option]
+        card.trash()
+
+    @handles(action_handlers, Decision.GOALMILL)
+    def act_goalmill(self, option, hand, keep):
+        for card in self.picked(option):
+            hand.discard(card)
+            hand.draw(1)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.RECYCLING)
+    def act_recycling(self, option, hand, keep):
+        self.options[option].trash()
+        recyclingcard = self.tags['fa_recycling']
+        hand.draw(3 + recyclingcard.numeral)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.PLAY2)
+    def act_play2(self, option, hand, keep):
+        tarhand = self.temphands[-1]
+        card = self.options[option]
+        card.play()
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+        if card in tarhand:
+            tarhand.discard(card)
+        tarhand.cards_played += 1
+        # A card which opened a decision of its own leaves the temp hand to `finish_decision` once that's made.
+        if self.temphands[-1] is tarhand and self.action_type == Decision.PLAY2:
+            self.finish_decision()
+
+    @handles(action_handlers, Decision.EVERYBODY1)
+    def act_everybody1(self, option, hand, keep):
+        everybodycard = self.tags['a_everybody1']
+        temphand = self.temphands[-1]
+        tarplayer = temphand.cards_played // (1 + everybodycard.numeral)
+        tarhand = self.hands[tarplayer]
+        cards = self.picked(option)
+        # With Inflation each player gets 2 cards, which they can take together or one at a time.
+        share = 1 + everybodycard.numeral
+        if not cards or len(cards) > share - temphand.cards_played % share:
+            return self.illegal(f'Choose {share - temphand.cards_played % share} card(s) for player {tarplayer}.')
+        for card in cards:
+            tarhand.add(card)
+            temphand.cards_played += 1
+
+        if self.temphand_done(temphand):
+            self.resolve_temphand(temphand)
+
+    @handles(action_handlers, Decision.ZAP)
+    def act_zap(self, option, hand, keep):
+        pick = self.options[option]
+        if isinstance(pick, Keeper):
+            self.keep_of(pick).discard(pick)
+        if isinstance(pick, Goal):
+            self.goals.discard(pick)
+        if isinstance(pick, Rule):
+            self.rules.discard(pick)
+            pick.repeal()
+        self.curr_hand.add(pick)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.GOALREMOVE)
+    def act_goalremove(self, option, hand, keep):
+        pick = self.options[option]
+        pick.trash()
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.ROTATE)
+    def act_rotate(self, option, hand, keep):
+        pick = self.options[option]
+        assert isinstance(pick, int)  # This is to shut up my IDE's typechecker
+        rotate_zones(self.hands, pick)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.DOITAGAIN)
+    def act_doitagain(self, option, hand, keep):
+        pick = self.options[option]
+        self.finish_decision()
+        pick.play()
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+
+    @handles(action_handlers, Decision.STEAL)
+    def act_steal(self, option, hand, keep):
+        pick = self.options[option]
+        self.keep_of(pick).discard(pick)
+        self.curr_keep.add(pick)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.SIMPLIFY)
+    def act_simplify(self, option, hand, keep):
+        cards = self.picked(option)
+        if cards and len(cards) >= ceil(len(self.rules) / 2):
+            return self.illegal('You can only remove up to half of the Rule cards in play.')
+        for card in cards:
+            card.trash()
+        self.finish_decision()
 
-        elif self.action_type == 'steal':
+    @handles(action_handlers, Decision.TRASH)
+    def act_trash(self, option, hand, keep):
+        if len(self.options) > 0:
             pick = self.options[option]
-            tarkeep = [keep for keep in self.keeps if pick in keep][0]
-            tarkeep.cards.discard(pick)
-            self.curr_keep.add(pick)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'simplify':
-            if option:
-                if not isinstance(option, iter):
-                    option = [option]
-                if len(option) >= ceil(len(self.rules) / 2):
-                    raise Board.IllegalMove('You can only remove up to half of the Rule cards in play.')
-                for pick in option:
-                    pick = self.options[pick]
-                    pick.trash()
-            self.action_type = 'normal'
-
-        elif self.action_type == 'trash':
-            if len(self.options) > 0:
-                pick = self.options[option]
-                pick.trash()
-            self.action_type = 'normal'
-
-        elif self.action_type == 'exchange1':
-            if len(self.options) > 0 and len(self.curr_keep) > 0:
-                pick = self.options[option]
-                tarhand = [hand for hand in self.hands if pick in hand][0]
-                tarhand.cards.discard(pick)
-                self.exchange_space = tarhand.player_num, pick
-                self.action_type = 'exchange2'
-            else:
-                self.action_type = 'normal'
+            pick.trash()
+        self.finish_decision()
 
-        elif self.action_type == 'exchange2':
+    @handles(action_handlers, Decision.EXCHANGE1)
+    def act_exchange1(self, option, hand, keep):
+        if len(self.options) > 0 and len(self.curr_keep) > 0:
             pick = self.options[option]
-            tarplayer, other = self.exchange_space
-            self.exchange_space = None
-            self.curr_hand.add(other)
-            self.curr_hand.cards.discard(pick)
-            tarhand = self.hands[tarplayer]
-            tarhand.add(pick)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'trade':
-            pick = self.options[option]  # This seems weird, but it's because it'll
-            # throw an exception for the engine to catch automatically.
-            temp = [[], []]
-            assert isinstance(pick, int)
-            tarhand = self.hands[pick]
-            for card in self.curr_hand:
-                temp[0].append(card)
-            for card in tarhand:
-                temp[1].append(card)
-            for card in temp[0]:
-                tarhand.add(card)
-                self.curr_hand.discard(card)
-            for card in temp[1]:
-                self.curr_hand.add(card)
-                tarhand.discard(card)
-            self.action_type = 'normal'
-
-        elif self.action_type == 'usetake':
-            pick = self.options[option]
-            assert isinstance(pick, int)
-            tarhand = self.hands[pick]
-            card = choice(list(tarhand))
-            card.play()
-            self.action_type = 'normal'
+            tarkeep = self.keep_of(pick)
+            tarkeep.discard(pick)
+            self.exchange_space = tarkeep.player_num, pick
+            self.action_type = Decision.EXCHANGE2
+        else:
+            self.finish_decision()
 
-        self.check_goal()
-        self.check_rules()
+    @handles(action_handlers, Decision.EXCHANGE2)
+    def act_exchange2(self, option, hand, keep):
+        pick = self.options[option]
+        tarplayer, other = self.exchange_space
+        self.exchange_space = None
+        self.curr_keep.add(other)
+        self.keeps[tarplayer].add(pick)
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.TRADE)
+    def act_trade(self, option, hand, keep):
+        pick = self.options[option]  # This seems weird, but it's because it'll
+        # throw an exception for the engine to catch automatically.
+        assert isinstance(pick, int)
+        self.curr_hand.swap(self.hands[pick])
+        self.finish_decision()
+
+    @handles(action_handlers, Decision.USETAKE)
+    def act_usetake(self, option, hand, keep):
+        pick = self.options[option]
+        assert isinstance(pick, int)
+        tarhand = self.hands[pick]
+        if len(tarhand) == 0:
+            # There's nothing to take.
+            self.finish_decision()
+            return
+        card = self.rng.choice(list(tarhand))
+        card.play()
+        if self.rejection is not None:
+            return Board.Result('illegal', reason=self.rejection)
+        # Unless the card opened a decision of its own, another Use What You Take included.
+        if self.action_type == Decision.USETAKE and card.tag != 'a_usetake':
+            self.finish_decision()
+
+
+class CardDef:
+    __slots__ = ('id', 'kind', 'name', 'tag', 'hash', 'inflates', 'number', 'reqs', 'target')
+
+    def __init__(self, card_id, kind, name, tag, inflates=False, number=None, reqs=None, target=None):
+        """
+        Everything printed on a card, which is the same in every game. The definitions are built once, from
+        `assets.py`, into `CARD_DEFS` and shared by every `Board` in the process; a board's `Card`s only point at them.
+        They're never changed after they're built.
+
+        :param card_id: int The card's index in `CARD_DEFS`, and in every board's `card_table` and `locations`.
+        :param kind: type The `Card` subclass which plays the card.
+        :param name: str
+        :param tag: object What the card is known by in `board.tags`.
+        :param inflates: bool Whether the card has a number on it that Inflation adds to.
+        :param number: int or NoneType The number on the card before Inflation, if it has one.
+        :param reqs: tuple[str] or NoneType What a Goal needs.
+        :param target: type or NoneType The zone a Limit limits.
+        """
+        self.id = card_id
+        self.kind = kind
+        self.name = name
+        self.tag = tag
+        self.hash = crc32(name.encode())
+        self.inflates = inflates
+        self.number = number
+        self.reqs = reqs
+        self.target = target
+
+    def __reduce__(self):
+        # A pickled card comes back pointing at this process's copy of its definition.
+        return card_def, (self.id,)
+
+    def __repr__(self):
+        return f'CardDef({self.id}, {self.name})'
+
+
+def card_def(card_id):
+    """
+    Gives the shared definition of the card with id `card_id`.
+
+    :param card_id: int
+    :return: CardDef
+    """
+    return CARD_DEFS[card_id]
+
+
+class Registry(Mapping):
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        """
+        A read-only mapping from card names (or tags) to one board's cards. The index from each key to a card id is
+        shared by every board, so a board's lookups cost it nothing but this view.
+
+        :param table: list[Card] The board's `card_table`.
+        :param index: dict[object, int]
+        """
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.table[self.index[key]]
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+
+class BoardInfo(Mapping):
+    __slots__ = ('board', 'version', 'cache')
+
+    # How each field is worked out.
+    fields = {
+        'draws': lambda board: board.draw_state,
+        'plays': lambda board: board.play_state,
+        'player': lambda board: board.active_player,
+        'keeps': lambda board: board.keeps,
+        'goals': lambda board: board.goals,
+        'rules': lambda board: board.rules,
+        'discard': lambda board: board.trash,
+        'hand': lambda board: board.hands[board.active_player],
+        'options': lambda board: board.options,
+        'actiontype': lambda board: board.action_type,
+        'mystery': lambda board: board.mysteryplay,
+        'remaining': lambda board: max(0, board.play_state - board.cards_played),
+        'drawn': lambda board: board.cards_drawn,
+    }
+
+    def __init__(self, board):
+        """
+        What `Board.info` gives: a view of the board which works each field out on first access and keeps it until
+        the board next takes an action or publishes an event, which `board.version` counts.
+
+        :draws: How many draws are allowed.
+        :plays: How many plays are allowed.
+        :player: The active player.
+        :keeps: A list of the Keeps in the game.
+        :goals: The `GoalSpace` for the game.
+        :rules: The `RuleSpace` for the game.
+        :discard: The discard pile.
+        :hand: The active player's hand.
+        :options: A list of the things that the active player is allowed to do.
+        :actiontype: The current type of action that the active player must perform.
+        :mystery: A description of the most recent MysteryPlay, if there was one.
+        :remaining: The number of plays the active player has remaining.
+        :drawn: The number of cards that hte active player has drawn.
+
+        :param board: Board
+        """
+        self.board = board
+        self.version = None
+        self.cache = {}
+
+    def __getitem__(self, key):
+        if self.version != self.board.version:
+            self.cache.clear()
+            self.version = self.board.version
+        try:
+            return self.cache[key]
+        except KeyError:
+            value = self.cache[key] = self.fields[key](self.board)
+            return value
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f'BoardInfo({dict(self)})'
 
 
 class Card:
-    def __init__(self, board, name):
+    # Every card and zone is slotted. A game holds over a hundred cards and a dozen zones, and a process may hold many
+    # games, so none of them carries a per-instance `__dict__`. New attributes have to be added to `__slots__`.
+    __slots__ = ('_board', '_def')
+
+    def __init__(self, board, definition):
         """
-        A Card object. Represents a physical game card. Connected to a `Board`. Must have a name.
+        A Card object. Represents a physical game card. Connected to a `Board`. What's printed on the card is kept in
+        its shared `CardDef`; the Card itself only holds what can change about it during the game.
 
         :param board: Board
-        :param name: str
+        :param definition: CardDef
         """
         # A card has to be connected to a board object. This way each card must be unique to the
         # game it is in, and is always connected to the game that it's initialized for.
         self._board = board
-        self._name = name
-        self.numeral = None
+        self._def = definition
+
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        Builds the definition of a card of this kind from its entry in `assets.py`.
+
+        :param card_id: int
+        :param name: str
+        :param tag: object
+        :return: CardDef
+        """
+        return CardDef(card_id, cls, name, tag)
 
     @property
     def board(self):
         return self._board
 
+    @property
+    def definition(self):
+        return self._def
+
+    @property
+    def id(self):
+        return self._def.id
+
     @property
     def name(self):
-        return self._name
+        return self._def.name
+
+    @property
+    def tag(self):
+        return self._def.tag
+
+    @property
+    def inflates(self):
+        return self._def.inflates
+
+    @property
+    def numeral(self):
+        """
+        What Inflation adds to the numbers on this card. Cards with numbers on them read it from `board.numeral`, so
+        Inflation coming and going never has to touch the cards themselves. Cards without numbers give None.
+
+        :return: int or NoneType
+        """
+        return self.board.numeral if self.inflates else None
 
     @abstractmethod
     def do(self):
@@ -516,12 +1182,13 @@ class Card:
 
     def play(self):
         """
-        Plays the card. Executes `Card.do()` then removes the card from the player's hand.
+        Plays the card. Executes `Card.do()` then removes the card from the player's hand, unless the play was refused.
 
         :return: NoneType
         """
         self.do()
-        self.remove_from_hand()
+        if self.board.rejection is None:
+            self.remove_from_hand()
 
     def remove_from_hand(self):
         """
@@ -529,9 +1196,9 @@ class Card:
 
         :return: NoneType
         """
-        for hand in self.board.hands:
-            if self in hand:
-                hand.cards.discard(self)
+        zone = self.board.zone_of(self)
+        if isinstance(zone, Hand) and zone.location == 'hand':
+            zone.evict(self)
 
     def trash_from_hand(self):
         """
@@ -539,21 +1206,24 @@ class Card:
 
         :return: NoneType
         """
-        for hand in self.board.hands:
-            if self in hand:
-                hand.discard(self)
+        zone = self.board.zone_of(self)
+        if isinstance(zone, Hand) and zone.location == 'hand':
+            zone.discard(self)
 
     def __hash__(self):
-        return hash(self.name + repr(self.board))
+        # Names are unique within a game, so the name alone is enough to hash on. Using a checksum rather than hash()
+        # keeps the order of cards in a set, and so every seeded game, the same from one process to the next.
+        return self._def.hash
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        return isinstance(other, Card) and self.name == other.name and self.board is other.board
 
     def __repr__(self):
         return f'{self.name}'
 
 
 class Keeper(Card):
+    __slots__ = ()
 
     def do(self):
         """
@@ -561,10 +1231,7 @@ class Keeper(Card):
 
         :return: NoneType
         """
-        tar_keep = self.board.curr_keep
-        tar_hand = self.board.curr_hand
-        tar_keep.add(self)
-        tar_hand.cards.discard(self)
+        self.board.curr_keep.add(self)
 
     def trash(self):
         """
@@ -572,8 +1239,7 @@ class Keeper(Card):
 
         :return: NoneType
         """
-        tar_keep = [keep for keep in self.board.keeps if self in keep][0]
-        tar_keep.discard(self)
+        self.board.keep_of(self).discard(self)
         self.board.trash.append(self)
 
     def discard_from_keep(self):
@@ -582,51 +1248,125 @@ class Keeper(Card):
 
         :return: NoneType
         """
-        tarkeep = [keep for keep in self.board.keeps if self in keep][0]
-        tarkeep.discard(self)
+        self.board.keep_of(self).discard(self)
 
-    def __init__(self, board, name):
+    @classmethod
+    def define(cls, card_id, name, tag):
         """
-        A card of the Keeper Class. Subclass of `Card`. Plays to the player's `Keep`.
+        A card of the Keeper Class. Subclass of `Card`. Plays to the player's `Keep`. Known by its name.
 
-        :param board: Board
+        :param card_id: int
         :param name: str
+        :param tag: str
+        :return: CardDef
         """
-        super(Keeper, self).__init__(board, name)
-        self.tag = name
+        return CardDef(card_id, cls, name, name)
 
 
-class Deck(MutableSequence):
-    def __init__(self, board):
+class Zone:
+    """
+    Moves of a whole zone's contents at once, shared by every place a card can be. These hand the zone's container over
+    or extend another one in a single step, rather than taking the cards out one at a time, so they cost O(n) in the
+    cards moved (for the location index and the events) and never search a list.
+    """
+    __slots__ = ()
+
+    def take_all(self):
+        """
+        Empties the zone, without putting the cards anywhere yet.
+
+        :return: list[Card]
+        """
+        cards = list(self.cards)
+        self.cards = type(self.cards)()
+        self.board.moved_all(cards, self, None)
+        return cards
+
+    def receive(self, cards, source=None):
+        """
+        Puts cards which aren't in any other zone into this one.
+
+        :param cards: iterable[Card]
+        :param source: Deck, Hand, CardSpace or NoneType The zone they came from, if they were moved straight here.
+        :return: NoneType
+        """
+        cards = list(cards)
+        if isinstance(self.cards, list):
+            self.cards.extend(cards)
+        else:
+            self.cards.update(cards)
+        self.board.moved_all(cards, source, self)
+
+    def move_all(self, destination):
+        """
+        Moves every card in this zone to `destination`, without any of the game's rules for playing or discarding it.
+
+        :param destination: Deck, Hand or CardSpace
+        :return: NoneType
+        """
+        cards = list(self.cards)
+        self.cards = type(self.cards)()
+        destination.receive(cards, self)
+
+    def swap(self, other):
+        """
+        Exchanges the contents of this zone and `other`.
+
+        :param other: Deck, Hand or CardSpace
+        :return: NoneType
+        """
+        rotate_zones([self, other], 1)
+
+
+def rotate_zones(zones, shift):
+    """
+    Passes the contents of every zone `shift` places along the list, so that zone `i` ends up with what zone
+    `i - shift` had. The containers themselves are passed along, so no card is taken out of one and put in another.
+
+    :param zones: list[Hand or CardSpace]
+    :param shift: int
+    :return: NoneType
+    """
+    n = len(zones)
+    contents = [zone.cards for zone in zones]
+    for i, zone in enumerate(zones):
+        zone.cards = contents[(i - shift) % n]
+    for i, zone in enumerate(zones):
+        zone.board.moved_all(list(zone.cards), zones[(i - shift) % n], zone)
+
+
+class Deck(Zone, MutableSequence):
+    __slots__ = ('values', '_board', 'location')
+
+    def __init__(self, board, _build=True):
         """
         A deck object. A mutable sequence of cards. Connected to a `Board`. Normal construction builds the
         beginning-of-game deck.
 
         :param board: Board
+        :param _build: bool Upon creation, can be set to False to leave the Deck empty.
         """
         super(Deck, self).__init__()
         self.values = []
         self._board = board
-        rule_cats = {'Draw': Draw, 'Play': Play, 'Limit': Limit, 'Free Action': FreeAction,
-                     'Effect': Effect, 'Start': Start}
-        for name in keepers:
-            self.values.append(Keeper(self.board, name))
-        for tag in goals.items():
-            self.values.append(Goal(board, tag))
-
-        for cat in rules:
-            ruleset = list(rules[cat].items())
-            for name, tag in ruleset:
-                self.values.append(rule_cats[cat](self.board, name, tag))
-        for name, tag in actions.items():
-            self.values.append(Action(self.board, name, tag))
-
-        shuffle(self.values)
+        self.location = 'deck'
+        if not _build:
+            return
+        self.values = list(board.card_table)
+        board.rng.shuffle(self.values)
 
     @property
     def board(self):
         return self._board
 
+    @property
+    def cards(self):
+        return self.values
+
+    @cards.setter
+    def cards(self, values):
+        self.values = values
+
     def __getitem__(self, item):
         return self.values[item]
 
@@ -641,18 +1381,34 @@ class Deck(MutableSequence):
         :param board: Board
         :return: Deck
         """
-        disc = Deck(board)
-        disc.values = []
+        disc = Deck(board, _build=False)
+        disc.location = 'trash'
         return disc
 
     def __setitem__(self, key, value):
+        # Only ever used to reorder the deck, so the card is already here.
         self.values[key] = value
+        self.board.locations[value.id] = self
 
     def insert(self, index: int, value):
+        previous = self.board.locate(value, self)
         self.values.insert(index, value)
+        self.board.publish('move', value, previous, self)
 
     def __delitem__(self, key):
+        card = self.values[key]
         del self.values[key]
+        self.board.unlocate(card, self)
+
+    def evict(self, x):
+        """
+        Takes a card out of the deck without putting it anywhere.
+
+        :param x: Card
+        :return: NoneType
+        """
+        self.values.remove(x)
+        self.board.unlocate(x, self)
 
     def draw(self):
         """
@@ -660,25 +1416,48 @@ class Deck(MutableSequence):
 
         :return: Card
         """
-        if len(self) == 0:
-            self.values = self.board.trash.values
-            self.board.trash.values = []
-            shuffle(self.values)
+        board = self._board
+        if not self.values:
+            board.trash.move_all(self)
+            board.rng.shuffle(self.values)
+        card = self.values.pop(0)
+        board.locations[card.id] = None
+        board.publish('move', card, self, None)
+        return card
 
-        return self.pop(0)
 
-
-class Hand(MutableSet):
+class Hand(Zone, MutableSet):
+    __slots__ = ('player_num', 'cards', 'board', 'cards_played', 'decision')
 
     def add(self, x: Card) -> None:
         if isinstance(x, Card):
-            self.cards.add(x)
+            self.put(x)
         else:
             raise TypeError('A hand can only contain cards.')
 
+    def put(self, x: Card) -> None:
+        previous = self.board.locate(x, self)
+        self.cards.add(x)
+        self.board.publish('move', x, previous, self)
+
     def discard(self, x: Card) -> None:
+        if x in self.cards:
+            self.evict(x)
+            self.board.trash.append(x)
+
+    def evict(self, x: Card) -> None:
+        """
+        Takes a card out of the hand without discarding it.
+
+        :param x: Card
+        :return: NoneType
+        """
         self.cards.discard(x)
-        self.board.trash.append(x)
+        self.board.unlocate(x, self)
+
+    @property
+    def location(self):
+        return 'hand' if self.player_num >= 0 else 'aside'
 
     def __contains__(self, x: object) -> bool:
         if isinstance(x, Card):
@@ -707,15 +1486,20 @@ class Hand(MutableSet):
             self.draw(3)
         self.cards_played = None
 
-    def draw(self, amount):
+    def draw(self, amount, reshuffle=True):
         """
-        Draws `amount` `Card`s from `board.deck`.
+        Draws `amount` `Card`s from `board.deck`, or as many as are left once the deck and the discard pile have both run
+        out.
 
         :param amount: int
+        :param reshuffle: bool Whether the discard pile is shuffled back in when the deck runs out.
         :return: NoneType
         """
+        deck = self.board.deck
         for _ in range(amount):
-            self.add(self.board.deck.draw())
+            if len(deck) == 0 and (not reshuffle or len(self.board.trash) == 0):
+                return
+            self.add(deck.draw())
 
     @classmethod
     def temphand(cls, size, board):
@@ -730,24 +1514,37 @@ class Hand(MutableSet):
         h = Hand(-1, board, _draw=False)
         h.draw(size)
         h.cards_played = 0
+        h.decision = None
         return h
 
 
-class CardSpace(MutableSet):
+class CardSpace(Zone, MutableSet):
     """
     The generic form of the RuleSpace, GoalSpace, and Keep.
 
     May only hold `Card`s and acts like a MutableSet but with an attached Board.
     """
+    __slots__ = ('cards', 'kind', '_board')
+
+    location = None
 
     def add(self, x: Card) -> None:
         if isinstance(x, self.kind):
-            self.cards.add(x)
+            self.put(x)
         else:
             raise TypeError('A hand can only contain cards.')
 
+    def put(self, x: Card) -> None:
+        previous = self.board.locate(x, self)
+        self.cards.add(x)
+        self.board.publish('move', x, previous, self)
+
     def discard(self, x: Card) -> None:
+        self.evict(x)
+
+    def evict(self, x: Card) -> None:
         self.cards.discard(x)
+        self.board.unlocate(x, self)
 
     def __contains__(self, x: object) -> bool:
         if isinstance(x, self.kind):
@@ -774,6 +1571,9 @@ class CardSpace(MutableSet):
 
 
 class Keep(CardSpace):
+    __slots__ = ('player_num',)
+
+    location = 'keep'
 
     def __init__(self, player_num, board):
         """
@@ -786,8 +1586,15 @@ class Keep(CardSpace):
         self.player_num = player_num
         self.cards = set()
 
+    def evict(self, x: Card) -> None:
+        if x in self.cards:
+            super(Keep, self).evict(x)
+
 
 class GoalSpace(CardSpace):
+    __slots__ = ('max_size',)
+
+    location = 'goals'
 
     def __init__(self, board):
         """
@@ -813,20 +1620,30 @@ class GoalSpace(CardSpace):
         if 1 == len(self) and self.max_size == 1:
             self.cards[0].trash()
         elif len(self) > self.max_size > 1:
-            self.board.action_type = 'goalremove'
+            self.board.action_type = Decision.GOALREMOVE
         if isinstance(x, Goal):
-            self.cards.append(x)
+            self.put(x)
         else:
             raise TypeError(f'You Cannot Add a {type(x)} to the Goals List')
 
+    def put(self, x):
+        previous = self.board.locate(x, self)
+        self.cards.append(x)
+        self.board.publish('move', x, previous, self)
+
     def remove(self, x):
         self.cards.remove(x)
+        self.board.unlocate(x, self)
 
     def discard(self, x: Card):
-        self.cards.remove(x)
+        self.remove(x)
+
+    def evict(self, x):
+        self.remove(x)
 
 
 class Goal(Card):
+    __slots__ = ()
 
     def do(self):
         """
@@ -835,8 +1652,6 @@ class Goal(Card):
         :return: NoneType
         """
         self.board.goals.add(self)
-        tar_hand = self.board.curr_hand
-        tar_hand.discard(self)
 
     def trash(self):
         """
@@ -847,22 +1662,21 @@ class Goal(Card):
         self.board.goals.remove(self)
         self.board.trash.append(self)
 
-    def __init__(self, board, tag):
+    @classmethod
+    def define(cls, card_id, name, tag):
         """
         A Goal Card. Has conditions which trigger a player winning the game.
 
-        :param board: Board
+        :param card_id: int
+        :param name: str
         :param tag: tuple   tag should be stored as an 'item' call from a dict.items().
+        :return: CardDef
         """
-        name, reqs = tag
-        self.tag = tag
-        super(Goal, self).__init__(board, name)
-        self._reqs = reqs
-        self.numeral = 0
+        return CardDef(card_id, cls, name, tag, inflates=True, reqs=tag[1])
 
     @property
     def reqs(self):
-        return self._reqs
+        return self._def.reqs
 
     @property
     def evaluate(self):
@@ -974,7 +1788,222 @@ class Goal(Card):
         return tardic[req](player_num, self)
 
 
+class GoalTracker:
+    def __init__(self, board, num_players):
+        """
+        Keeps a running count, for every player and every goal in the game, of how many cards that player is missing
+        to satisfy it. It hears about every Keeper that comes to or goes from a `Keep`, and only the goals which name that
+        Keeper (`GOAL_KEEPERS`) are touched, along with the counts of foods and Televisions that the other goals need,
+        so asking how close anyone is to winning never means scanning the table.
+
+        The counts are the fewest cards that would have to move. For `5 Keepers` and `10 Cards in Hand`, having the
+        most is still needed to win. For `The Brain (No TV)`, a Television anywhere on the table counts as one missing
+        card, since someone has to get rid of it.
+
+        :param board: Board
+        :param num_players: int
+        """
+        self.board = board
+        self.missing_keepers = [dict(GOAL_KEEPER_COUNTS) for _ in range(num_players)]
+        self.foods = [0] * num_players
+        self.televisions = 0
+        board.subscribe('move', self.moved)
+
+    def recount(self):
+        """
+        Counts everything again from the keeps as they stand, for a board whose cards were laid out without any moves
+        being published (see `arrays.ArrayState.restore`).
+
+        :return: NoneType
+        """
+        self.missing_keepers = [dict(GOAL_KEEPER_COUNTS) for _ in self.missing_keepers]
+        self.foods = [0] * len(self.foods)
+        self.televisions = 0
+        for keep in self.board.keeps:
+            for card in keep:
+                self.keeper_added(keep.player_num, card.name)
+
+    def moved(self, card, source, destination):
+        """
+        :param card: Card
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
+        :return: NoneType
+        """
+        if type(source) is Keep:
+            self.keeper_removed(source.player_num, card.name)
+        if type(destination) is Keep:
+            self.keeper_added(destination.player_num, card.name)
+
+    def keeper_added(self, player, name):
+        """
+        :param player: int
+        :param name: str
+        :return: NoneType
+        """
+        missing = self.missing_keepers[player]
+        for goal in GOAL_KEEPERS.get(name, ()):
+            missing[goal] -= 1
+        if name in foods:
+            self.foods[player] += 1
+        if name == 'Television':
+            self.televisions += 1
+
+    def keeper_removed(self, player, name):
+        """
+        :param player: int
+        :param name: str
+        :return: NoneType
+        """
+        missing = self.missing_keepers[player]
+        for goal in GOAL_KEEPERS.get(name, ()):
+            missing[goal] += 1
+        if name in foods:
+            self.foods[player] -= 1
+        if name == 'Television':
+            self.televisions -= 1
+
+    def missing(self, player, goal):
+        """
+        How many cards `player` is missing to satisfy `goal`. Zero means the requirements are met.
+
+        :param player: int
+        :param goal: str or Goal
+        :return: int
+        """
+        name = getattr(goal, 'name', goal)
+        count = self.missing_keepers[player][name]
+        numeral = self.board.numeral
+        for req in EXOTIC_REQS.get(name, ()):
+            if req == '_anyfood':
+                count += max(0, numeral + 1 - self.foods[player])
+            elif req == '_notv':
+                count += self.televisions > 0
+            elif req == '_fivekeepers':
+                count += max(0, 5 + numeral - len(self.board.keeps[player]))
+            elif req == '_tencards':
+                count += max(0, 10 + numeral - len(self.board.hands[player]))
+        return count
+
+    def distances(self, player, goals=None):
+        """
+        The missing counts for one player.
+
+        :param player: int
+        :param goals: iterable or NoneType Goal names or cards. Defaults to the goals in play.
+        :return: dict[str, int]
+        """
+        goals = self.board.goals if goals is None else goals
+        return {getattr(goal, 'name', goal): self.missing(player, goal) for goal in goals}
+
+    def within(self, n, goals=None):
+        """
+        The players who are at most `n` cards away from satisfying one of the goals.
+
+        :param n: int
+        :param goals: iterable or NoneType Goal names or cards. Defaults to the goals in play.
+        :return: list[int]
+        """
+        goals = list(self.board.goals if goals is None else goals)
+        return [player for player in range(len(self.missing_keepers))
+                if any(self.missing(player, goal) <= n for goal in goals)]
+
+    def one_away(self, goals=None):
+        """
+        The players who are a single card away from satisfying one of the goals (or already satisfy it).
+
+        :param goals: iterable or NoneType Goal names or cards. Defaults to the goals in play.
+        :return: list[int]
+        """
+        return self.within(1, goals)
+
+
+class LimitTracker:
+    def __init__(self, board):
+        """
+        Keeps, for every `Limit` in play, the set of players whose hand or keep is over it. Every time a card goes into
+        or out of a player's hand or keep, only that one player is rechecked, so a `Limit` never has to look at the
+        whole table to find out who must discard. When nothing has changed size there is nothing to do, and while there
+        are no limits in play the tracker doesn't listen to moves at all.
+
+        :param board: Board
+        """
+        self.board = board
+        self.limits = {Hand: {}, Keep: {}}
+        board.subscribe('numeral', self.refresh)
+
+    def add(self, limit):
+        """
+        Starts tracking a `Limit`.
+
+        :param limit: Limit
+        :return: NoneType
+        """
+        if not any(self.limits.values()):
+            self.board.subscribe('move', self.moved)
+        spaces = self.board.hands if limit.tar_space is Hand else self.board.keeps
+        self.limits[limit.tar_space][limit] = {space.player_num for space in spaces if len(space) > limit.number}
+
+    def remove(self, limit):
+        """
+        :param limit: Limit
+        :return: NoneType
+        """
+        if self.limits[limit.tar_space].pop(limit, None) is not None and not any(self.limits.values()):
+            self.board.unsubscribe('move', self.moved)
+
+    def refresh(self, numeral=None):
+        """
+        Rechecks every player against every `Limit`, for when the limits themselves have changed size.
+
+        :param numeral: int
+        :return: NoneType
+        """
+        for limit in [limit for limits in self.limits.values() for limit in limits]:
+            self.add(limit)
+
+    def moved(self, card, source, destination):
+        """
+        :param card: Card
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
+        :return: NoneType
+        """
+        limits = self.limits
+        if type(source) in limits and source.player_num >= 0:
+            self.resized(source)
+        if type(destination) in limits and destination.player_num >= 0:
+            self.resized(destination)
+
+    def resized(self, space):
+        """
+        Rechecks one player's `Hand` or `Keep` after its size changed.
+
+        :param space: Hand or Keep
+        :return: NoneType
+        """
+        size = len(space)
+        for limit, over in self.limits[type(space)].items():
+            if size > limit.number:
+                over.add(space.player_num)
+            else:
+                over.discard(space.player_num)
+
+    def over(self, limit):
+        """
+        The players over `limit`.
+
+        :param limit: Limit
+        :return: set[int]
+        """
+        return self.limits[limit.tar_space].get(limit, set())
+
+
 class RuleSpace(CardSpace):
+    __slots__ = ()
+
+    location = 'rules'
+
     def __init__(self, board):
         """
         A place which stores the rules.
@@ -983,6 +2012,33 @@ class RuleSpace(CardSpace):
         """
         super(RuleSpace, self).__init__(Rule, board)
 
+    def put(self, x):
+        super(RuleSpace, self).put(x)
+        x.stale = True
+        for event, handler in x.subscriptions.items():
+            self.board.subscribe(event, getattr(x, handler))
+
+    def evict(self, x):
+        if x in self.cards:
+            super(RuleSpace, self).evict(x)
+            for event, handler in x.subscriptions.items():
+                self.board.unsubscribe(event, getattr(x, handler))
+
+    # Rules have to subscribe and unsubscribe as they come and go, so they're moved one at a time.
+
+    def take_all(self):
+        cards = list(self.cards)
+        for card in cards:
+            self.evict(card)
+        return cards
+
+    def receive(self, cards, source=None):
+        for card in cards:
+            self.put(card)
+
+    def move_all(self, destination):
+        destination.receive(self.take_all())
+
     @property
     def ruleset(self):
         """
@@ -994,6 +2050,12 @@ class RuleSpace(CardSpace):
 
 
 class Rule(Card):
+    __slots__ = ('stale',)
+
+    # The board events which can change what `.rule()` does, and the method that hears about each. A rule is subscribed
+    # while it's in play.
+    subscriptions = {}
+
     def do(self):
         """
         Does the `.enact()` step, then puts itself in the board.rules.
@@ -1013,6 +2075,14 @@ class Rule(Card):
         self.board.trash.append(self)
         self.repeal()
 
+    def touch(self, *args):
+        """
+        Marks the rule as needing its `.rule()` step to run again.
+
+        :return: NoneType
+        """
+        self.stale = True
+
     @abstractmethod
     def rule(self):
         pass
@@ -1027,21 +2097,30 @@ class Rule(Card):
 
 
 class Draw(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ('last',)
+
+    subscriptions = {'numeral': 'touch'}
+
+    def __init__(self, board, definition):
         """
         Specific subtype of rules which change how many cards you draw.
 
         :param board: Board
-        :param name: str
-        :param tag: int
+        :param definition: CardDef
         """
-        draw_rule = tag
-        self.tag = name
-        super(Draw, self).__init__(board, name)
-        self.numeral = 0
-        self._draw_rule = draw_rule
+        super(Draw, self).__init__(board, definition)
         self.last = None
 
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
+        :param name: str
+        :param tag: int The number of cards drawn.
+        :return: CardDef
+        """
+        return CardDef(card_id, cls, name, name, inflates=True, number=tag)
+
     @property
     def draw_rule(self):
         """
@@ -1049,7 +2128,7 @@ class Draw(Rule):
 
         :return: int
         """
-        return self._draw_rule - 1 + self.numeral
+        return self._def.number - 1 + self.numeral
 
     def enact(self):
         """
@@ -1076,30 +2155,44 @@ class Draw(Rule):
 
     def rule(self):
         """
-        Updates it's own entry in the board's list of draw effects.
+        Updates it's own entry in the board's list of draw effects, if Inflation has changed it.
 
         :return: NoneType
         """
+        if not self.stale:
+            return
+        self.stale = False
         self.board.draw_bonuses.remove(self.last)
         self.board.draw_bonuses.append(self.draw_rule)
         self.last = self.draw_rule
 
 
 class Play(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ('last_num', 'player', 'waiting')
+
+    subscriptions = {'move': 'hand_moved', 'turn': 'touch', 'numeral': 'touch'}
+
+    def __init__(self, board, definition):
         """
         Rule of the subtype Play. Changes the amount of cards that you're allowed to play each turn.
 
         :param board: Board
-        :param name: str
-        :param tag: int
+        :param definition: CardDef
         """
-        play_rule = tag
-        self.tag = name
-        super(Play, self).__init__(board, name)
+        super(Play, self).__init__(board, definition)
         self.last_num = None
-        self.numeral = 0
-        self._play_rule = play_rule
+        self.player = None
+        self.waiting = None
+
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
+        :param name: str
+        :param tag: int The number of cards played, or 0 for Play All.
+        :return: CardDef
+        """
+        return CardDef(card_id, cls, name, name, inflates=True, number=tag)
 
     @property
     def play_rule(self):
@@ -1108,7 +2201,7 @@ class Play(Rule):
 
         :return: int
         """
-        play_rule = self._play_rule
+        play_rule = self._def.number
         if play_rule > 0:
             actual = play_rule - 1 + self.numeral
         elif play_rule == 0:
@@ -1123,10 +2216,12 @@ class Play(Rule):
 
         :return: NoneType
         """
+        # The Play All rules only know what they're worth once they see the hand, at the `.rule()` step.
+        self.last_num = None
         if self.play_rule > 0:
             self.board.play_bonuses.append(self.play_rule)
+            self.last_num = self.play_rule
         temp = []
-        self.last_num = self.play_rule
         for rule in self.board.rules:
             if isinstance(rule, Play):
                 temp.append(rule)
@@ -1139,22 +2234,47 @@ class Play(Rule):
 
         :return: NoneType
         """
-        self.board.play_bonuses.remove(self.last_num)
+        if self.last_num is not None:
+            self.board.play_bonuses.remove(self.last_num)
+            self.last_num = None
+
+    def hand_moved(self, card, source, destination):
+        """
+        The Play All rules depend on the size of the hand of the player whose turn it is.
+
+        :param card: Card
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
+        :return: NoneType
+        """
+        if isinstance(source, Hand) or isinstance(destination, Hand):
+            self.stale = True
 
     def rule(self):
         """
-        Update step. Updates data in the list of play effects.
+        Update step. Updates data in the list of play effects, if a hand, the turn or Inflation has changed since the
+        last time, or the game has come back to the player whose turn it is. The Play All rules count that player's
+        hand, and Play All But 1 only tops it up while the game is waiting on them, not while someone else discards down
+        to a limit.
 
         :return: NoneType
         """
+        player = self.board.player_state
+        waiting = self.board.active_player == player
+        if not self.stale and self.player == player and self.waiting == waiting:
+            return
+        self.stale = False
+        self.player = player
+        self.waiting = waiting
         if self.play_rule <= 0:
-            tarhand = self.board.curr_hand
-            if self.last_num:
+            tarhand = self.board.hands[player]
+            if self.play_rule < 0 and len(tarhand) == 1 and waiting:
+                tarhand.draw(1)
+                self.stale = False
+            if self.last_num is not None:
                 self.board.play_bonuses.remove(self.last_num)
             self.board.play_bonuses.append(len(tarhand) + self.play_rule)
             self.last_num = len(tarhand) + self.play_rule
-            if self.play_rule < 0 and len(self.board.curr_hand) == 1:
-                self.board.curr_hand.draw(1)
         else:
             self.board.play_bonuses.remove(self.last_num)
             self.board.play_bonuses.append(self.play_rule)
@@ -1162,24 +2282,25 @@ class Play(Rule):
 
 
 class Limit(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ()
+
+    @classmethod
+    def define(cls, card_id, name, tag):
         """
         A subtype of rules which limits the amount of cards in a either a player's hand or their keep.
 
-        :param board: Board
+        :param card_id: int
         :param name: str
         :param tag: tuple[int, str] Describes the size of the limit and the thing it limits.
+        :return: CardDef
         """
-        super(Limit, self).__init__(board, name)
         number, tar_space = tag
-        self.tag = tag
-        self._number = number
-        self.numeral = 0
-        if tar_space == 'Hand':
-            self.tar_space = Hand
-        if tar_space == 'Keep':
-            self.tar_space = Keep
-        self.tar_list = None
+        target = Hand if tar_space == 'Hand' else Keep if tar_space == 'Keep' else None
+        return CardDef(card_id, cls, name, tag, inflates=True, number=number, target=target)
+
+    @property
+    def tar_space(self):
+        return self._def.target
 
     @property
     def number(self):
@@ -1188,72 +2309,69 @@ class Limit(Rule):
 
         :return: int
         """
-        return self._number + self.numeral
+        return self._def.number + self.numeral
 
     def enact(self):
         """
-        No special setup.
+        Setup step. Starts tracking who is over the limit.
         :return: NoneType
         """
-        pass
+        self.board.limit_tracker.add(self)
 
     def repeal(self):
         """
-        No special teardown.
+        Teardown step. Stops tracking who is over the limit.
         :return: NoneType
         """
-        pass
+        self.board.limit_tracker.remove(self)
 
     def rule(self):
         """
-        Checks each step to see if anyone is violating the limit rule. If so, then they are asked to discard down to
-        the size of the limit rule. Institutes a special action to do so.
+        Checks each step to see if anyone other than the player whose turn it is is over the limit. If so, then the
+        first of them is asked to discard down to the size of the limit rule, with a special action to do so. That
+        waits until any other special action is finished, and the special action ends once nobody is over the limit.
 
         :return: NoneType
         """
-        self.tar_list = self.board.keeps if self.tar_space is Keep else self.board.hands
-
-        def checkr(space):
-            """
-            Quickly checks to see if a space is violating the rule.
-
-            :param space: Hand or Keep
-            :return: bool
-            """
-            if len(space) > self.number and space.player_num != self.board.player_state:
-                return True
-            elif len(space) <= self.number:
-                return False
-
-        limit_fails = [sp.player_num for sp in filter(checkr, self.tar_list)]
-
-        if limit_fails:
-            player = limit_fails[0]
-            if self.tar_space == Keep:
-                self.board.action_type = 'keeperlimit'
-            else:
-                self.board.action_type = 'handlimit'
-            self.board.limit_state = player
-        else:
+        action_type = Decision.KEEPERLIMIT if self.tar_space is Keep else Decision.HANDLIMIT
+        over = self.board.limit_tracker.over(self)
+        player_state = self.board.player_state
+        players = [player for player in over if player != player_state]
+        if players:
+            if self.board.action_type in (Decision.NORMAL, action_type):
+                self.board.action_type = action_type
+                self.board.limit_state = min(players)
+        elif self.board.action_type == action_type:
             self.board.limit_state = None
-            self.board.action_type = 'normal'
+            self.board.action_type = Decision.NORMAL
 
 
 class Effect(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ('last', 'player')
+
+    subscriptions = {'move': 'keep_moved', 'turn': 'touch', 'numeral': 'touch'}
+
+    def __init__(self, board, definition):
         """
         A subtype of rules which cause permanent changes to the game.
 
         :param board: Board
+        :param definition: CardDef
+        """
+        super(Effect, self).__init__(board, definition)
+        self.last = None
+        self.player = None
+
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
         :param name: str
         :param tag: str
+        :return: CardDef
         """
-        super(Effect, self).__init__(board, name)
-        self.tag = tag
-        self._marker = 1
-        if self.tag in {'e_partybonus', 'e_poorbonus', 'e_richbonus'}:
-            self.numeral = 0
-        self.last = None
+        return CardDef(card_id, cls, name, tag, inflates=tag in {'e_partybonus', 'e_poorbonus', 'e_richbonus'},
+                       number=1)
 
     @property
     def marker(self):
@@ -1262,93 +2380,113 @@ class Effect(Rule):
 
         :return: int
         """
-        return self._marker + self.numeral
+        return self._def.number + self.numeral
 
     def enact(self):
         """
-        Setup step. For inflation, updates every `.numeral` in the game. For double agenda, tells `board.goals` to
+        Setup step. For inflation, turns on the board's `numeral`. For double agenda, tells `board.goals` to
         allow 2 goals at a time.
         :return: NoneType
         """
         if self.tag == 'e_inflation':
-            for card in self.board.card_set:
-                if card.numeral is not None:
-                    card.numeral = 1
             self.board.numeral = 1
+            self.board.publish('numeral', 1)
         if self.tag == 'e_doubleagenda':
             self.board.goals.max_size = 2
 
     def repeal(self):
         """
         Teardown step. For the bonuses, this means removing data from the bonus lists. For inflation, this means
-        switching every `.numeral` back to 0. For Double Agenda, this means setting the goal's max size back to 0.
+        switching the board's `numeral` back to 0. For Double Agenda, this means setting the goal's max size back to 0.
 
         :return: NoneType
         """
-        if self.tag in {'e_partybonus', 'e_poorbonus'}:
-            self.board.draw_bonuses.remove(self.last)
-            self.last = None
-        if self.tag in {'e_partybonus', 'e_richbonus'}:
-            self.board.play_bonuses.remove(self.last)
-            self.last = None
+        self.withdraw()
         if self.tag == 'e_inflation':
-            for card in self.board.card_set:
-                if card.numeral is not None:
-                    card.numeral = 0
             self.board.numeral = 0
+            self.board.publish('numeral', 0)
         if self.tag == 'e_doubleagenda':
             self.board.goals.max_size = 1
 
-    def rule(self):
+    def keep_moved(self, card, source, destination):
         """
-        Does the thing that it says on the card. For the bonuses, this means checking to see if the parameter is
-        satisfied, and if so, enacting it. For the other ones, it doesn't do a whole lot.
+        The bonuses depend on what's in the keeps.
+
+        :param card: Card
+        :param source: Deck, Hand, CardSpace or NoneType
+        :param destination: Deck, Hand, CardSpace or NoneType
         :return: NoneType
         """
-        if self.tag == 'e_partybonus' and any([card.name == 'Party' for card in chain.from_iterable(self.board.keeps)]):
-            self.board.draw_bonuses.append(self.marker)
-            self.board.play_bonuses.append(self.marker)
-            if self.last:
-                self.board.draw_bonuses.remove(self.last)
-            if self.last:
-                self.board.play_bonuses.remove(self.last)
-            self.last = self.marker
+        if isinstance(source, Keep) or isinstance(destination, Keep):
+            self.stale = True
 
-        elif self.tag == 'e_poorbonus' and all([len(self.board.curr_keep) < len(keep)
-                                                for keep in self.board.keeps
-                                                if keep.player_num != self.board.active_player]):
-            self.board.draw_bonuses.append(self.marker)
-            if self.last:
-                self.board.draw_bonuses.remove(self.last)
-            self.last = self.marker
+    def withdraw(self):
+        """
+        Takes back the bonus this card is giving, if it's giving one.
 
-        elif self.tag == 'e_richbonus' and all([len(self.board.curr_keep) > len(keep)
-                                                for keep in self.board.keeps
-                                                if keep.player_num != self.board.active_player]):
-            self.board.play_bonuses.append(self.marker)
-            if self.last:
-                self.board.play_bonuses.remove(self.last)
-            self.last = self.marker
+        :return: NoneType
+        """
+        if self.last is None:
+            return
+        if self.tag in {'e_partybonus', 'e_poorbonus'}:
+            self.board.draw_bonuses.remove(self.last)
+        if self.tag in {'e_partybonus', 'e_richbonus'}:
+            self.board.play_bonuses.remove(self.last)
+        self.last = None
+
+    def rule(self):
+        """
+        Does the thing that it says on the card. For the bonuses, this means checking to see if the parameter is
+        satisfied, and giving the bonus for exactly as long as it is. That only needs doing when a Keeper has moved, or
+        the active player or Inflation has changed, since the last check. For the other ones, it doesn't do a whole lot.
+        :return: NoneType
+        """
+        if self.tag not in {'e_partybonus', 'e_poorbonus', 'e_richbonus'}:
+            return
+        player = self.board.active_player
+        if not self.stale and self.player == player:
+            return
+        self.stale = False
+        self.player = player
+        curr_keep = self.board.keeps[player]
+        others = [keep for keep in self.board.keeps if keep.player_num != player]
+        if self.tag == 'e_partybonus':
+            satisfied = self.board.where(self.board.registry['Party'])[0] == 'keep'
+        elif self.tag == 'e_poorbonus':
+            satisfied = all(len(curr_keep) < len(keep) for keep in others)
         else:
-            self.last = None
-        if self.tag in {'e_inflation', 'e_doubleagenda'}:
-            pass
+            satisfied = all(len(curr_keep) > len(keep) for keep in others)
+        self.withdraw()
+        if satisfied:
+            self.last = self.marker
+            if self.tag in {'e_partybonus', 'e_poorbonus'}:
+                self.board.draw_bonuses.append(self.last)
+            if self.tag in {'e_partybonus', 'e_richbonus'}:
+                self.board.play_bonuses.append(self.last)
 
 
 class Start(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ('last',)
+
+    def __init__(self, board, definition):
         """
         The subclass of rules which do something at the start of each turn.
 
         :param board: Board
+        :param definition: CardDef
+        """
+        super(Start, self).__init__(board, definition)
+        self.last = None
+
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
         :param name: str
         :param tag: str
+        :return: CardDef
         """
-        super(Start, self).__init__(board, name)
-        self.tag = tag
-        if tag in {'s_nohandbonus'}:
-            self.numeral = 0
-        self.last = None
+        return CardDef(card_id, cls, name, tag, inflates=tag in {'s_nohandbonus'})
 
     @property
     def size(self):
@@ -1380,26 +2518,37 @@ class Start(Rule):
         if self.tag == 's_nohandbonus':
             self.board.curr_hand.draw(self.size)
         if self.tag == 's_firstplayrandom' and self.board.play_state > 1:
-            pick = choice(list(self.board.curr_hand))
-            pick.play()
+            # Nobody chose the card, so it's one that can be played: an idle card is only picked if they all are.
+            hand = list(self.board.curr_hand)
+            playable = [card for card in hand if not (isinstance(card, Action) and card.idle)]
+            if hand:
+                self.board.rng.choice(playable or hand).play()
 
 
 class FreeAction(Rule):
-    def __init__(self, board, name, tag):
+    __slots__ = ('used', 'last_used')
+
+    def __init__(self, board, definition):
         """
         The Subset of Rules which allow players to take more actions.
 
         :param board: Board
-        :param name: str
-        :param tag: str
+        :param definition: CardDef
         """
-        super(FreeAction, self).__init__(board, name)
-        self.tag = tag
-        if self.tag in {'fa_recycling', 'fa_getonwithit'}:
-            self.numeral = 0
+        super(FreeAction, self).__init__(board, definition)
         self.used = False
         self.last_used = None
 
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
+        :param name: str
+        :param tag: str
+        :return: CardDef
+        """
+        return CardDef(card_id, cls, name, tag, inflates=tag in {'fa_recycling', 'fa_getonwithit'})
+
     @property
     def size(self):
         """
@@ -1436,48 +2585,64 @@ class FreeAction(Rule):
             for _ in range(self.board.play_state - self.board.cards_played):
                 self.board.inc_cards_played()
         if self.tag == 'fa_mysteryplay':
+            if len(self.board.deck) == 0 and len(self.board.trash) == 0:
+                self.board.illegal('There are no cards left to draw.')
+                return
             mcard = self.board.deck.draw()
             mcard.play()
+            if self.board.rejection is not None:
+                return
             self.board.mysteryplay = mcard
         if self.tag == 'fa_goalmill':
-            self.board.action_type = 'goalmill'
+            self.board.action_type = Decision.GOALMILL
             if len(self.board.options) == 0:
-                raise Board.IllegalMove('You have no goals.')
+                self.board.action_type = Decision.NORMAL
+                self.board.illegal('You have no goals.')
+                return
         if self.tag == 'fa_getonwithit':
             if len(hand) > 0:
-                for card in hand:
-                    hand.discard(card)
+                hand.move_all(self.board.trash)
                 hand.draw(3)
             else:
-                raise Board.IllegalMove(self, 'You cannot use Get On With It! with an empty hand.')
+                self.board.illegal('You cannot use Get On With It! with an empty hand.')
+                return
         if self.tag == 'fa_recycling':
             if len(keep) > 0:
-                self.board.action_type = 'recycling'
+                self.board.action_type = Decision.RECYCLING
             else:
-                raise Board.IllegalMove(self, 'You cannot use Recycling with an empty keep.')
+                self.board.illegal('You cannot use Recycling with an empty keep.')
+                return
 
 
 class Action(Card):
-    def __init__(self, board, name, tag):
+    __slots__ = ('used',)
+
+    def __init__(self, board, definition):
         """
         The subclass of cards which do some effect when they're played, but then go straight to the discard.
 
         :param board: Board
+        :param definition: CardDef
+        """
+        super(Action, self).__init__(board, definition)
+        self.used = None
+
+    @classmethod
+    def define(cls, card_id, name, tag):
+        """
+        :param card_id: int
         :param name: str
         :param tag: str
+        :return: CardDef
         """
-        super(Action, self).__init__(board, name)
-        self.tag = tag
-        self._size = None
-        if tag in {'a_draw3play2', 'a_jackpot', 'a_draw2use2', 'a_tax', 'a_everybody1'}:
-            self.numeral = 0
+        size = None
         if tag in {'a_draw3play2', 'a_jackpot'}:
-            self._size = 3
+            size = 3
         elif tag in {'a_draw2use2'}:
-            self._size = 2
+            size = 2
         elif tag in {'a_tax', 'a_everybody1'}:
-            self._size = 1
-        self.used = None
+            size = 1
+        return CardDef(card_id, cls, name, tag, inflates=size is not None, number=size)
 
     @property
     def size(self):
@@ -1486,11 +2651,41 @@ class Action(Card):
 
         :return: int
         """
-        if self._size:
-            return self._size + self.numeral
+        if self._def.number:
+            return self._def.number + self.numeral
         else:
             raise TypeError(f'Card {self.name} does not have a size.')
 
+    @property
+    def idle(self):
+        """
+        Whether playing the card now would do nothing: Steal a Keeper with no Keepers to steal, or Let's Do That Again!
+        with no Actions or New Rules in the discard pile.
+
+        :return: bool
+        """
+        board = self.board
+        if self.tag == 'a_steal':
+            return not any(len(keep) for keep in board.keeps if keep.player_num != board.active_player)
+        if self.tag == 'a_dothatagain':
+            return not any(isinstance(card, (Action, Rule)) and card.tag != 'a_dothatagain' for card in board.trash)
+        return False
+
+    def refuse_idle(self, reason):
+        """
+        Refuses the play of an idle card from a hand, unless every card in that hand is idle. Refusing it then would
+        leave the player nothing legal to play, so the card is played for nothing instead. So is an idle card which
+        isn't played from a hand at all, such as the one Mystery Play turns over: it's already off the deck, and
+        refusing it would lose it.
+
+        :param reason: str
+        :return: NoneType
+        """
+        zone = self.board.zone_of(self)
+        if not isinstance(zone, Hand) or all(isinstance(card, Action) and card.idle for card in zone):
+            return
+        self.board.illegal(reason, play=True)
+
     def trash(self):
         """
         Set up to make sure that an Action card is never in a permanent position on the board. Literally just throws
@@ -1505,8 +2700,7 @@ class Action(Card):
         Implements Draw 3, Play 2 of Them
         :return: NoneType
         """
-        self.board.temphands.append(Hand.temphand(self.size, self.board))
-        self.board.action_type = 'play2'
+        self.board.push_temphand(self.size, Decision.PLAY2)
 
     def a_draw2use2(self):
         """
@@ -1514,8 +2708,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.temphands.append(Hand.temphand(self.size, self.board))
-        self.board.action_type = 'play2'
+        self.board.push_temphand(self.size, Decision.PLAY2)
 
     def a_jackpot(self):
         """
@@ -1533,10 +2726,9 @@ class Action(Card):
         :return: NoneType
         """
         hand = self.board.curr_hand
-        for o_hand in (h for i, h in enumerate(self.board.hands) if i != self.board.player_state):
-            pick = choice(list(o_hand))
+        for o_hand in (h for i, h in enumerate(self.board.hands) if i != self.board.player_state and len(h) > 0):
+            pick = self.board.rng.choice(list(o_hand))
             hand.add(pick)
-            o_hand.cards.discard(pick)
 
     def a_everybody1(self):
         """
@@ -1544,8 +2736,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.temphands.append(Hand.temphand(self.size * self.board.num_players, self.board))
-        self.board.action_type = 'everybody1'
+        self.board.push_temphand(self.size * self.board.num_players, Decision.EVERYBODY1)
 
     def a_anotherturn(self):
         """
@@ -1564,11 +2755,7 @@ class Action(Card):
         """
         hand = self.board.curr_hand
         n_cards = len(hand) - 1
-        temp = []
-        for card in hand:
-            temp.append(card)
-        for card in temp:
-            card.trash_from_hand()
+        hand.move_all(self.board.trash)
         hand.draw(n_cards)
 
     def a_sharethewealth(self):
@@ -1579,25 +2766,23 @@ class Action(Card):
         """
         held_keepers = []
         for keep in self.board.keeps:
-            for keeper in keep:
-                held_keepers.append(keeper)
-        for keeper in held_keepers:
-            keeper.discard_from_keep()
-        shuffle(held_keepers)
-        playerlist = cycle(range(self.board.num_players))
-        for _ in range(self.board.player_state):
-            next(playerlist)
-        for keeper in held_keepers:
-            tar_player = next(playerlist)
-            self.board.keeps[tar_player].add(keeper)
+            held_keepers += keep.take_all()
+        self.board.rng.shuffle(held_keepers)
+        n = self.board.num_players
+        start = self.board.player_state
+        for player, keep in enumerate(self.board.keeps):
+            keep.receive(held_keepers[(player - start) % n::n])
 
     def a_zap(self):
         """
-        Implements Zap A Keeper.
+        Implements Zap A Keeper. With nothing on the table to zap, the card does nothing.
 
         :return: NoneType
         """
-        self.board.action_type = 'zap'
+        previous = self.board.action_type
+        self.board.action_type = Decision.ZAP
+        if len(self.board.options) == 0:
+            self.board.action_type = previous
 
     def a_rotatehands(self):
         """
@@ -1605,7 +2790,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'rotate'
+        self.board.action_type = Decision.ROTATE
 
     def a_dothatagain(self):
         """
@@ -1613,10 +2798,11 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'doitagain'
+        previous = self.board.action_type
+        self.board.action_type = Decision.DOITAGAIN
         if len(self.board.options) == 0:
-            self.board.action_type = 'normal'
-            raise Board.IllegalPlay(self.board, 'There are no Actions or New Rules to play.')
+            self.board.action_type = previous
+            self.refuse_idle('There are no Actions or New Rules to play.')
 
     def a_steal(self):
         """
@@ -1624,10 +2810,11 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'steal'
+        previous = self.board.action_type
+        self.board.action_type = Decision.STEAL
         if len(self.board.options) == 0:
-            self.board.action_type = 'normal'
-            raise Board.IllegalPlay(self.board, 'There are no Keepers to steal.')
+            self.board.action_type = previous
+            self.refuse_idle('There are no Keepers to steal.')
 
     def a_simplify(self):
         """
@@ -1635,7 +2822,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'simplify'
+        self.board.action_type = Decision.SIMPLIFY
 
     def a_trash(self):
         """
@@ -1643,7 +2830,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'trash'
+        self.board.action_type = Decision.TRASH
 
     def a_exchange(self):
         """
@@ -1651,7 +2838,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'exchange1'
+        self.board.action_type = Decision.EXCHANGE1
 
     def a_trade(self):
         """
@@ -1659,7 +2846,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'trade'
+        self.board.action_type = Decision.TRADE
 
     def a_rulesreset(self):
         """
@@ -1679,7 +2866,7 @@ class Action(Card):
 
         :return: NoneType
         """
-        self.board.action_type = 'usetake'
+        self.board.action_type = Decision.USETAKE
 
     def a_nolimits(self):
         """
@@ -1699,15 +2886,8 @@ class Action(Card):
 
         :return: NoneType
         """
-        new_trash = Deck.discard_creator(self.board)
-        new_trash.append(self)
-        beep = []
-        for card in self.board.trash:
-            self.board.deck.append(card)
-            beep.append(card)
-        for card in beep:
-            self.board.trash.remove(card)
-        shuffle(self.board.deck)
+        self.board.trash.move_all(self.board.deck)
+        self.board.rng.shuffle(self.board.deck)
 
     def do(self):
         """
@@ -1715,5 +2895,33 @@ class Action(Card):
 
         :return: NoneType
         """
-        type(self).__dict__[self.tag](self)
-        self.board.trash.append(self)
+        self.effects[self.tag](self)
+        if self.board.rejection is None:
+            self.board.trash.append(self)
+
+
+# The effect of every Action card, by tag.
+Action.effects = {name: func for name, func in vars(Action).items() if name.startswith('a_')}
+
+
+def _define_cards():
+    """
+    Builds the definition of every card in `assets.py`, in the order the deck is dealt from before it's shuffled: the
+    Keepers by name, then the Goals, the Rules and the Actions in the order they're listed.
+
+    :return: tuple[CardDef]
+    """
+    rule_cats = {'Draw': Draw, 'Play': Play, 'Limit': Limit, 'Free Action': FreeAction, 'Effect': Effect,
+                 'Start': Start}
+    entries = [(Keeper, name, name) for name in sorted(keepers)]
+    entries += [(Goal, name, (name, reqs)) for name, reqs in goals.items()]
+    entries += [(rule_cats[cat], name, tag) for cat in rules for name, tag in rules[cat].items()]
+    entries += [(Action, name, tag) for name, tag in actions.items()]
+    return tuple(kind.define(card_id, name, tag) for card_id, (kind, name, tag) in enumerate(entries))
+
+
+# Every card's definition, by id, shared by every board in the process, and the indexes behind `board.registry` and
+# `board.tags`.
+CARD_DEFS = _define_cards()
+CARD_IDS = {definition.name: definition.id for definition in CARD_DEFS}
+CARD_TAG_IDS = {definition.tag: definition.id for definition in CARD_DEFS}
@@ -0,0 +1,241 @@
+"""
+Tools for running games without a human at the keyboard.
+
+`play_game` drives a `Board` with agents (callables which look at the board and return an option, just like a player
+typing into `engine.py`) until somebody wins. Random agents can wander into rule combinations which keep a game going
+practically forever, so every game is run under a set of `Limits`. A game which runs out of turns, actions or wall-clock
+time, or which keeps coming back to the same position, is stopped and recorded as a 'noresult' `Outcome` instead of
+holding up the rest of the batch. A game in which the engine itself fails is recorded as a 'crash', and one in which
+an agent takes longer over a single move than the limits allow is a 'forfeit' for that agent's seat.
+"""
+
+import random
+import time
+from multiprocessing import Pool
+
+from objects import Board, MULTI_SELECT
+
+
+class Limits:
+    def __init__(self, max_turns=500, max_actions=5000, max_seconds=10.0, detect_cycles=False, max_repeats=3,
+                 max_move_seconds=None):
+        """
+        The budget a single game is allowed. Any of the limits can be set to None to switch it off.
+
+        The two time limits are budgets checked after the fact, not deadlines: nothing interrupts an agent or an
+        action that runs long, so a game only stops once the call that went over has returned. A game can overrun
+        `max_seconds` by one agent's choice and one action, and an agent that never returns holds the game up for good.
+
+        :param max_turns: int or NoneType The most turns (`board.turn_num`) a game may last.
+        :param max_actions: int or NoneType The most calls to `board.action()` a game may make, legal or not.
+        :param max_seconds: float or NoneType The most wall-clock time a game may take, checked after every action.
+        :param detect_cycles: bool Whether to watch for the game coming back to the same position.
+        :param max_repeats: int How many times a position may be seen before the game counts as cycling.
+        :param max_move_seconds: float or NoneType The most time an agent may take to choose a single option, checked
+                                 once the agent returns. A slow choice forfeits the game but is never cut short.
+        """
+        self.max_turns = max_turns
+        self.max_actions = max_actions
+        self.max_seconds = max_seconds
+        self.detect_cycles = detect_cycles
+        self.max_repeats = max_repeats
+        self.max_move_seconds = max_move_seconds
+
+
+class Watchdog:
+    def __init__(self, board, limits):
+        """
+        Keeps track of how much of its `Limits` a game has used up.
+
+        :param board: Board
+        :param limits: Limits
+        """
+        self.board = board
+        self.limits = limits
+        self.actions = 0
+        self.started = time.perf_counter()
+        self.seen = {}
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self.started
+
+    def check(self, moved=True):
+        """
+        Called after every action. Gives the reason the game has to stop, if it does. Time is only measured here, so
+        `max_seconds` catches a game that has already gone over it (see `Limits`).
+
+        :param moved: bool Whether the action changed the game. Positions are only counted after moves that did, so an
+                      agent retrying after an illegal move isn't mistaken for a cycle.
+        :return: str or NoneType
+        """
+        self.actions += 1
+        limits = self.limits
+        if limits.max_turns is not None and self.board.turn_num >= limits.max_turns:
+            return 'max_turns'
+        if limits.max_actions is not None and self.actions >= limits.max_actions:
+            return 'max_actions'
+        if limits.max_seconds is not None and self.seconds >= limits.max_seconds:
+            return 'max_seconds'
+        if limits.detect_cycles and moved:
+            key = hash(position(self.board))
+            count = self.seen.get(key, 0) + 1
+            self.seen[key] = count
+            if count >= limits.max_repeats:
+                return 'cycle'
+        return None
+
+
+def position(board):
+    """
+    A hashable summary of everything about the game that the players can act on: the cards in each hand and keep, the
+    rules and goals, the sizes of the draw and discard piles, and whose decision it is. The order of the draw pile is
+    left out, so a position repeats whenever the table comes back to the same arrangement.
+
+    :param board: Board
+    :return: tuple
+    """
+    return (str(board.action_type), board.player_state, board.active_player, board.cards_played, board.cards_drawn,
+            tuple(frozenset(card.name for card in hand) for hand in board.hands),
+            tuple(frozenset(card.name for card in keep) for keep in board.keeps),
+            frozenset(card.name for card in board.rules), tuple(card.name for card in board.goals),
+            len(board.deck), len(board.trash))
+
+
+class Outcome:
+    def __init__(self, result, num_players, seed=None, winner=None, reason=None, turns=0, actions=0, seconds=0.0,
+                 goal=None, forfeit=None):
+        """
+        The record of one finished game.
+
+        :param result: str 'win', 'noresult', 'crash' or 'forfeit'.
+        :param num_players: int
+        :param seed: int or NoneType The seed the game was played from.
+        :param winner: int or NoneType The player who won, if someone did.
+        :param reason: str or NoneType Why a game without a result was stopped, or the error a crashed game raised.
+        :param turns: int
+        :param actions: int
+        :param seconds: float
+        :param goal: str or NoneType The name of the goal which ended the game, if one did.
+        :param forfeit: int or NoneType The seat which forfeited the game, if one did.
+        """
+        self.result = result
+        self.num_players = num_players
+        self.seed = seed
+        self.winner = winner
+        self.reason = reason
+        self.turns = turns
+        self.actions = actions
+        self.seconds = seconds
+        self.goal = goal
+        self.forfeit = forfeit
+
+    @property
+    def info(self):
+        """
+        The outcome as a plain dictionary, ready for JSON.
+
+        :return: dict
+        """
+        return dict(vars(self))
+
+    def __repr__(self):
+        if self.result == 'win':
+            detail = f'player {self.winner}'
+        elif self.result == 'forfeit':
+            detail = f'player {self.forfeit}'
+        else:
+            detail = self.reason
+        return f'Outcome({self.result}: {detail}, {self.turns} turns, {self.actions} actions)'
+
+
+def random_agent(board):
+    """
+    An agent which picks uniformly at random. Decisions which take a list of options get a random, possibly empty,
+    subset.
+
+    :param board: Board
+    :return: int or list[int]
+    """
+    options = board.options
+    n_options = len(options) if options is not None else 0
+    if board.action_type in MULTI_SELECT and board.action_type != 'everybody1':
+        return [i for i in range(n_options) if random.random() < 0.5]
+    if n_options == 0:
+        return 0
+    return random.randrange(n_options)
+
+
+def play_game(num_players, agents=random_agent, limits=None, seed=None, observer=None):
+    """
+    Plays one game to the end, or until it runs out of budget.
+
+    :param num_players: int
+    :param agents: function or list[function] One agent for every seat, or a single agent playing all of them. Each
+                   is called with the board whenever that seat has a decision to make.
+    :param limits: Limits or NoneType Defaults to `Limits()`.
+    :param seed: int or NoneType If given, the board gets its own random number generator seeded with it, and the
+                 random module (which agents such as `random_agent` use) is seeded with it too.
+    :param observer: function or NoneType Called with the board and the chosen option just before every action.
+    :return: Outcome
+    """
+    if seed is not None:
+        random.seed(seed)
+    if not isinstance(agents, (list, tuple)):
+        agents = [agents] * num_players
+    watchdog = None
+    board = None
+    try:
+        board = Board(num_players, exceptions=False, seed=seed)
+        limits = limits if limits is not None else Limits()
+        watchdog = Watchdog(board, limits)
+        move_seconds = limits.max_move_seconds
+        while True:
+            seat = board.active_player
+            if move_seconds is None:
+                option = agents[seat](board)
+            else:
+                start = time.perf_counter()
+                option = agents[seat](board)
+                if time.perf_counter() - start > move_seconds:
+                    return Outcome('forfeit', num_players, seed, reason='max_move_seconds', turns=board.turn_num,
+                                   actions=watchdog.actions, seconds=watchdog.seconds, forfeit=seat)
+            if observer is not None:
+                observer(board, option)
+            result = board.action(option)
+            if result.won:
+                return Outcome('win', num_players, seed, winner=result.winner, turns=board.turn_num,
+                               actions=watchdog.actions + 1, seconds=watchdog.seconds, goal=board.winning_goal.name)
+            reason = watchdog.check(result.ok)
+            if reason is not None:
+                return Outcome('noresult', num_players, seed, reason=reason, turns=board.turn_num,
+                               actions=watchdog.actions, seconds=watchdog.seconds)
+    except Exception as e:
+        return Outcome('crash', num_players, seed, reason=f'{type(e).__name__}: {e}',
+                       turns=board.turn_num if board is not None else 0,
+                       actions=watchdog.actions if watchdog is not None else 0,
+                       seconds=watchdog.seconds if watchdog is not None else 0.0)
+
+
+def _play_seed(args):
+    num_players, agents, limits, seed = args
+    return play_game(num_players, agents, limits, seed)
+
+
+def run_batch(seeds, num_players, agents=random_agent, limits=None, processes=1):
+    """
+    Plays one game for every seed. With more than one process the games are spread over a process pool, in which case
+    the agents must be picklable (defined at module level). Outcomes come back in the order of `seeds`.
+
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param agents: function or list[function]
+    :param limits: Limits or NoneType
+    :param processes: int
+    :return: list[Outcome]
+    """
+    jobs = [(num_players, agents, limits, seed) for seed in seeds]
+    if processes == 1:
+        return [_play_seed(job) for job in jobs]
+    with Pool(processes) as pool:
+        return pool.map(_play_seed, jobs, chunksize=max(1, len(jobs) // (processes * 4)))
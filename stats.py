@@ -0,0 +1,306 @@
+"""
+Streaming statistics over simulated games.
+
+A `GameStats` watches games as they are played (pass it to `simulate.play_game` as the observer) and takes each
+`simulate.Outcome` as the game finishes. It only ever keeps running totals, so its size doesn't grow with the number of
+games, and two of them can be merged. That lets every worker process keep its own and hand it back to be combined, which
+is what `collect` does::
+
+    stats = collect(range(1000000), num_players=4, processes=8)
+    print(stats.report())
+"""
+
+from collections import Counter
+from math import sqrt
+from multiprocessing import Pool
+
+from objects import Action, Rule
+from simulate import play_game, random_agent
+
+
+class Moments:
+    def __init__(self):
+        """
+        Running count, mean, variance, minimum and maximum of a stream of numbers, kept with Welford's method so that
+        it stays accurate over millions of values.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        """
+        :param x: float
+        :return: NoneType
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    def merge(self, other):
+        """
+        Folds another `Moments` into this one, as if this one had seen all of its values too.
+
+        :param other: Moments
+        :return: Moments
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return sqrt(self.variance)
+
+    @property
+    def info(self):
+        return {'count': self.count, 'mean': self.mean, 'std': self.std, 'min': self.min, 'max': self.max}
+
+
+class Histogram:
+    def __init__(self, width=1, top=1000):
+        """
+        Counts of a stream of non-negative numbers in fixed-width bins. Everything at or above `top` shares the last
+        bin, so the memory used is bounded no matter what comes in.
+
+        :param width: int
+        :param top: int
+        """
+        self.width = width
+        self.top = top
+        self.bins = Counter()
+
+    def add(self, x):
+        self.bins[min(int(x), self.top) // self.width] += 1
+
+    def merge(self, other):
+        """
+        :param other: Histogram Must have the same `width` and `top`.
+        :return: Histogram
+        """
+        if (other.width, other.top) != (self.width, self.top):
+            raise ValueError('Only histograms with the same bins can be merged.')
+        self.bins.update(other.bins)
+        return self
+
+    def quantile(self, q):
+        """
+        The lower edge of the bin holding the `q`th quantile.
+
+        :param q: float Between 0 and 1.
+        :return: int or NoneType
+        """
+        total = sum(self.bins.values())
+        if total == 0:
+            return None
+        seen = 0
+        for b in sorted(self.bins):
+            seen += self.bins[b]
+            if seen >= q * total:
+                return b * self.width
+        return max(self.bins) * self.width
+
+    @property
+    def info(self):
+        return {b * self.width: n for b, n in sorted(self.bins.items())}
+
+
+class GameStats:
+    def __init__(self):
+        """
+        Running statistics over many games:
+
+        :results: How many games ended in a win, without a result, or in a crash.
+        :seat_games: How many finished games each seat was part of.
+        :seat_wins: How many of them each seat won.
+        :turns: `Moments` and `Histogram` of game length in turns, over games which ended in a win.
+        :actions: `Moments` of game length in actions, over the same games.
+        :goals: How often each goal ended the game.
+        :plays: How often each Action and New Rule card was chosen for play.
+        :play_turns: `Moments` of the turn each Action and New Rule card was chosen on.
+        :draw_state: `Moments` of the draw rule in force at each decision.
+        :play_state: `Moments` of the play rule in force at each decision.
+        """
+        self.games = 0
+        self.results = Counter()
+        self.seat_games = Counter()
+        self.seat_wins = Counter()
+        self.turns = Moments()
+        self.turn_histogram = Histogram()
+        self.actions = Moments()
+        self.goals = Counter()
+        self.plays = Counter()
+        self.play_turns = {}
+        self.draw_state = Moments()
+        self.play_state = Moments()
+        self.pending = None
+
+    def __call__(self, board, option):
+        """
+        Watches a single decision. Has the signature `simulate.play_game` expects of an observer.
+
+        A card chosen for play is only counted once it's known that the play was legal. The board keeps the reason for
+        its last refusal until the next action starts, so that is checked on the following call (or, for the winning
+        move, in `add`).
+
+        :param board: Board
+        :param option: int or list[int]
+        :return: NoneType
+        """
+        if self.pending is not None and board.rejection is None:
+            self.count_play(*self.pending)
+        self.pending = None
+        self.draw_state.add(board.draw_state)
+        self.play_state.add(board.play_state)
+        if board.action_type in ('normal', 'play2', 'doitagain') and isinstance(option, int):
+            options = board.options
+            if -len(options) <= option < len(options):
+                card = options[option]
+                if isinstance(card, (Action, Rule)) and (board.action_type != 'normal' or card in board.curr_hand):
+                    self.pending = card.name, board.turn_num
+
+    def count_play(self, name, turn):
+        """
+        :param name: str
+        :param turn: int
+        :return: NoneType
+        """
+        self.plays[name] += 1
+        if name not in self.play_turns:
+            self.play_turns[name] = Moments()
+        self.play_turns[name].add(turn)
+
+    def add(self, outcome):
+        """
+        Counts a finished game.
+
+        :param outcome: simulate.Outcome
+        :return: NoneType
+        """
+        self.games += 1
+        self.results[outcome.result] += 1
+        pending, self.pending = self.pending, None
+        if outcome.result != 'win':
+            return
+        if pending is not None:
+            self.count_play(*pending)
+        for seat in range(outcome.num_players):
+            self.seat_games[seat] += 1
+        self.seat_wins[outcome.winner] += 1
+        self.turns.add(outcome.turns)
+        self.turn_histogram.add(outcome.turns)
+        self.actions.add(outcome.actions)
+        self.goals[outcome.goal] += 1
+
+    def merge(self, other):
+        """
+        Folds another `GameStats` into this one.
+
+        :param other: GameStats
+        :return: GameStats
+        """
+        self.games += other.games
+        for name in ('results', 'seat_games', 'seat_wins', 'goals', 'plays'):
+            getattr(self, name).update(getattr(other, name))
+        for name in ('turns', 'turn_histogram', 'actions', 'draw_state', 'play_state'):
+            getattr(self, name).merge(getattr(other, name))
+        for card, moments in other.play_turns.items():
+            self.play_turns.setdefault(card, Moments()).merge(moments)
+        return self
+
+    @property
+    def win_rates(self):
+        """
+        The share of decided games won by each seat.
+
+        :return: dict[int, float]
+        """
+        return {seat: self.seat_wins[seat] / n for seat, n in sorted(self.seat_games.items())}
+
+    @property
+    def info(self):
+        """
+        Everything as a plain dictionary, ready for JSON.
+
+        :return: dict
+        """
+        return {'games': self.games, 'results': dict(self.results), 'win_rates': self.win_rates,
+                'turns': self.turns.info, 'turn_histogram': self.turn_histogram.info,
+                'turn_median': self.turn_histogram.quantile(0.5), 'actions': self.actions.info,
+                'goals': dict(self.goals.most_common()), 'plays': dict(self.plays.most_common()),
+                'play_turns': {card: m.mean for card, m in sorted(self.play_turns.items())},
+                'draw_state': self.draw_state.mean, 'play_state': self.play_state.mean}
+
+    def report(self, top=10):
+        """
+        A short plain text summary.
+
+        :param top: int How many goals and cards to list.
+        :return: str
+        """
+        lines = [f'{self.games} games: ' + ', '.join(f'{n} {r}' for r, n in self.results.most_common())]
+        lines.append('Win rate by seat: ' + ', '.join(f'{s}: {r:.3f}' for s, r in self.win_rates.items()))
+        lines.append(f'Turns per decided game: mean {self.turns.mean:.1f}, median {self.turn_histogram.quantile(0.5)}, '
+                     f'max {self.turns.max}')
+        lines.append(f'Mean draw rule {self.draw_state.mean:.2f}, mean play rule {self.play_state.mean:.2f}')
+        lines.append('Winning goals:')
+        lines += [f'    {goal:<32} {n}' for goal, n in self.goals.most_common(top)]
+        lines.append('Most played Actions and New Rules (mean turn played):')
+        lines += [f'    {card:<32} {n:>8} {self.play_turns[card].mean:>8.1f}' for card, n in self.plays.most_common(top)]
+        return '\n'.join(lines)
+
+
+def _collect_chunk(args):
+    seeds, num_players, agents, limits = args
+    stats = GameStats()
+    for seed in seeds:
+        stats.add(play_game(num_players, agents, limits, seed, observer=stats))
+    return stats
+
+
+def collect(seeds, num_players, agents=random_agent, limits=None, processes=1, chunk=1000):
+    """
+    Plays a game for every seed and gathers the statistics. With more than one process, the seeds are split into chunks
+    of `chunk` games, each worker keeps a `GameStats` per chunk, and those are merged as they come back. The agents must
+    then be picklable.
+
+    :param seeds: iterable[int]
+    :param num_players: int
+    :param agents: function or list[function]
+    :param limits: simulate.Limits or NoneType
+    :param processes: int
+    :param chunk: int
+    :return: GameStats
+    """
+    seeds = list(seeds)
+    jobs = [(seeds[i:i + chunk], num_players, agents, limits) for i in range(0, len(seeds), chunk)]
+    total = GameStats()
+    if processes == 1:
+        for job in jobs:
+            total.merge(_collect_chunk(job))
+        return total
+    with Pool(processes) as pool:
+        for stats in pool.imap_unordered(_collect_chunk, jobs):
+            total.merge(stats)
+    return total
@@ -0,0 +1,347 @@
+"""
+A tournament harness for comparing agents.
+
+An agent is any picklable callable which takes a `Board` and returns an option for `board.action()`, like
+`simulate.random_agent`. A `Tournament` seats its agents at tables of 2 to 6 players, either as a seat-rotated round
+robin or as a Swiss system, plays the games on a process pool with a seed derived from each game's index, and feeds
+every result into the ratings as soon as it comes back. Results are processed in schedule order, so a tournament run
+twice with the same seed gives the same games and the same ratings.
+
+There can be fewer agents than seats, so that two versions of a bot can be compared at a 4 to 6 player table: each
+agent then takes several seats at once, and its ratings move with the results of all of them. Seats taken by the same
+agent don't count as games against each other.
+
+From the command line::
+
+    python tournament.py --agent random=simulate:random_agent --agent mybot=bots:act --seats 4 --swiss 20 --out r.jsonl
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import combinations, combinations_with_replacement
+from math import erf, exp, pi, sqrt
+
+from simulate import Limits, play_game
+
+
+class Elo:
+    def __init__(self, k=32.0, initial=1500.0):
+        """
+        Elo ratings extended to multiplayer games by treating one game as every pair of its players meeting once. The
+        change for each pair is scaled down by the number of opponents so that a game is worth the same in total
+        whatever the table size.
+
+        :param k: float
+        :param initial: float
+        """
+        self.k = k
+        self.initial = initial
+        self.ratings = {}
+
+    def rating(self, name):
+        return self.ratings.get(name, self.initial)
+
+    def update(self, ranking):
+        """
+        Updates the ratings from a finished game.
+
+        :param ranking: list[list[str]] Groups of agent names, best first. Agents in the same group drew. An agent in
+                        several seats is named once for each of them.
+        :return: NoneType
+        """
+        players = [(name, rank) for rank, group in enumerate(ranking) for name in group]
+        scale = self.k / max(1, len(players) - 1)
+        deltas = {name: 0.0 for name, _ in players}
+        for (a, rank_a), (b, rank_b) in combinations(players, 2):
+            if a == b:
+                continue
+            expected = 1 / (1 + 10 ** ((self.rating(b) - self.rating(a)) / 400))
+            score = 1.0 if rank_a < rank_b else 0.0 if rank_a > rank_b else 0.5
+            deltas[a] += scale * (score - expected)
+            deltas[b] -= scale * (score - expected)
+        for name, delta in deltas.items():
+            self.ratings[name] = self.rating(name) + delta
+
+    def table(self):
+        """
+        :return: list[tuple[str, float]] Agent names and ratings, best first.
+        """
+        return sorted(self.ratings.items(), key=lambda item: item[1], reverse=True)
+
+
+class TrueSkill:
+    def __init__(self, mu=25.0, sigma=25.0 / 3, beta=25.0 / 6, tau=25.0 / 300):
+        """
+        TrueSkill ratings, updated with the two-player rule for every pair of players in different places. Agents who
+        tied don't move each other. Agents are ranked by their conservative skill estimate, `mu - 3 * sigma`.
+
+        :param mu: float Initial mean skill.
+        :param sigma: float Initial uncertainty.
+        :param beta: float Performance noise in a single game.
+        :param tau: float Added uncertainty per game, so that ratings can keep moving.
+        """
+        self.mu = mu
+        self.sigma = sigma
+        self.beta = beta
+        self.tau = tau
+        self.ratings = {}
+
+    def rating(self, name):
+        return self.ratings.get(name, (self.mu, self.sigma))
+
+    def update(self, ranking):
+        """
+        Updates the ratings from a finished game.
+
+        :param ranking: list[list[str]] Groups of agent names, best first. Agents in the same group drew. An agent in
+                        several seats is named once for each of them.
+        :return: NoneType
+        """
+        before = {name: self.rating(name) for group in ranking for name in group}
+        mu = {name: m for name, (m, _) in before.items()}
+        var = {name: s * s + self.tau * self.tau for name, (_, s) in before.items()}
+        shrink = {name: 1.0 for name in before}
+        for rank, group in enumerate(ranking):
+            for winner in group:
+                for lower in ranking[rank + 1:]:
+                    for loser in lower:
+                        if loser == winner:
+                            continue
+                        c = sqrt(2 * self.beta ** 2 + var[winner] + var[loser])
+                        t = (before[winner][0] - before[loser][0]) / c
+                        v = _pdf(t) / max(_cdf(t), 1e-12)
+                        w = v * (v + t)
+                        mu[winner] += var[winner] / c * v
+                        mu[loser] -= var[loser] / c * v
+                        shrink[winner] *= max(1 - var[winner] / c ** 2 * w, 1e-4)
+                        shrink[loser] *= max(1 - var[loser] / c ** 2 * w, 1e-4)
+        for name in before:
+            self.ratings[name] = mu[name], sqrt(var[name] * shrink[name])
+
+    def table(self):
+        """
+        :return: list[tuple[str, float]] Agent names and conservative ratings, best first.
+        """
+        scores = {name: m - 3 * s for name, (m, s) in self.ratings.items()}
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _pdf(x):
+    return exp(-x * x / 2) / sqrt(2 * pi)
+
+
+def _cdf(x):
+    return (1 + erf(x / sqrt(2))) / 2
+
+
+def ranking(seating, outcome):
+    """
+    Turns an outcome into the groups the ratings expect, or None if the game doesn't say anything about the agents.
+
+    :param seating: list[str] Agent names in seat order.
+    :param outcome: simulate.Outcome
+    :return: list[list[str]] or NoneType
+    """
+    if outcome.result == 'win':
+        return [[seating[outcome.winner]], [name for seat, name in enumerate(seating) if seat != outcome.winner]]
+    if outcome.result == 'forfeit':
+        return [[name for seat, name in enumerate(seating) if seat != outcome.forfeit], [seating[outcome.forfeit]]]
+    return None
+
+
+def _play_table(args):
+    agents, limits, seed = args
+    return play_game(len(agents), list(agents), limits, seed)
+
+
+class Tournament:
+    def __init__(self, agents, seats=4, limits=None, seed=0, processes=1, out=None):
+        """
+        :param agents: dict[str, function] The agents, by name. At least two, but there may be fewer than `seats`.
+        :param seats: int Players per game, from 2 to 6.
+        :param limits: simulate.Limits or NoneType Applied to every game. Set `max_move_seconds` to enforce a time
+                       limit per move; an agent which goes over it forfeits the game.
+        :param seed: int Base seed. Game `i` of the tournament is played from a seed derived from this and `i`.
+        :param processes: int
+        :param out: file or NoneType Every game's record is written here as a line of JSON as it comes in.
+        """
+        if not 2 <= seats <= 6:
+            raise ValueError('Fluxx is played by 2 to 6 players.')
+        if len(agents) < 2:
+            raise ValueError('A tournament needs at least 2 agents.')
+        self.agents = dict(agents)
+        self.seats = seats
+        self.limits = limits if limits is not None else Limits()
+        self.seed = seed
+        self.processes = processes
+        self.out = out
+        self.elo = Elo()
+        self.trueskill = TrueSkill()
+        self.games = 0
+        self.records = []
+
+    def seed_for(self, game):
+        return self.seed * 1000003 + game
+
+    def play(self, tables):
+        """
+        Plays one game per table and streams the results into the ratings, in the order the tables were given.
+
+        :param tables: list[list[str]] Agent names in seat order.
+        :return: list[dict] The records of the games.
+        """
+        jobs = []
+        for seating in tables:
+            jobs.append((tuple(self.agents[name] for name in seating), self.limits, self.seed_for(self.games)))
+            self.games += 1
+        first = self.games - len(jobs)
+        if self.processes == 1:
+            return self.record_all(first, tables, map(_play_table, jobs))
+        with ProcessPoolExecutor(self.processes) as pool:
+            chunksize = max(1, len(jobs) // (self.processes * 8))
+            return self.record_all(first, tables, pool.map(_play_table, jobs, chunksize=chunksize))
+
+    def record_all(self, first, tables, outcomes):
+        """
+        Records outcomes as they arrive.
+
+        :param first: int The index of the first game.
+        :param tables: list[list[str]]
+        :param outcomes: iterable[simulate.Outcome] In the same order as `tables`.
+        :return: list[dict]
+        """
+        return [self.record(first + i, seating, outcome) for i, (seating, outcome) in enumerate(zip(tables, outcomes))]
+
+    def record(self, game, seating, outcome):
+        """
+        Rates a finished game and keeps its record.
+
+        :param game: int
+        :param seating: list[str]
+        :param outcome: simulate.Outcome
+        :return: dict
+        """
+        order = ranking(seating, outcome)
+        if order is not None:
+            self.elo.update(order)
+            self.trueskill.update(order)
+        record = {'game': game, 'seats': list(seating), 'result': outcome.result, 'seed': outcome.seed,
+                  'winner': seating[outcome.winner] if outcome.winner is not None else None,
+                  'forfeit': seating[outcome.forfeit] if outcome.forfeit is not None else None,
+                  'reason': outcome.reason, 'turns': outcome.turns, 'actions': outcome.actions}
+        self.records.append(record)
+        if self.out is not None:
+            self.out.write(json.dumps(record) + '\n')
+        return record
+
+    def round_robin(self, cycles=1):
+        """
+        Every group of `seats` agents plays one game in each rotation of its seating, `cycles` times over. With fewer
+        agents than seats, the groups are every way of filling the seats with at least two different agents.
+
+        :param cycles: int
+        :return: list[dict]
+        """
+        names = sorted(self.agents)
+        if len(names) >= self.seats:
+            groups = list(combinations(names, self.seats))
+        else:
+            groups = [group for group in combinations_with_replacement(names, self.seats) if len(set(group)) > 1]
+        tables = []
+        for _ in range(cycles):
+            for group in groups:
+                for shift in range(self.seats):
+                    tables.append(list(group[shift:] + group[:shift]))
+        return self.play(tables)
+
+    def swiss(self, rounds):
+        """
+        Each round, agents are sorted by Elo and seated at tables with their neighbours, rotating the seats from one
+        round to the next. When the agents don't divide evenly into tables, the lowest rated sit the round out. With
+        fewer agents than seats, they all sit at one table, taking seats in turn down the order until it's full.
+
+        :param rounds: int
+        :return: list[dict]
+        """
+        records = []
+        for r in range(rounds):
+            order = sorted(self.agents, key=lambda name: (-self.elo.rating(name), name))
+            if len(order) < self.seats:
+                order = [order[seat % len(order)] for seat in range(self.seats)]
+            tables = []
+            for i in range(0, len(order) - self.seats + 1, self.seats):
+                group = order[i:i + self.seats]
+                shift = r % self.seats
+                tables.append(group[shift:] + group[:shift])
+            records += self.play(tables)
+        return records
+
+    def standings(self):
+        """
+        A plain text table of every agent's games, wins and ratings, best Elo first. A game counts once for an agent,
+        however many seats it had.
+
+        :return: str
+        """
+        played = {name: 0 for name in self.agents}
+        wins = {name: 0 for name in self.agents}
+        for record in self.records:
+            for name in set(record['seats']):
+                played[name] += 1
+            if record['winner'] is not None:
+                wins[record['winner']] += 1
+        trueskill = dict(self.trueskill.table())
+        lines = [f'{"agent":<24} {"games":>7} {"wins":>7} {"elo":>8} {"trueskill":>10}']
+        for name in sorted(self.agents, key=lambda n: -self.elo.rating(n)):
+            lines.append(f'{name:<24} {played[name]:>7} {wins[name]:>7} {self.elo.rating(name):>8.1f} '
+                         f'{trueskill.get(name, 0.0):>10.2f}')
+        return '\n'.join(lines)
+
+
+def load_agent(spec):
+    """
+    Imports an agent from a `module:function` string.
+
+    :param spec: str
+    :return: function
+    """
+    module, _, attr = spec.partition(':')
+    return getattr(import_module(module), attr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run a Fluxx tournament between agents.')
+    parser.add_argument('--agent', action='append', required=True, metavar='NAME=MODULE:FUNCTION')
+    parser.add_argument('--seats', type=int, default=4)
+    parser.add_argument('--cycles', type=int, default=1, help='Round robin cycles (the default format).')
+    parser.add_argument('--swiss', type=int, metavar='ROUNDS', help='Play this many Swiss rounds instead.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--move-time', type=float, help='Seconds an agent may take per move.')
+    parser.add_argument('--out', help='Write every game to this file as JSON lines.')
+    args = parser.parse_args(argv)
+
+    agents = {}
+    for entry in args.agent:
+        name, _, spec = entry.partition('=')
+        agents[name] = load_agent(spec)
+    out = open(args.out, 'w') if args.out else None
+    try:
+        tournament = Tournament(agents, seats=args.seats, limits=Limits(max_move_seconds=args.move_time),
+                                seed=args.seed, processes=args.processes, out=out)
+        if args.swiss:
+            tournament.swiss(args.swiss)
+        else:
+            tournament.round_robin(args.cycles)
+    finally:
+        if out is not None:
+            out.close()
+    print(tournament.standings())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+The goal check for many boards at once, with NumPy.
+
+`Board.check_goal` asks each goal in play whether any player satisfies it, one board at a time. `winners` does the same
+for a whole batch of games with array operations, from a compact description of each: every player's keep as a bitmask
+over `KEEPER_NAMES`, every player's hand size, the goals in play (as indexes into `GOAL_NAMES`, in the order they're in
+`board.goals`) and the Inflation numeral. `stack` builds those arrays from a list of boards.
+
+NumPy is only needed for this module; nothing else in the engine imports it.
+"""
+
+from assets import foods, goals, keepers
+from objects import EXOTIC_REQS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+KEEPER_NAMES = tuple(sorted(keepers))
+KEEPER_BITS = {name: 1 << i for i, name in enumerate(KEEPER_NAMES)}
+GOAL_NAMES = tuple(goals)
+GOAL_INDEX = {name: i for i, name in enumerate(GOAL_NAMES)}
+# The Keepers each goal names outright, as a mask.
+GOAL_MASKS = tuple(sum(KEEPER_BITS[req] for req in reqs if not req.startswith('_')) for reqs in goals.values())
+FOOD_BITS = tuple(KEEPER_BITS[food] for food in sorted(foods))
+TELEVISION = KEEPER_BITS['Television']
+NO_GOAL = -1
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('The vectorized goal check needs NumPy.')
+
+
+def keep_mask(keep):
+    """
+    :param keep: Keep
+    :return: int The keep as a bitmask over `KEEPER_NAMES`.
+    """
+    mask = 0
+    for card in keep:
+        mask |= KEEPER_BITS[card.name]
+    return mask
+
+
+def stack(boards):
+    """
+    Describes a batch of boards as the arrays `winners` takes. Boards with fewer players than the largest are padded
+    with empty keeps and hands, which can never satisfy a goal.
+
+    :param boards: list[Board]
+    :return: tuple[numpy.ndarray] `keeps` and `hand_sizes` of shape (boards, players), `active` of shape (boards,
+             goal slots), and `numeral` of shape (boards,).
+    """
+    _require_numpy()
+    players = max((board.num_players for board in boards), default=1)
+    slots = max((len(board.goals) for board in boards), default=1) or 1
+    keeps = numpy.zeros((len(boards), players), dtype=numpy.int64)
+    hand_sizes = numpy.zeros((len(boards), players), dtype=numpy.int64)
+    active = numpy.full((len(boards), slots), NO_GOAL, dtype=numpy.int64)
+    numeral = numpy.zeros(len(boards), dtype=numpy.int64)
+    for i, board in enumerate(boards):
+        keeps[i, :board.num_players] = [keep_mask(keep) for keep in board.keeps]
+        hand_sizes[i, :board.num_players] = [len(hand) for hand in board.hands]
+        active[i, :len(board.goals)] = [GOAL_INDEX[goal.name] for goal in board.goals]
+        numeral[i] = board.numeral
+    return keeps, hand_sizes, active, numeral
+
+
+def _count(keeps, bits):
+    """
+    How many of `bits` are set in each of `keeps`.
+
+    :param keeps: numpy.ndarray
+    :param bits: iterable[int] Single-bit masks.
+    :return: numpy.ndarray
+    """
+    total = numpy.zeros(keeps.shape, dtype=numpy.int64)
+    for bit in bits:
+        total += (keeps & bit) != 0
+    return total
+
+
+def _most(stats, threshold):
+    """
+    The rule for `5 Keepers` and `10 Cards in Hand`: if only one player has reached the threshold they satisfy it, and
+    if several have, the one with strictly the most does.
+
+    :param stats: numpy.ndarray (boards, players)
+    :param threshold: numpy.ndarray (boards, 1)
+    :return: numpy.ndarray (boards, players) of bool
+    """
+    qualifies = stats >= threshold
+    count = qualifies.sum(axis=1, keepdims=True)
+    top = stats == stats.max(axis=1, keepdims=True)
+    alone = top.sum(axis=1, keepdims=True) == 1
+    return numpy.where(count > 1, top & alone, (count == 1) & qualifies)
+
+
+def satisfied(goal, keeps, hand_sizes, numeral):
+    """
+    Which players satisfy one goal, on every board.
+
+    :param goal: int An index into `GOAL_NAMES`.
+    :param keeps: numpy.ndarray (boards, players)
+    :param hand_sizes: numpy.ndarray (boards, players)
+    :param numeral: numpy.ndarray (boards, 1)
+    :return: numpy.ndarray (boards, players) of bool
+    """
+    need = GOAL_MASKS[goal]
+    result = (keeps & need) == need
+    for req in EXOTIC_REQS.get(GOAL_NAMES[goal], ()):
+        if req == '_anyfood':
+            result &= _count(keeps, FOOD_BITS) > numeral
+        elif req == '_notv':
+            result &= ~((keeps & TELEVISION) != 0).any(axis=1, keepdims=True)
+        elif req == '_fivekeepers':
+            result &= _most(_count(keeps, KEEPER_BITS.values()), 5 + numeral)
+        elif req == '_tencards':
+            result &= _most(hand_sizes, 10 + numeral)
+    return result
+
+
+def winners(keeps, hand_sizes, active, numeral=0):
+    """
+    Checks the goals in play on every board, just as `Board.check_goal` would: the goals are tried in order, and the
+    first one that any player satisfies is won by the lowest numbered of them.
+
+    :param keeps: array-like (boards, players) Keep bitmasks over `KEEPER_NAMES`.
+    :param hand_sizes: array-like (boards, players)
+    :param active: array-like (boards, goal slots) Indexes into `GOAL_NAMES`, padded with `NO_GOAL`.
+    :param numeral: int or array-like (boards,) The Inflation numeral.
+    :return: numpy.ndarray (boards,) The winning player on each board, or -1 where nobody has won.
+    """
+    _require_numpy()
+    keeps = numpy.asarray(keeps, dtype=numpy.int64)
+    hand_sizes = numpy.asarray(hand_sizes, dtype=numpy.int64)
+    active = numpy.asarray(active, dtype=numpy.int64).reshape(len(keeps), -1)
+    numeral = numpy.broadcast_to(numpy.asarray(numeral, dtype=numpy.int64), (len(keeps),))[:, None]
+    result = numpy.full(len(keeps), -1, dtype=numpy.int64)
+    for slot in range(active.shape[1]):
+        column = active[:, slot]
+        for goal in numpy.unique(column[column != NO_GOAL]):
+            rows = numpy.flatnonzero((column == goal) & (result < 0))
+            if not len(rows):
+                continue
+            found = satisfied(goal, keeps[rows], hand_sizes[rows], numeral[rows])
+            result[rows] = numpy.where(found.any(axis=1), found.argmax(axis=1), -1)
+    return result
+
+
+def check_goals(boards):
+    """
+    `winners` for a list of boards. Unlike `Board.check_goal`, nothing is recorded on the boards.
+
+    :param boards: list[Board]
+    :return: numpy.ndarray (boards,)
+    """
+    return winners(*stack(boards))